@@ -0,0 +1,153 @@
+"""Negotiated gzip/brotli response compression.
+
+``CompressionMiddleware`` compresses single-message responses of a
+compressible content type once they reach ``minimum_size`` bytes, using the
+best encoding the client accepts (``br`` when the optional ``brotli`` package
+is installed, else ``gzip``). Responses that already carry a
+``Content-Encoding`` are passed through untouched, which is how the daily
+route serves bodies compressed once per day by ``DailyPayloadCache``.
+Streaming responses are not compressed.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None  # type: ignore[assignment]
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, most preferred first."""
+
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...] | None = None) -> str | None:
+    """Pick the encoding with the highest ``q`` in ``Accept-Encoding``; ties go to ``available`` order."""
+
+    if available is None:
+        available = supported_encodings()
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best: str | None = None
+    best_weight = 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 keeps the output identical for identical bodies.
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"unsupported encoding: {encoding}")
+
+
+def compress_variants(body: bytes, minimum_size: int) -> dict[str, bytes]:
+    """Every supported encoding of ``body``, or none when it is below ``minimum_size``."""
+
+    if len(body) < minimum_size:
+        return {}
+    return {encoding: compress(body, encoding) for encoding in supported_encodings()}
+
+
+def _header(headers: list[tuple[bytes, bytes]], name: bytes) -> bytes | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _add_vary(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return [*headers, (b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower():
+        return headers
+    return [(key, value + b", Accept-Encoding" if key.lower() == b"vary" else value) for key, value in headers]
+
+
+class CompressionMiddleware:
+    """ASGI middleware applying negotiated gzip/brotli above a size threshold."""
+
+    def __init__(self, app, minimum_size: int = 500) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+        start_message: dict | None = None
+        passthrough = False
+
+        async def send_compressed(message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                content_type = (_header(headers, b"content-type") or b"").decode("latin-1")
+                if _header(headers, b"content-encoding") is not None or not content_type.startswith(
+                    _COMPRESSIBLE_TYPES
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = {**message, "headers": headers}
+                return
+            if passthrough or message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            headers = start_message["headers"]
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                # Streaming: send what we have uncompressed and stop intercepting.
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+            if len(body) >= self.minimum_size:
+                headers = _add_vary(headers)
+                if encoding is not None:
+                    body = compress(body, encoding)
+                    headers = [(key, value) for key, value in headers if key.lower() != b"content-length"]
+                    headers += [
+                        (b"content-encoding", encoding.encode("latin-1")),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ]
+            await send({**start_message, "headers": headers})
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -28,3 +28,13 @@ def get_vapid_private_key() -> str | None:
 def get_vapid_subject() -> str:
     value = os.getenv("DAILY_POETRY_VAPID_SUBJECT", "mailto:ops@example.com").strip()
     return value or "mailto:ops@example.com"
+
+
+def get_daily_cache_seconds() -> float:
+    raw = os.getenv("DAILY_POETRY_DAILY_CACHE_SECONDS", "").strip()
+    return float(raw) if raw else 60.0
+
+
+def get_compression_min_bytes() -> int:
+    raw = os.getenv("DAILY_POETRY_COMPRESSION_MIN_BYTES", "").strip()
+    return int(raw) if raw else 500
@@ -8,6 +8,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import get_database_url
+from app.metrics import instrument_engine
 
 DATABASE_URL = get_database_url()
 
@@ -20,6 +21,8 @@ else:
     connect_args = {}
 
 engine = create_engine(DATABASE_URL, future=True, connect_args=connect_args)
+# Per-request statement counts and DB time for Server-Timing and /metrics.
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 Base = declarative_base()
 
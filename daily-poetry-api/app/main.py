@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
 from app.auth import require_bearer_token
-from app.config import get_cors_origins
+from app.compression import CompressionMiddleware
+from app.config import get_compression_min_bytes, get_cors_origins, get_daily_cache_seconds
 from app.database import engine, get_db
+from app.metrics import PROMETHEUS_CONTENT_TYPE, TimingMiddleware, render_prometheus
 from app.migrate import run_sql_migrations
+from app.responses import DailyPayloadCache, FastJSONResponse
 from app.schemas import (
     AnonymousAuthResponse,
     CreateFavouriteRequest,
@@ -43,6 +47,9 @@ async def lifespan(_app: FastAPI):
     yield
 
 
+compression_min_bytes = get_compression_min_bytes()
+daily_cache = DailyPayloadCache(get_daily_cache_seconds(), compress_min_bytes=compression_min_bytes)
+
 app = FastAPI(title="Daily Poetry API", version="0.1.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +58,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=compression_min_bytes)
+app.add_middleware(TimingMiddleware)
 
 
 @app.get("/health")
@@ -58,6 +67,11 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.post("/v1/auth/anonymous", response_model=AnonymousAuthResponse)
 def post_anonymous_auth(db: Session = Depends(get_db)) -> dict:
     user, token = issue_anonymous_token(db)
@@ -65,18 +79,21 @@ def post_anonymous_auth(db: Session = Depends(get_db)) -> dict:
 
 
 @app.get("/v1/daily", response_model=DailyResponse)
-def get_daily(db: Session = Depends(get_db)) -> dict:
-    return fetch_daily_payload(db)
+def get_daily(request: Request, db: Session = Depends(get_db)) -> Response:
+    today = datetime.now(timezone.utc).date()
+    payload = daily_cache.get(today.isoformat(), lambda: fetch_daily_payload(db, today))
+    return payload.response(request.headers.get("accept-encoding", ""))
 
 
 @app.get("/v1/me/favourites", response_model=FavouritesResponse)
 def get_my_favourites(
     token: str = Depends(require_bearer_token),
     db: Session = Depends(get_db),
-) -> dict:
+) -> Response:
     user = get_or_create_user_by_token(db, token)
     favourites = fetch_user_favourites(db, user)
-    return {"favourites": favourites}
+    # Built from database rows, so skip response-model validation and encoding.
+    return FastJSONResponse({"favourites": favourites})
 
 
 @app.post("/v1/me/favourites", status_code=201)
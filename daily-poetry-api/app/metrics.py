@@ -0,0 +1,194 @@
+"""Request timing, per-request SQL accounting, and Prometheus exposition.
+
+``instrument_engine`` hooks SQLAlchemy cursor events so every statement run
+while a request is being served is counted and timed against that request.
+``TimingMiddleware`` records per-route latency, statement count, and DB time
+histograms, and adds a ``Server-Timing`` header (``db``, ``app``, ``total``)
+so the split is visible in browser dev tools. ``render_prometheus`` returns
+everything in the Prometheus text format for ``GET /metrics``.
+
+Routes are labelled by their path template (``/v1/me/favourites/{poem_id}``),
+never the raw path, so label cardinality stays bounded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+_QUERY_START_KEY = "daily_poetry_query_start"
+
+
+@dataclass(slots=True)
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_current_request: ContextVar[RequestStats | None] = ContextVar("daily_poetry_request_stats", default=None)
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    started = conn.info[_QUERY_START_KEY].pop()
+    stats = _current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+def _handle_error(context) -> None:
+    # after_cursor_execute does not fire for failed statements.
+    starts = context.connection.info.get(_QUERY_START_KEY) if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a label set."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series: dict[tuple[tuple[str, str], ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (last slot is +Inf), then sum.
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(key, list(counts), total) for key, (counts, total) in sorted(self._series.items())]
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels((*key, ("le", _format_number(bound))))
+                lines.append(f"{self.name}_bucket{{{labels}}} {cumulative}")
+            labels = _format_labels(key)
+            lines.append(f"{self.name}_sum{{{labels}}} {_format_number(total)}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self.latency = Histogram(
+            "daily_poetry_http_request_duration_seconds", "Time to serve a request.", _LATENCY_BUCKETS
+        )
+        self.queries = Histogram(
+            "daily_poetry_db_queries_per_request", "SQL statements executed per request.", _QUERY_COUNT_BUCKETS
+        )
+        self.db_time = Histogram(
+            "daily_poetry_db_seconds_per_request", "Time spent in SQL statements per request.", _LATENCY_BUCKETS
+        )
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        self.latency.observe(seconds, method=method, route=route, status=str(status))
+        self.queries.observe(stats.queries, method=method, route=route)
+        self.db_time.observe(stats.db_seconds, method=method, route=route)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for histogram in (self.latency, self.queries, self.db_time):
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+REQUEST_METRICS = RequestMetrics()
+
+
+def render_prometheus() -> str:
+    return REQUEST_METRICS.render()
+
+
+def server_timing(stats: RequestStats, total_seconds: float) -> str:
+    db_ms = stats.db_seconds * 1000
+    total_ms = total_seconds * 1000
+    return (
+        f'db;dur={db_ms:.2f};desc="{stats.queries} queries", '
+        f"app;dur={max(total_ms - db_ms, 0.0):.2f}, total;dur={total_ms:.2f}"
+    )
+
+
+class TimingMiddleware:
+    """ASGI middleware recording per-route metrics and adding ``Server-Timing``."""
+
+    def __init__(self, app, metrics: RequestMetrics | None = None) -> None:
+        self.app = app
+        self.metrics = metrics or REQUEST_METRICS
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                timing = server_timing(stats, time.perf_counter() - started)
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_request.reset(token)
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                time.perf_counter() - started,
+                stats,
+            )
@@ -0,0 +1,105 @@
+"""Fast JSON responses for hot endpoints.
+
+``dumps_json`` uses ``orjson`` when it is installed and otherwise the stdlib
+encoder with the same settings as FastAPI's ``JSONResponse`` (compact, UTF-8,
+no NaN), so either way the bytes on the wire are valid compact JSON.
+
+Routes that return ``FastJSONResponse`` bypass FastAPI's response-model
+validation and ``jsonable_encoder``; only use it for dicts the service layer
+builds from database rows (plain ``str``/``int``/``None`` values), and keep
+the ``response_model`` on the route so the OpenAPI schema is unchanged.
+
+``DailyPayloadCache`` keeps today's ``/v1/daily`` body encoded once, keyed
+by UTC date and refreshed after ``DAILY_POETRY_DAILY_CACHE_SECONDS`` so an
+editorial change or reseed in another process is picked up. It also keeps
+the body's gzip/brotli variants; a refresh that yields the same bytes reuses
+them, so each day's payload is compressed once.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Response
+
+from app.compression import compress_variants, negotiate_encoding
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response that encodes with ``dumps_json`` and sends ``bytes`` content as-is."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps_json(content)
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPayload:
+    date: str
+    body: bytes
+    expires_at: float
+    variants: dict[str, bytes]
+
+    def response(self, accept_encoding: str) -> FastJSONResponse:
+        """Serve a pre-compressed variant the client accepts, or the plain body."""
+
+        if not self.variants:
+            return FastJSONResponse(self.body)
+        headers = {"Vary": "Accept-Encoding"}
+        encoding = negotiate_encoding(accept_encoding, tuple(self.variants))
+        if encoding is None:
+            return FastJSONResponse(self.body, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return FastJSONResponse(self.variants[encoding], headers=headers)
+
+
+class DailyPayloadCache:
+    """Today's daily payload, encoded once per UTC date (and TTL)."""
+
+    def __init__(self, ttl_seconds: float, compress_min_bytes: int | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.compress_min_bytes = compress_min_bytes
+        self._entry: EncodedPayload | None = None
+        self._lock = threading.Lock()
+
+    def get(self, today: str, load: Callable[[], dict]) -> EncodedPayload:
+        entry = self._entry
+        if entry is not None and entry.date == today and entry.expires_at > time.monotonic():
+            return entry
+        with self._lock:
+            # Another request may have refreshed it while this one waited.
+            entry = self._entry
+            if entry is None or entry.date != today or entry.expires_at <= time.monotonic():
+                body = dumps_json(load())
+                if entry is not None and entry.body == body:
+                    variants = entry.variants
+                elif self.compress_min_bytes is not None:
+                    variants = compress_variants(body, self.compress_min_bytes)
+                else:
+                    variants = {}
+                entry = EncodedPayload(today, body, time.monotonic() + self.ttl_seconds, variants)
+                self._entry = entry
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
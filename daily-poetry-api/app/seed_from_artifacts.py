@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import io
 import json
+import mmap
+import struct
+import sys
+from array import array
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import IO, Callable
 from uuid import NAMESPACE_DNS, uuid5
 
 from sqlalchemy import String, cast, select
@@ -18,6 +24,8 @@ from app.migrate import run_sql_migrations
 from app.models import Author, DailySelection, Poem
 
 EDITORIAL_STATUSES = {"pending", "approved", "rejected"}
+COLUMNAR_MAGIC = b"DPCOL\x00\x01\x00"
+JSONL_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
 
 
 def author_id_from_name(name: str) -> str:
@@ -28,11 +36,28 @@ def poem_id_from_hash(content_hash: str) -> str:
     return str(uuid5(NAMESPACE_DNS, f"poem:{content_hash.strip().lower()}"))
 
 
+def _open_jsonl(path: Path) -> IO[str]:
+    """Open plain, gzip or zstd JSONL, detected from the file's magic bytes."""
+
+    with path.open("rb") as probe:
+        magic = probe.read(4)
+    if magic.startswith(b"\x1f\x8b"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == b"\x28\xb5\x2f\xfd":
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(f"Reading {path} requires the optional 'zstandard' package") from None
+        reader = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
 def _read_jsonl(path: Path) -> list[dict]:
     if not path.exists():
         return []
     rows: list[dict] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with _open_jsonl(path) as handle:
         for line in handle:
             line = line.strip()
             if line:
@@ -40,6 +65,156 @@ def _read_jsonl(path: Path) -> list[dict]:
     return rows
 
 
+def _little_endian_array(typecode: str, payload: bytes) -> array:
+    values = array(typecode, payload)
+    if sys.byteorder == "big":  # pragma: no cover - big-endian hosts
+        values.byteswap()
+    return values
+
+
+class ColumnarArtifact:
+    """Memory-mapped reader for ``.dpcol`` artifacts from the ingestion pipeline.
+
+    The layout is documented in ``daily_poetry_ingest.columnar``. Opening a
+    file only parses its footer; values are decoded on access, and
+    ``find`` binary-searches the file's sorted index (``content_hash`` for
+    poems and duplicates, ``name`` for authors).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = path.open("rb")
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._handle.close()
+            raise ValueError(f"Empty columnar artifact: {path}") from None
+        size = len(self._map)
+        if size < 24 or self._map[:8] != COLUMNAR_MAGIC or self._map[size - 8 :] != COLUMNAR_MAGIC:
+            self.close()
+            raise ValueError(f"Not a columnar artifact: {path}")
+        footer_length = int.from_bytes(self._map[size - 16 : size - 8], "little")
+        footer = json.loads(self._map[size - 16 - footer_length : size - 16])
+        self.columns: list[str] = footer["order"]
+        self._rows: int = footer["rows"]
+        self._meta: dict[str, dict] = footer["columns"]
+        self._index: dict | None = footer.get("index")
+
+    def __enter__(self) -> ColumnarArtifact:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def close(self) -> None:
+        self._map.close()
+        self._handle.close()
+
+    def _is_null(self, meta: dict, row: int) -> bool:
+        nulls = meta.get("nulls")
+        return nulls is not None and self._map[nulls[0] + row] == 1
+
+    def value(self, column: str, row: int) -> str | int | None:
+        if not 0 <= row < self._rows:
+            raise IndexError(row)
+        meta = self._meta[column]
+        if self._is_null(meta, row):
+            return None
+        if meta["type"] == "int":
+            return struct.unpack_from("<q", self._map, meta["data"][0] + 8 * row)[0]
+        start, end = struct.unpack_from("<QQ", self._map, meta["offsets"][0] + 8 * row)
+        data_start = meta["data"][0]
+        return self._map[data_start + start : data_start + end].decode("utf-8")
+
+    def row(self, row: int) -> dict:
+        return {column: self.value(column, row) for column in self.columns}
+
+    def column(self, column: str) -> list[str | int | None]:
+        """Decode a whole column with one bulk read per section."""
+
+        meta = self._meta[column]
+        data_start, data_length = meta["data"]
+        if meta["type"] == "int":
+            values: list = _little_endian_array("q", self._map[data_start : data_start + data_length]).tolist()
+        else:
+            offsets_start, offsets_length = meta["offsets"]
+            offsets = _little_endian_array("Q", self._map[offsets_start : offsets_start + offsets_length])
+            blob = self._map[data_start : data_start + data_length]
+            values = [blob[offsets[idx] : offsets[idx + 1]].decode("utf-8") for idx in range(self._rows)]
+        nulls = meta.get("nulls")
+        if nulls is not None:
+            mask = self._map[nulls[0] : nulls[0] + nulls[1]]
+            values = [None if flag else value for value, flag in zip(values, mask)]
+        return values
+
+    def rows(self) -> list[dict]:
+        decoded = [self.column(column) for column in self.columns]
+        return [dict(zip(self.columns, values)) for values in zip(*decoded)]
+
+    def find(self, key: str) -> dict | None:
+        """Return the first row whose indexed column equals ``key``, if any."""
+
+        if self._index is None:
+            raise LookupError(f"{self.path} has no index")
+        column = self._index["column"]
+        index_start = self._index["rows"][0]
+        target = key.encode("utf-8")
+        low, high = 0, self._rows
+        while low < high:
+            middle = (low + high) // 2
+            row = struct.unpack_from("<I", self._map, index_start + 4 * middle)[0]
+            if (self.value(column, row) or "").encode("utf-8") < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._rows:
+            row = struct.unpack_from("<I", self._map, index_start + 4 * low)[0]
+            if self.value(column, row) == key:
+                return self.row(row)
+        return None
+
+
+def _read_blob(blob_store_dir: Path | None, content_hash: str) -> str:
+    """Read a text from the ingestion blob store (``<root>/<hash[:2]>/<hash[2:]>``)."""
+
+    if blob_store_dir is None:
+        raise ValueError("Poem artifacts reference a blob store; pass --blob-store")
+    if len(content_hash) < 3 or not content_hash.isalnum():
+        raise ValueError(f"Invalid text_ref: {content_hash!r}")
+    return (blob_store_dir / content_hash[:2] / content_hash[2:]).read_bytes().decode("utf-8")
+
+
+def _blob_store_from_report(artifacts_dir: Path) -> Path | None:
+    try:
+        report = json.loads((artifacts_dir / "report.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    path = report.get("blob_store", {}).get("path") if isinstance(report, dict) else None
+    return Path(path) if isinstance(path, str) else None
+
+
+def _read_artifact(artifacts_dir: Path, name: str) -> list[dict]:
+    """Read ``<name>.dpcol`` when present and not older than the JSONL artifact.
+
+    The JSONL artifact may be plain, ``.gz`` or ``.zst``.
+    """
+
+    jsonl_path = next(
+        (path for path in (artifacts_dir / f"{name}{suffix}" for suffix in JSONL_SUFFIXES) if path.exists()),
+        artifacts_dir / f"{name}.jsonl",
+    )
+    columnar_path = artifacts_dir / f"{name}.dpcol"
+    if columnar_path.exists() and (
+        not jsonl_path.exists() or columnar_path.stat().st_mtime_ns >= jsonl_path.stat().st_mtime_ns
+    ):
+        with ColumnarArtifact(columnar_path) as artifact:
+            return artifact.rows()
+    return _read_jsonl(jsonl_path)
+
+
 def _upsert_authors(db: Session, author_rows: list[dict], poem_rows: list[dict]) -> dict[str, str]:
     by_name: dict[str, dict] = {}
 
@@ -99,8 +274,19 @@ def _upsert_authors(db: Session, author_rows: list[dict], poem_rows: list[dict])
 
 
 def _upsert_poems(
-    db: Session, poem_rows: list[dict], author_ids: dict[str, str], *, new_poem_status: str = "pending"
+    db: Session,
+    poem_rows: list[dict],
+    author_ids: dict[str, str],
+    *,
+    new_poem_status: str = "pending",
+    blob_store_dir: Path | None = None,
 ) -> list[str]:
+    """Insert or update poems; ``text_ref`` rows read their text from the blob store only for new poems.
+
+    A poem's id derives from its content hash, so an existing row already
+    holds the referenced text.
+    """
+
     if new_poem_status not in EDITORIAL_STATUSES:
         raise ValueError(f"Unsupported editorial status: {new_poem_status}")
 
@@ -109,10 +295,11 @@ def _upsert_poems(
         title = row.get("title")
         author = row.get("author")
         text = row.get("text")
+        text_ref = row.get("text_ref") if text is None else None
         linecount = row.get("linecount")
         content_hash = row.get("content_hash")
 
-        if not all(isinstance(v, str) and v.strip() for v in [title, author, text, content_hash]):
+        if not all(isinstance(v, str) and v.strip() for v in [title, author, text_ref or text, content_hash]):
             continue
         if not isinstance(linecount, int):
             continue
@@ -126,6 +313,8 @@ def _upsert_poems(
 
         model = db.execute(select(Poem).where(Poem.id == poem_id)).scalar_one_or_none()
         if model is None:
+            if text_ref is not None:
+                text = _read_blob(blob_store_dir, text_ref)
             db.add(
                 Poem(
                     id=poem_id,
@@ -138,7 +327,8 @@ def _upsert_poems(
             )
         else:
             model.title = title.strip()
-            model.text = text
+            if text_ref is None:
+                model.text = text
             model.linecount = linecount
             model.author_id = author_id
 
@@ -183,18 +373,20 @@ def seed_from_artifacts(
     require_approved_for_schedule: bool = True,
     db_engine: Engine = engine,
     session_factory: Callable[[], Session] = SessionLocal,
+    blob_store_dir: Path | None = None,
 ) -> dict:
     run_sql_migrations(db_engine)
+    if blob_store_dir is None:
+        blob_store_dir = _blob_store_from_report(artifacts_dir)
 
-    authors_path = artifacts_dir / "authors.jsonl"
-    poems_path = artifacts_dir / "poems.jsonl"
-
-    author_rows = _read_jsonl(authors_path)
-    poem_rows = _read_jsonl(poems_path)
+    author_rows = _read_artifact(artifacts_dir, "authors")
+    poem_rows = _read_artifact(artifacts_dir, "poems")
 
     with session_factory() as db:
         author_ids = _upsert_authors(db, author_rows, poem_rows)
-        poem_ids = _upsert_poems(db, poem_rows, author_ids, new_poem_status=new_poem_status)
+        poem_ids = _upsert_poems(
+            db, poem_rows, author_ids, new_poem_status=new_poem_status, blob_store_dir=blob_store_dir
+        )
         start = schedule_start or datetime.now(timezone.utc).date()
         approved_poem_ids = _fetch_approved_poem_ids(db)
         if schedule_days > 0 and require_approved_for_schedule and not approved_poem_ids:
@@ -227,6 +419,12 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not fail when there are no approved poems for scheduling.",
     )
+    parser.add_argument(
+        "--blob-store",
+        type=Path,
+        default=None,
+        help="Ingestion blob store for poems stored as text_ref (default: the path recorded in report.json).",
+    )
     return parser.parse_args()
 
 
@@ -239,6 +437,7 @@ def main() -> None:
         schedule_start,
         new_poem_status=args.new_poem_status,
         require_approved_for_schedule=not args.allow_empty_approved_schedule,
+        blob_store_dir=args.blob_store,
     )
     print(json.dumps(summary, indent=2))
 
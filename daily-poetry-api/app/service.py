@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import secrets
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
@@ -39,8 +39,9 @@ def issue_anonymous_token(db: Session) -> tuple[models.User, str]:
     return user, token
 
 
-def fetch_daily_payload(db: Session) -> dict:
-    today = datetime.now(timezone.utc).date()
+def fetch_daily_payload(db: Session, today: date | None = None) -> dict:
+    if today is None:
+        today = datetime.now(timezone.utc).date()
 
     stmt: Select[tuple[models.DailySelection, models.Poem, models.Author]] = (
         select(models.DailySelection, models.Poem, models.Author)
@@ -0,0 +1,323 @@
+"""Load test for the daily, favourites and anonymous-auth endpoints.
+
+Seeds a synthetic corpus (``--poems`` poems across ``--authors`` authors,
+``--users`` users with ``--favourites`` favourites each, and a daily schedule
+of ``--schedule-days`` days around today) and drives ``GET /v1/daily``,
+``GET /v1/me/favourites`` and ``POST /v1/auth/anonymous`` with
+``--concurrency`` closed-loop clients for ``--duration`` seconds each.
+
+    PYTHONPATH=. python benchmarks/bench_api.py
+    PYTHONPATH=. python benchmarks/bench_api.py --poems 20000 --users 5000 --favourites 25 --concurrency 32
+    PYTHONPATH=. python benchmarks/bench_api.py --server uvicorn
+    PYTHONPATH=. python benchmarks/bench_api.py --database-url postgresql+psycopg://localhost/daily_poetry_bench
+
+By default the app runs in-process behind ``httpx.ASGITransport`` (no
+sockets, so the numbers isolate the app and database); ``--server uvicorn``
+serves it on a loopback port instead, and ``--base-url`` targets a server
+started separately against the same ``--database-url``. Without
+``--database-url`` a throwaway SQLite file is used. A database that already
+holds poems is not reseeded, so a local Postgres can be seeded once and
+benchmarked repeatedly; never point this at a database you care about.
+
+Each endpoint reports requests, non-2xx responses, throughput and
+p50/p95/p99 latency; one JSON line per invocation is appended to
+``--output`` (default ``benchmarks/results/api.jsonl``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from uuid import uuid4
+
+_DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "api.jsonl"
+_ENDPOINTS = ("daily", "favourites", "auth")
+_WORDS = "the sea and sky were one bright wheel of light turning over fields of barley under autumn rain".split()
+_BATCH = 5000
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+    return {"p50_ms": at(0.50), "p95_ms": at(0.95), "p99_ms": at(0.99), "max_ms": round(ordered[-1] * 1000, 3)}
+
+
+def _insert(session, model, rows: list[dict]) -> None:
+    from sqlalchemy import insert
+
+    for start in range(0, len(rows), _BATCH):
+        session.execute(insert(model), rows[start : start + _BATCH])
+
+
+def _seed(args: argparse.Namespace) -> dict:
+    """Insert the synthetic corpus unless the database already has poems; return its shape."""
+
+    from sqlalchemy import func, select
+
+    from app import models
+    from app.database import SessionLocal, engine
+    from app.migrate import run_sql_migrations
+
+    run_sql_migrations(engine)
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        existing = session.execute(select(func.count()).select_from(models.Poem)).scalar_one()
+        if existing:
+            tokens = list(
+                session.execute(
+                    select(models.User.auth_token)
+                    .join(models.Favourite, models.Favourite.user_id == models.User.id)
+                    .group_by(models.User.auth_token)
+                    .limit(args.users)
+                ).scalars()
+            )
+            return {"seeded": False, "poems": existing, "tokens": tokens, "seed_seconds": 0.0}
+
+        author_ids = [str(uuid4()) for _ in range(args.authors)]
+        _insert(
+            session,
+            models.Author,
+            [
+                {"id": author_id, "name": f"Author {idx:05d}", "bio_short": "A synthetic poet.", "image_url": None}
+                for idx, author_id in enumerate(author_ids)
+            ],
+        )
+        poem_ids = [str(uuid4()) for _ in range(args.poems)]
+        poems = []
+        for idx, poem_id in enumerate(poem_ids):
+            lines = [" ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9))) for _ in range(rng.randint(8, 40))]
+            poems.append(
+                {
+                    "id": poem_id,
+                    "title": f"Poem {idx}",
+                    "text": "\n".join(lines),
+                    "linecount": len(lines),
+                    "editorial_status": "approved",
+                    "author_id": author_ids[idx % len(author_ids)],
+                }
+            )
+        _insert(session, models.Poem, poems)
+
+        today = datetime.now(timezone.utc).date()
+        first_day = today - timedelta(days=args.schedule_days // 2)
+        _insert(
+            session,
+            models.DailySelection,
+            [
+                {"date": first_day + timedelta(days=offset), "poem_id": poem_ids[offset % len(poem_ids)]}
+                for offset in range(args.schedule_days)
+            ],
+        )
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        users = [
+            {"id": str(uuid4()), "auth_token": f"bench-{uuid4().hex}", "created_at": now} for _ in range(args.users)
+        ]
+        _insert(session, models.User, users)
+        favourites = []
+        for user in users:
+            for offset, poem_id in enumerate(rng.sample(poem_ids, min(args.favourites, len(poem_ids)))):
+                favourites.append(
+                    {
+                        "id": str(uuid4()),
+                        "user_id": user["id"],
+                        "poem_id": poem_id,
+                        "created_at": now - timedelta(minutes=offset),
+                    }
+                )
+        _insert(session, models.Favourite, favourites)
+        session.commit()
+
+    return {
+        "seeded": True,
+        "poems": args.poems,
+        "tokens": [user["auth_token"] for user in users],
+        "seed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def _request_for(endpoint: str, tokens: list[str], rng: random.Random) -> tuple[str, str, dict]:
+    if endpoint == "daily":
+        return "GET", "/v1/daily", {}
+    if endpoint == "favourites":
+        return "GET", "/v1/me/favourites", {"Authorization": f"Bearer {rng.choice(tokens)}"}
+    return "POST", "/v1/auth/anonymous", {}
+
+
+async def _drive(client, endpoint: str, tokens: list[str], concurrency: int, duration: float, warmup: int) -> dict:
+    rng = random.Random(0)
+    for _ in range(warmup):
+        method, path, headers = _request_for(endpoint, tokens, rng)
+        await client.request(method, path, headers=headers)
+
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    failures = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal failures
+        while time.perf_counter() < deadline:
+            method, path, headers = _request_for(endpoint, tokens, rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, headers=headers)
+            except Exception:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            key = str(response.status_code)
+            statuses[key] = statuses.get(key, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    non_2xx = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": len(latencies),
+        "non_2xx": non_2xx,
+        "failures": failures,
+        "statuses": statuses,
+        "requests_per_second": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        **_percentiles(latencies),
+    }
+
+
+def _start_uvicorn() -> tuple[str, object, threading.Thread]:
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit("--server uvicorn needs the uvicorn package (a declared dependency of daily-poetry-api)")
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config("app.main:app", log_level="warning", lifespan="on"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", server, thread
+
+
+async def _run_endpoints(args: argparse.Namespace, tokens: list[str]) -> dict:
+    import httpx
+
+    server = thread = None
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+    elif args.server == "uvicorn":
+        base_url, server, thread = _start_uvicorn()
+        client = httpx.AsyncClient(base_url=base_url, timeout=30)
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+
+    results = {}
+    try:
+        async with client:
+            for endpoint in args.endpoints:
+                results[endpoint] = await _drive(
+                    client, endpoint, tokens, args.concurrency, args.duration, args.warmup
+                )
+                summary = results[endpoint]
+                print(
+                    f"{endpoint:<11} {summary['requests']:>7} req {summary['requests_per_second']:>9} req/s "
+                    f"p50 {summary['p50_ms']} p95 {summary['p95_ms']} p99 {summary['p99_ms']} ms "
+                    f"non-2xx {summary['non_2xx']}"
+                )
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join(timeout=10)
+    return results
+
+
+def _endpoint_list(value: str) -> list[str]:
+    endpoints = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = sorted(set(endpoints) - set(_ENDPOINTS))
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown endpoints: {', '.join(unknown)}")
+    return endpoints
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--poems", type=int, default=5000)
+    parser.add_argument("--authors", type=int, default=500)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--favourites", type=int, default=20)
+    parser.add_argument("--schedule-days", type=int, default=3 * 365)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--endpoints", type=_endpoint_list, default=list(_ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per endpoint")
+    parser.add_argument("--warmup", type=int, default=20, help="requests per endpoint before timing")
+    parser.add_argument("--server", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--base-url", help="benchmark an already running server instead")
+    parser.add_argument("--output", type=Path, default=_DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        # app.database builds its engine from the environment at import time.
+        os.environ["DAILY_POETRY_DATABASE_URL"] = database_url
+        corpus = _seed(args)
+        if not corpus["tokens"] and "favourites" in args.endpoints:
+            sys.exit("no users with favourites in the database; run against an empty database to seed some")
+        print(
+            f"{'seeded' if corpus['seeded'] else 'reusing'} {corpus['poems']} poems, "
+            f"{len(corpus['tokens'])} users in {corpus['seed_seconds']}s"
+        )
+        endpoints = asyncio.run(_run_endpoints(args, corpus["tokens"]))
+
+    result = {
+        "benchmark": "api",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "database": database_url.split(":", 1)[0],
+        "server": "external" if args.base_url else args.server,
+        "corpus": {
+            "seeded": corpus["seeded"],
+            "poems": corpus["poems"],
+            "authors": args.authors,
+            "users": len(corpus["tokens"]),
+            "favourites_per_user": args.favourites,
+            "schedule_days": args.schedule_days,
+            "seed_seconds": corpus["seed_seconds"],
+        },
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "endpoints": endpoints,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(result, sort_keys=True) + "\n")
+    print(f"results appended to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""Micro-benchmark for response serialization on ``/v1/daily`` and ``/v1/me/favourites``.
+
+Times building the response body the way FastAPI does for a route with a
+``response_model`` (validate the dict, dump it in JSON mode, encode with the
+stdlib ``JSONResponse``) against the ``FastJSONResponse`` path, with the
+stdlib fallback and with ``orjson`` when it is installed, and against reusing
+the pre-encoded daily body. Fails if any path decodes to a different document.
+
+    PYTHONPATH=. python benchmarks/bench_serialization.py
+    PYTHONPATH=. python benchmarks/bench_serialization.py --favourites 10,50,200 --iterations 2000
+
+For the end-to-end effect (routing, database, middleware) run
+``benchmarks/bench_api.py`` before and after a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app import responses
+from app.responses import FastJSONResponse, dumps_json
+from app.schemas import DailyResponse, FavouritesResponse
+
+_WORDS = "the sea and sky were one bright wheel of light turning over fields of barley under autumn rain".split()
+
+
+def _poem_text(rng: random.Random) -> str:
+    return "\n".join(" ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9))) for _ in range(rng.randint(8, 40)))
+
+
+def _daily_payload(rng: random.Random) -> dict:
+    return {
+        "date": "2026-01-01",
+        "poem": {"id": "p-0", "title": "Ozymandias", "text": _poem_text(rng), "linecount": 14},
+        "author": {"id": "a-0", "name": "Percy Bysshe Shelley", "bio_short": "Romantic poet.", "image_url": None},
+    }
+
+
+def _favourites_payload(rng: random.Random, count: int) -> dict:
+    return {
+        "favourites": [
+            {
+                "poem_id": f"p-{idx}",
+                "title": f"Poem {idx}",
+                "author": f"Author {idx % 50}",
+                "date_featured": "2025-06-01" if idx % 3 else None,
+                "poem_text": _poem_text(rng),
+            }
+            for idx in range(count)
+        ]
+    }
+
+
+def _timed(fn, iterations: int) -> tuple[bytes, float]:
+    body = fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return body, (time.perf_counter() - started) / iterations
+
+
+def _modes(model: type, payload: dict) -> dict:
+    adapter = TypeAdapter(model)
+
+    def fastapi_default() -> bytes:
+        validated = adapter.validate_python(payload)
+        return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    def fast_stdlib() -> bytes:
+        orjson, responses.orjson = responses.orjson, None
+        try:
+            return FastJSONResponse(payload).body
+        finally:
+            responses.orjson = orjson
+
+    modes = {"fastapi_default": fastapi_default, "fast_stdlib": fast_stdlib}
+    if responses.orjson is not None:
+        modes["fast_orjson"] = lambda: FastJSONResponse(payload).body
+    return modes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--favourites", default="10,50,200", help="comma-separated favourites list sizes")
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    cases = [("daily", DailyResponse, _daily_payload(rng))]
+    for count in (int(item) for item in args.favourites.split(",") if item.strip()):
+        cases.append((f"favourites[{count}]", FavouritesResponse, _favourites_payload(rng, count)))
+
+    failed = False
+    print(f"orjson {'available' if responses.orjson is not None else 'not installed (stdlib fallback)'}")
+    for name, model, payload in cases:
+        modes = _modes(model, payload)
+        if name == "daily":
+            encoded = dumps_json(payload)
+            modes["pre_encoded"] = lambda encoded=encoded: FastJSONResponse(encoded).body
+        timings = {}
+        for mode, fn in modes.items():
+            body, seconds = _timed(fn, args.iterations)
+            if json.loads(body) != payload:
+                print(f"MISMATCH: {name} {mode}")
+                failed = True
+            timings[mode] = seconds
+        baseline = timings["fastapi_default"]
+        size = len(dumps_json(payload))
+        print(f"{name} ({size / 1024:.1f} KiB)")
+        for mode, seconds in timings.items():
+            print(f"  {mode:<16} {seconds * 1e6:10.1f} us  {baseline / seconds:6.2f}x")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -59,6 +59,11 @@ def test_api_endpoints() -> None:
         assert daily_payload["date"] == today.isoformat()
         assert daily_payload["poem"]["id"] == poem_id
         assert daily_payload["author"]["name"] == author_name
+        assert "db;dur=" in daily_response.headers["server-timing"]
+
+        cached_daily = client.get("/v1/daily")
+        assert cached_daily.json() == daily_payload
+        assert 'desc="0 queries"' in cached_daily.headers["server-timing"]
 
         unauthorized = client.get("/v1/me/favourites")
         assert unauthorized.status_code == 401
@@ -115,5 +120,11 @@ def test_api_endpoints() -> None:
         )
         assert sub_delete.status_code == 204
 
+        metrics_response = client.get("/metrics")
+        assert metrics_response.status_code == 200
+        assert metrics_response.headers["content-type"].startswith("text/plain")
+        assert 'route="/v1/daily",status="200"' in metrics_response.text
+        assert 'route="/v1/me/favourites/{poem_id}",status="204"' in metrics_response.text
+
     if db_path.exists():
         db_path.unlink()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import gzip
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, negotiate_encoding
+
+
+def test_negotiate_encoding_honours_quality_values() -> None:
+    assert negotiate_encoding("gzip;q=0.5, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip, br;q=0.2", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("br, gzip", ("br", "gzip")) == "br"
+    assert negotiate_encoding("*;q=0.1", ("gzip",)) == "gzip"
+    assert negotiate_encoding("gzip;q=0, *", ("gzip",)) is None
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding("", ("gzip",)) is None
+
+
+def test_compression_middleware_applies_threshold_and_skips_encoded_responses() -> None:
+    text = "I met a traveller from an antique land " * 40
+    pre_encoded = gzip.compress(b'{"already":"gzip"}', mtime=0)
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large() -> dict[str, str]:
+        return {"text": text}
+
+    @app.get("/small")
+    def small() -> dict[str, str]:
+        return {"text": "short"}
+
+    @app.get("/encoded")
+    def encoded() -> Response:
+        return Response(pre_encoded, media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    with TestClient(app) as client:
+        compressed = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+        below_threshold = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        passthrough = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert int(compressed.headers["content-length"]) < len(text) // 4
+    assert compressed.json() == {"text": text}
+
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert identity.json() == {"text": text}
+
+    assert "content-encoding" not in below_threshold.headers
+    assert below_threshold.json() == {"text": "short"}
+
+    assert int(passthrough.headers["content-length"]) == len(pre_encoded)
+    assert passthrough.json() == {"already": "gzip"}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.metrics import RequestMetrics, TimingMiddleware, instrument_engine
+
+
+def test_timing_middleware_counts_queries_per_route(tmp_path) -> None:
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}", future=True)
+    instrument_engine(test_engine)
+    metrics = RequestMetrics()
+
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, metrics=metrics)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int) -> dict[str, int]:
+        with test_engine.connect() as connection:
+            for _ in range(item_id):
+                connection.execute(text("SELECT 1"))
+        return {"queries": item_id}
+
+    with TestClient(app) as client:
+        response = client.get("/items/3")
+        client.get("/items/1")
+        missing = client.get("/nowhere")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    assert "total;dur=" in response.headers["server-timing"]
+    assert missing.status_code == 404
+
+    exposition = metrics.render()
+    assert '# TYPE daily_poetry_http_request_duration_seconds histogram' in exposition
+    assert (
+        'daily_poetry_http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2'
+        in exposition
+    )
+    assert 'daily_poetry_db_queries_per_request_bucket{method="GET",route="/items/{item_id}",le="1"} 1' in exposition
+    assert 'daily_poetry_db_queries_per_request_sum{method="GET",route="/items/{item_id}"} 4.0' in exposition
+    assert 'route="unmatched",status="404"' in exposition
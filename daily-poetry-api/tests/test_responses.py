@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+from fastapi.responses import JSONResponse
+
+from app.responses import DailyPayloadCache, FastJSONResponse, dumps_json
+
+
+def test_fast_json_response_matches_default_encoding() -> None:
+    payload = {"favourites": [{"poem_id": "p1", "title": "Ode — to Autumn", "date_featured": None, "linecount": 3}]}
+
+    fast = FastJSONResponse(payload)
+
+    assert json.loads(fast.body) == payload
+    assert json.loads(fast.body) == json.loads(JSONResponse(payload).body)
+    assert FastJSONResponse(dumps_json(payload)).body == dumps_json(payload)
+    assert fast.headers["content-type"] == "application/json"
+
+
+def test_daily_payload_cache_reloads_on_date_change_and_expiry() -> None:
+    loads: list[str] = []
+
+    def loader(day: str):
+        def load() -> dict:
+            loads.append(day)
+            return {"date": day}
+
+        return load
+
+    cache = DailyPayloadCache(ttl_seconds=3600)
+    first = cache.get("2026-01-01", loader("2026-01-01"))
+    again = cache.get("2026-01-01", loader("2026-01-01"))
+    next_day = cache.get("2026-01-02", loader("2026-01-02"))
+
+    assert again is first
+    assert json.loads(next_day.body) == {"date": "2026-01-02"}
+    assert loads == ["2026-01-01", "2026-01-02"]
+
+    expired = DailyPayloadCache(ttl_seconds=0)
+    expired.get("2026-01-01", loader("2026-01-01"))
+    expired.get("2026-01-01", loader("2026-01-01"))
+    assert loads[-2:] == ["2026-01-01", "2026-01-01"]
+
+
+def test_daily_payload_cache_compresses_each_body_once() -> None:
+    payload = {"date": "2026-01-01", "poem": {"text": "Round the decay of that colossal wreck " * 30}}
+    cache = DailyPayloadCache(ttl_seconds=0, compress_min_bytes=500)
+
+    first = cache.get("2026-01-01", lambda: payload)
+    refreshed = cache.get("2026-01-01", lambda: payload)
+    response = refreshed.response("gzip, deflate")
+    plain = refreshed.response("identity")
+
+    assert refreshed is not first
+    assert refreshed.variants is first.variants
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.body) == first.body
+    assert plain.body == first.body
+    assert "content-encoding" not in plain.headers
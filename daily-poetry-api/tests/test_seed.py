@@ -1,12 +1,100 @@
 from __future__ import annotations
 
+import gzip
 import json
+import struct
 from pathlib import Path
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 
+def _write_dpcol(path: Path, rows: list[dict], columns: list[str], index_column: str) -> None:
+    """Minimal writer for the ingest ``.dpcol`` layout (str and int columns, no nulls)."""
+
+    from app.seed_from_artifacts import COLUMNAR_MAGIC
+
+    body = bytearray(COLUMNAR_MAGIC)
+    described = {}
+    for name in columns:
+        if isinstance(rows[0][name], int):
+            described[name] = {"type": "int", "data": [len(body), 8 * len(rows)], "nulls": None}
+            body += struct.pack(f"<{len(rows)}q", *(row[name] for row in rows))
+            continue
+        values = [row[name].encode("utf-8") for row in rows]
+        offsets = [0]
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+        offsets_start = len(body)
+        body += struct.pack(f"<{len(offsets)}Q", *offsets)
+        described[name] = {"type": "str", "offsets": [offsets_start, 8 * len(offsets)], "data": [len(body), offsets[-1]], "nulls": None}
+        body += b"".join(values)
+        body += b"\x00" * (-len(body) % 8)
+    order = sorted(range(len(rows)), key=lambda idx: rows[idx][index_column].encode("utf-8"))
+    index = {"column": index_column, "rows": [len(body), 4 * len(order)]}
+    body += struct.pack(f"<{len(order)}I", *order)
+    footer = json.dumps({"version": 1, "rows": len(rows), "order": columns, "columns": described, "index": index}).encode("utf-8")
+    path.write_bytes(bytes(body) + footer + struct.pack("<Q", len(footer)) + COLUMNAR_MAGIC)
+
+
+def test_columnar_artifact_supports_lookup_by_content_hash(tmp_path: Path) -> None:
+    from app.seed_from_artifacts import ColumnarArtifact
+
+    rows = [
+        {"title": "Ozymandias", "author": "Percy Bysshe Shelley", "content_hash": "ozy"},
+        {"title": "Hope", "author": "Emily Dickinson", "content_hash": "hope"},
+        {"title": "Río", "author": "Anon", "content_hash": "rio"},
+    ]
+    for linecount, row in enumerate(rows, start=1):
+        row["linecount"] = linecount
+    path = tmp_path / "poems.dpcol"
+    _write_dpcol(path, rows, ["title", "author", "linecount", "content_hash"], "content_hash")
+
+    with ColumnarArtifact(path) as artifact:
+        assert len(artifact) == 3
+        assert artifact.rows() == rows
+        assert artifact.value("title", 2) == "Río"
+        assert artifact.column("linecount") == [1, 2, 3]
+        assert artifact.find("hope") == rows[1]
+        assert artifact.find("missing") is None
+
+
+def test_seed_prefers_fresh_columnar_artifacts(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    artifacts.mkdir(parents=True)
+    poems = [
+        {
+            "title": "Ozymandias",
+            "author": "Percy Bysshe Shelley",
+            "text": "I met a traveller from an antique land",
+            "linecount": 1,
+            "content_hash": "abc123",
+        }
+    ]
+    (artifacts / "authors.jsonl").write_text(json.dumps({"name": "Percy Bysshe Shelley"}) + "\n", encoding="utf-8")
+    (artifacts / "poems.jsonl").write_text("", encoding="utf-8")
+    _write_dpcol(
+        artifacts / "poems.dpcol", poems, ["title", "author", "text", "linecount", "content_hash"], "content_hash"
+    )
+
+    from app.migrate import run_sql_migrations
+    from app.models import Poem
+    from app.seed_from_artifacts import seed_from_artifacts
+
+    db_path = tmp_path / "seed.db"
+    test_engine = create_engine(f"sqlite:///{db_path}", future=True, connect_args={"check_same_thread": False})
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine, future=True)
+    run_sql_migrations(test_engine)
+
+    summary = seed_from_artifacts(artifacts, schedule_days=0, db_engine=test_engine, session_factory=TestSession)
+
+    assert summary["poems"] == 1
+    with TestSession() as session:
+        poem = session.query(Poem).one()
+        assert poem.title == "Ozymandias"
+        assert poem.linecount == 1
+
+
 def test_seed_from_artifacts_includes_author_image(tmp_path: Path) -> None:
     artifacts = tmp_path / "artifacts"
     artifacts.mkdir(parents=True)
@@ -152,3 +240,83 @@ def test_seed_updates_existing_author_bio_from_artifacts(tmp_path: Path) -> None
     with TestSession() as session:
         author = session.query(Author).filter(Author.name == "Emily Dickinson").one()
         assert author.bio_short == "Updated bio"
+
+
+def test_seed_reads_gzip_artifacts(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    artifacts.mkdir(parents=True)
+    authors = [{"name": "Emily Dickinson", "bio_short": "American poet."}]
+    poems = [
+        {
+            "title": "Hope",
+            "author": "Emily Dickinson",
+            "text": "Hope is the thing with feathers",
+            "linecount": 1,
+            "content_hash": "hope123",
+        }
+    ]
+    (artifacts / "authors.jsonl.gz").write_bytes(gzip.compress(("\n".join(json.dumps(row) for row in authors) + "\n").encode()))
+    (artifacts / "poems.jsonl.gz").write_bytes(gzip.compress(("\n".join(json.dumps(row) for row in poems) + "\n").encode()))
+
+    from app.migrate import run_sql_migrations
+    from app.models import Author
+    from app.seed_from_artifacts import seed_from_artifacts
+
+    db_path = tmp_path / "seed.db"
+    test_engine = create_engine(f"sqlite:///{db_path}", future=True, connect_args={"check_same_thread": False})
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine, future=True)
+    run_sql_migrations(test_engine)
+
+    summary = seed_from_artifacts(artifacts, schedule_days=0, db_engine=test_engine, session_factory=TestSession)
+
+    assert summary["authors"] == 1
+    assert summary["poems"] == 1
+    with TestSession() as session:
+        assert session.query(Author).one().bio_short == "American poet."
+
+
+def test_seed_resolves_text_refs_from_blob_store(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    artifacts.mkdir(parents=True)
+    blobs = tmp_path / "blobs"
+    (blobs / "ab").mkdir(parents=True)
+    (blobs / "ab" / "c123").write_text("I met a traveller from an antique land", encoding="utf-8")
+    poem = {
+        "title": "Ozymandias",
+        "author": "Percy Bysshe Shelley",
+        "text_ref": "abc123",
+        "linecount": 1,
+        "content_hash": "abc123",
+    }
+    (artifacts / "authors.jsonl").write_text(json.dumps({"name": "Percy Bysshe Shelley"}) + "\n", encoding="utf-8")
+    (artifacts / "poems.jsonl").write_text(json.dumps(poem) + "\n", encoding="utf-8")
+    (artifacts / "report.json").write_text(json.dumps({"blob_store": {"path": str(blobs)}}), encoding="utf-8")
+
+    from app.migrate import run_sql_migrations
+    from app.models import Poem
+    from app.seed_from_artifacts import seed_from_artifacts
+
+    db_path = tmp_path / "seed.db"
+    test_engine = create_engine(f"sqlite:///{db_path}", future=True, connect_args={"check_same_thread": False})
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine, future=True)
+    run_sql_migrations(test_engine)
+
+    seed_from_artifacts(artifacts, schedule_days=0, db_engine=test_engine, session_factory=TestSession)
+    with TestSession() as session:
+        assert session.query(Poem).one().text == "I met a traveller from an antique land"
+
+    # Existing poems never need their blob again.
+    (blobs / "ab" / "c123").unlink()
+    summary = seed_from_artifacts(artifacts, schedule_days=0, db_engine=test_engine, session_factory=TestSession)
+    assert summary["poems"] == 1
+    with TestSession() as session:
+        assert session.query(Poem).one().text == "I met a traveller from an antique land"
+
+
+def test_read_blob_keeps_carriage_returns(tmp_path: Path) -> None:
+    from app.seed_from_artifacts import _read_blob
+
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / "c123").write_bytes("line one\r\nline two\r".encode("utf-8"))
+
+    assert _read_blob(tmp_path, "abc123") == "line one\r\nline two\r"
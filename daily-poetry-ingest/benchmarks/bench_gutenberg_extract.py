@@ -0,0 +1,187 @@
+"""Micro-benchmark for strict Gutenberg poem extraction.
+
+Compares the cursor-based extractor in ``daily_poetry_ingest.gutenberg``
+against the previous list-slicing implementation (kept below as the
+reference) on every ``*.txt`` in a texts directory, plus stressed variants
+with a long blank preamble and a long appendix. Output must be identical;
+the script exits non-zero if it is not.
+
+    PYTHONPATH=src python benchmarks/bench_gutenberg_extract.py
+    PYTHONPATH=src python benchmarks/bench_gutenberg_extract.py --texts-dir /path/to/gutenberg-texts --limit 500
+
+Title and author are read from the ``Title:`` / ``Author:`` header lines
+that Project Gutenberg files carry.
+
+The default ``fixtures/gutenberg/`` texts are synthetic: short public-domain
+poems wrapped in Gutenberg-style headers and markers, not real (or complete)
+Project Gutenberg ebooks. They check output parity; use ``--texts-dir`` with a
+local mirror for representative timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from daily_poetry_ingest.gutenberg import (
+    _HEADER_STOPWORDS,
+    _body_lines,
+    _extract_poem_lines,
+    _is_strict_poem_shape,
+    _normalize_token_string,
+    _slice_between_markers,
+)
+
+_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "gutenberg"
+_HEADER_RE = re.compile(r"^(Title|Author):\s*(.+?)\s*$", re.MULTILINE)
+_WHITESPACE_LINE_RE = re.compile(r"^\s*$")
+
+
+def _reference_trim_front_matter(lines: list[str], title: str, author: str) -> list[str]:
+    normalized_title = _normalize_token_string(title)
+    normalized_author = _normalize_token_string(author)
+    title_index = None
+
+    for idx, line in enumerate(lines[:140]):
+        normalized_line = _normalize_token_string(line)
+        if not normalized_line:
+            continue
+        if normalized_line == normalized_title or normalized_title in normalized_line:
+            title_index = idx
+            break
+
+    if title_index is not None:
+        lines = lines[title_index + 1 :]
+
+    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
+        lines = lines[1:]
+
+    while lines:
+        current = _normalize_token_string(lines[0])
+        if not current:
+            lines = lines[1:]
+            continue
+        if current.startswith("by ") or current == normalized_author:
+            lines = lines[1:]
+            continue
+        break
+
+    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
+        lines = lines[1:]
+    return lines
+
+
+def _reference_trim_tail_sections(lines: list[str]) -> list[str]:
+    cutoff = len(lines)
+    for idx, line in enumerate(lines):
+        normalized = _normalize_token_string(line)
+        if not normalized:
+            continue
+        if normalized in _HEADER_STOPWORDS or normalized.startswith("chapter "):
+            if idx >= 8:
+                cutoff = idx
+                break
+    lines = lines[:cutoff]
+    while lines and _WHITESPACE_LINE_RE.match(lines[-1]):
+        lines.pop()
+    return lines
+
+
+def _reference_extract(lines: list[str], title: str, author: str, max_non_empty_lines: int) -> list[str] | None:
+    lines = _reference_trim_front_matter(lines, title, author)
+    lines = _reference_trim_tail_sections(lines)
+    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
+        lines = lines[1:]
+    while lines and _WHITESPACE_LINE_RE.match(lines[-1]):
+        lines.pop()
+    if not lines or not _is_strict_poem_shape(lines, max_non_empty_lines=max_non_empty_lines):
+        return None
+    return lines
+
+
+def _current_extract(lines: list[str], title: str, author: str, max_non_empty_lines: int) -> list[str] | None:
+    poem_lines, _, _ = _extract_poem_lines(lines, title, author, max_non_empty_lines=max_non_empty_lines)
+    return poem_lines
+
+
+def _variants(body: str) -> list[tuple[str, str]]:
+    return [
+        ("as-is", body),
+        ("blank-preamble", "\n" * 5000 + body),
+        ("long-appendix", body + "\n\nAPPENDIX\n\n" + "An editorial note on the text.\n" * 20000),
+    ]
+
+
+def _load_cases(texts_dir: Path, limit: int | None) -> list[tuple[str, str, str, str]]:
+    cases: list[tuple[str, str, str, str]] = []
+    for path in sorted(texts_dir.rglob("*.txt"))[:limit]:
+        raw_text = path.read_text(encoding="utf-8", errors="replace")
+        headers = dict(match.groups() for match in _HEADER_RE.finditer(raw_text[:20000]))
+        title = headers.get("Title", path.stem)
+        author = headers.get("Author", "")
+        cases.append((path.name, title, author, _slice_between_markers(raw_text)))
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts-dir", type=Path, default=_FIXTURES_DIR)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-non-empty-lines", type=int, default=120)
+    args = parser.parse_args()
+
+    cases = _load_cases(args.texts_dir, args.limit)
+    if not cases:
+        sys.stderr.write(f"no *.txt files under {args.texts_dir}\n")
+        return 1
+
+    if args.texts_dir.resolve() == _FIXTURES_DIR:
+        print(f"texts: {len(cases)} synthetic fixtures (not real Project Gutenberg ebooks)")
+    else:
+        print(f"texts: {len(cases)} files under {args.texts_dir}")
+
+    mismatches = 0
+    total_reference = 0.0
+    total_current = 0.0
+    print(f"{'text':<24} {'variant':<15} {'lines':>7} {'reference ms':>13} {'current ms':>11} {'speedup':>8}")
+    for name, title, author, body in cases:
+        for variant, text in _variants(body):
+            lines = _body_lines(text)
+            expected = _reference_extract(lines, title, author, args.max_non_empty_lines)
+            actual = _current_extract(lines, title, author, args.max_non_empty_lines)
+            if actual != expected:
+                mismatches += 1
+                sys.stderr.write(f"output mismatch: {name} ({variant})\n")
+
+            reference = min(
+                timeit.repeat(
+                    lambda: _reference_extract(lines, title, author, args.max_non_empty_lines),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            current = min(
+                timeit.repeat(
+                    lambda: _current_extract(lines, title, author, args.max_non_empty_lines),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            total_reference += reference
+            total_current += current
+            print(
+                f"{name:<24} {variant:<15} {len(lines):>7} {reference * 1000:>13.3f} "
+                f"{current * 1000:>11.3f} {reference / current if current else float('inf'):>7.1f}x"
+            )
+
+    print(f"total: reference {total_reference * 1000:.1f} ms, current {total_current * 1000:.1f} ms")
+    print(f"identical output: {'yes' if mismatches == 0 else f'no ({mismatches} mismatches)'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+"""Micro-benchmark for batch normalization.
+
+Times ``normalize_record`` called per record against ``normalize_records``
+on the same synthetic corpus, serially and with a hashing thread pool, and
+fails if any mode disagrees with the per-record output.
+
+    PYTHONPATH=src python benchmarks/bench_normalize.py
+    PYTHONPATH=src python benchmarks/bench_normalize.py --records 100000 --workers 4 --long-fraction 0.2
+
+``--long-fraction`` sets the share of records whose text exceeds the size at
+which ``hashlib`` releases the GIL (Gutenberg-length poems).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from daily_poetry_ingest.normalize import NormalizationError, normalize_record, normalize_records
+
+_WORDS = "the sea and sky were one bright wheel of light turning over fields of barley under autumn rain".split()
+
+
+def _records(count: int, long_fraction: float, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    records = []
+    for idx in range(count):
+        stanzas = 40 if rng.random() < long_fraction else 3
+        lines: list[str] = []
+        for _ in range(stanzas):
+            lines.extend(" ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9))) for _ in range(4))
+            lines.append("")
+        record = {"title": f"Poem {idx}", "author": f"Author {idx % 500}", "lines": lines}
+        if idx % 1000 == 0:
+            record.pop("title")
+        records.append(record)
+    return records
+
+
+def _per_record(records: list[dict]) -> tuple[list, list]:
+    poems, errors = [], []
+    for record in records:
+        result = normalize_record(record)
+        (errors if isinstance(result, NormalizationError) else poems).append(result)
+    return poems, errors
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--long-fraction", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = _records(args.records, args.long_fraction)
+    total_bytes = sum(len("\n".join(record["lines"]).encode("utf-8")) for record in records)
+    print(f"{len(records)} records, {total_bytes / 1e6:.1f} MB of text, long fraction {args.long_fraction}")
+
+    modes = {
+        "normalize_record loop": lambda: _per_record(records),
+        "normalize_records": lambda: normalize_records(records),
+        f"normalize_records workers={args.workers}": lambda: normalize_records(records, workers=args.workers),
+    }
+    expected = None
+    mismatches = 0
+    baseline = None
+    for name, fn in modes.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            result, elapsed = _timed(fn)
+            best = min(best, elapsed)
+        poems, errors = result if isinstance(result, tuple) else (result.poems, result.errors)
+        if expected is None:
+            expected = (poems, errors)
+        elif (poems, errors) != expected:
+            mismatches += 1
+            sys.stderr.write(f"output mismatch: {name}\n")
+        baseline = baseline or best
+        print(f"{name:<32} {best * 1000:>9.1f} ms  {len(records) / best:>10.0f} rec/s  {baseline / best:>5.2f}x")
+
+    print(f"identical output: {'yes' if mismatches == 0 else f'no ({mismatches} mismatches)'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""End-to-end PoetryDB ingestion benchmark against a local stand-in server.
+
+Starts ``standin_server.StandInServer`` (PoetryDB ``/author`` endpoints and
+the Wikipedia ``api.php`` query) with configurable latency, error rate and
+corpus size, then runs the full pipeline once per worker setting. Each run
+happens in a fresh interpreter so peak RSS is per run, not cumulative.
+
+    PYTHONPATH=src python benchmarks/bench_pipeline.py
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --authors 300 --poems-per-author 60 \\
+        --latency-ms 40 --error-rate 0.02 --fetch-workers 1,4,8,16 --normalize-workers 1,4
+
+One JSON line per invocation is appended to ``--output`` (default
+``benchmarks/results/pipeline.jsonl``) holding the environment, the server
+configuration, and for every run: wall time, poems and authors per second,
+per-service request latency percentiles (p50/p90/p99 over individual HTTP
+attempts as timed by the stand-in server, failures included), failed
+attempts, peak RSS and the report's per-stage timings. The pipeline is
+driven only through its public arguments (``base_url``, ``wikipedia_api``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from standin_server import StandInConfig, StandInServer
+
+_DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "pipeline.jsonl"
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"count": 0, "p50_ms": None, "p90_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": at(0.50),
+        "p90_ms": at(0.90),
+        "p99_ms": at(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _run_one(params: dict) -> dict:
+    """Run one pipeline configuration in this process and return its measurements."""
+
+    from daily_poetry_ingest.pipeline import run_poetrydb_ingestion
+
+    with TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        report = run_poetrydb_ingestion(
+            Path(tmp),
+            base_url=params["base_url"],
+            wikipedia_api=params["wikipedia_api"],
+            fetch_workers=params["fetch_workers"],
+            normalize_workers=params["normalize_workers"],
+            retries=params["retries"],
+            backoff_seconds=params["backoff_seconds"],
+            rate_limit_rps=0,
+        )
+        wall = time.perf_counter() - started
+
+    timings = report.get("timings", {})
+    canonical = report.get("canonical_poems", 0)
+    authors = report.get("authors_enriched", 0)
+    return {
+        "fetch_workers": params["fetch_workers"],
+        "normalize_workers": params["normalize_workers"],
+        "wall_seconds": round(wall, 4),
+        "canonical_poems": canonical,
+        "duplicates": report.get("duplicates"),
+        "authors": authors,
+        "poems_per_second": round(canonical / wall, 2) if wall > 0 else None,
+        "authors_per_second": round(authors / wall, 2) if wall > 0 else None,
+        "errors": len(report.get("errors", [])),
+        "bytes_fetched": timings.get("bytes_fetched"),
+        "peak_rss_bytes": timings.get("peak_rss_bytes"),
+        "peak_child_rss_bytes": timings.get("peak_child_rss_bytes"),
+        "stages": {name: stage["wall_seconds"] for name, stage in timings.get("stages", {}).items()},
+    }
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = StandInConfig()
+    parser.add_argument("--authors", type=int, default=defaults.authors)
+    parser.add_argument("--poems-per-author", type=int, default=defaults.poems_per_author)
+    parser.add_argument("--duplicate-fraction", type=float, default=defaults.duplicate_fraction)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter", type=float, default=defaults.jitter)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--fetch-workers", type=_int_list, default=[1, 4, 8])
+    parser.add_argument("--normalize-workers", type=_int_list, default=[1, 2])
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff-seconds", type=float, default=0.05)
+    parser.add_argument("--output", type=Path, default=_DEFAULT_OUTPUT)
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(_run_one(json.loads(args.run_one))))
+        return 0
+
+    config = StandInConfig(
+        authors=args.authors,
+        poems_per_author=args.poems_per_author,
+        duplicate_fraction=args.duplicate_fraction,
+        latency_ms=args.latency_ms,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    runs = []
+    with StandInServer(config) as server:
+        print(f"stand-in at {server.base_url}: {config.authors} authors x {config.poems_per_author} poems")
+        for fetch_workers in args.fetch_workers:
+            for normalize_workers in args.normalize_workers:
+                params = {
+                    "base_url": server.base_url,
+                    "wikipedia_api": server.wikipedia_api,
+                    "fetch_workers": fetch_workers,
+                    "normalize_workers": normalize_workers,
+                    "retries": args.retries,
+                    "backoff_seconds": args.backoff_seconds,
+                }
+                completed = subprocess.run(
+                    [sys.executable, __file__, "--run-one", json.dumps(params)],
+                    check=True,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+                )
+                run = json.loads(completed.stdout.strip().splitlines()[-1])
+                samples = server.take_samples()
+                run["latency"] = {service: _percentiles(sample["latencies"]) for service, sample in samples.items()}
+                run["failed_attempts"] = {service: sample["failures"] for service, sample in samples.items()}
+                runs.append(run)
+                print(
+                    f"fetch={fetch_workers:<3} normalize={normalize_workers:<3} "
+                    f"{run['wall_seconds']:8.2f}s {run['poems_per_second']:9.1f} poems/s "
+                    f"poetrydb p50/p99 {run['latency']['poetrydb']['p50_ms']}/{run['latency']['poetrydb']['p99_ms']} ms "
+                    f"rss {(run['peak_rss_bytes'] or 0) / 2**20:.1f} MiB"
+                )
+        server_stats = server.stats()
+
+    result = {
+        "benchmark": "pipeline",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "server": server_stats,
+        "runs": runs,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(result, sort_keys=True) + "\n")
+    print(f"results appended to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,231 @@
+"""Local stand-in for the PoetryDB and Wikipedia endpoints used by ingestion.
+
+Serves a deterministic synthetic corpus so pipeline benchmarks need no
+internet access:
+
+- ``GET /author`` and ``GET /author/{name}`` in PoetryDB's shapes;
+- ``GET /w/api.php?action=query&titles=A|B|...`` in the shape of the
+  Wikipedia ``pageimages|extracts`` query, one page per title.
+
+Every request can be delayed (``latency_ms`` with +/- ``jitter`` as a
+fraction) and can fail with ``503`` at ``error_rate``. Point the pipeline at
+``server.base_url`` for PoetryDB and ``server.wikipedia_api`` for Wikipedia.
+Each request's handling time is recorded per service; ``take_samples``
+returns and resets them.
+
+    PYTHONPATH=src python benchmarks/standin_server.py --port 8000 --authors 200 --latency-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = (
+    "the sea and sky were one bright wheel of light turning over fields of barley under autumn rain "
+    "while evening folded swallows into hedges and the river kept its slow unhurried counsel"
+).split()
+
+
+@dataclass(frozen=True, slots=True)
+class StandInConfig:
+    authors: int = 100
+    poems_per_author: int = 40
+    duplicate_fraction: float = 0.05
+    stanzas: int = 3
+    latency_ms: float = 0.0
+    jitter: float = 0.25
+    error_rate: float = 0.0
+    seed: int = 7
+
+
+def build_corpus(config: StandInConfig) -> dict[str, list[dict]]:
+    """Return ``{author: poems}``; ``duplicate_fraction`` of poems repeat an earlier text."""
+
+    rng = random.Random(config.seed)
+    corpus: dict[str, list[dict]] = {}
+    texts: list[list[str]] = []
+    for author_idx in range(config.authors):
+        author = f"Author {author_idx:05d}"
+        poems = []
+        for poem_idx in range(config.poems_per_author):
+            if texts and rng.random() < config.duplicate_fraction:
+                lines = list(rng.choice(texts))
+            else:
+                lines = []
+                for _ in range(config.stanzas):
+                    lines.extend(" ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9))) for _ in range(4))
+                    lines.append("")
+                lines.pop()
+                texts.append(lines)
+            poems.append(
+                {"title": f"Poem {poem_idx}", "author": author, "lines": lines, "linecount": str(len(lines))}
+            )
+        corpus[author] = poems
+    return corpus
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandInServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs add ~40 ms to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        started = time.perf_counter()
+        parsed = urllib.parse.urlsplit(self.path)
+        path = urllib.parse.unquote(parsed.path)
+        if path == "/w/api.php":
+            kind = "wikipedia"
+        elif path == "/author" or path.startswith("/author/"):
+            kind = "poetrydb"
+        else:
+            self._send(404, b"")
+            return
+
+        if self.server.delay_and_maybe_fail(kind):
+            self._send(503, b"")
+            self.server.record_latency(kind, time.perf_counter() - started, failed=True)
+            return
+
+        if kind == "wikipedia":
+            titles = urllib.parse.parse_qs(parsed.query).get("titles", [""])[0].split("|")
+            payload: object = {"query": {"pages": self.server.wikipedia_pages(titles)}}
+        elif path == "/author":
+            payload = {"authors": list(self.server.corpus)}
+        else:
+            poems = self.server.corpus.get(path.split("/author/", 1)[1])
+            payload = poems if poems is not None else {"status": 404, "reason": "Not found"}
+        self._send(200, json.dumps(payload).encode("utf-8"))
+        self.server.record_latency(kind, time.perf_counter() - started, failed=False)
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in server; use as a context manager to run it in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, config: StandInConfig, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.config = config
+        self.corpus = build_corpus(config)
+        self._rng = random.Random(config.seed + 1)
+        self._lock = threading.Lock()
+        self.requests = {"poetrydb": 0, "wikipedia": 0}
+        self.errors = {"poetrydb": 0, "wikipedia": 0}
+        self._samples = self._empty_samples()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def wikipedia_api(self) -> str:
+        return self.base_url + "/w/api.php"
+
+    def delay_and_maybe_fail(self, kind: str) -> bool:
+        with self._lock:
+            jitter = self._rng.uniform(1 - self.config.jitter, 1 + self.config.jitter)
+            fail = self._rng.random() < self.config.error_rate
+            self.requests[kind] += 1
+            if fail:
+                self.errors[kind] += 1
+        if self.config.latency_ms > 0:
+            time.sleep(self.config.latency_ms * jitter / 1000)
+        return fail
+
+    @staticmethod
+    def _empty_samples() -> dict[str, dict]:
+        return {kind: {"latencies": [], "failures": 0} for kind in ("poetrydb", "wikipedia")}
+
+    def record_latency(self, kind: str, seconds: float, *, failed: bool) -> None:
+        with self._lock:
+            self._samples[kind]["latencies"].append(seconds)
+            if failed:
+                self._samples[kind]["failures"] += 1
+
+    def take_samples(self) -> dict[str, dict]:
+        """Return per-service latencies and failures recorded since the last call."""
+
+        with self._lock:
+            samples, self._samples = self._samples, self._empty_samples()
+        return samples
+
+    def wikipedia_pages(self, titles: list[str]) -> dict[str, dict]:
+        pages: dict[str, dict] = {}
+        for idx, title in enumerate(title for title in titles if title):
+            slug = urllib.parse.quote(title.replace(" ", "_"))
+            pages[str(idx + 1)] = {
+                "pageid": idx + 1,
+                "ns": 0,
+                "title": title,
+                "extract": f"{title} is a poet whose work appears in the synthetic benchmark corpus. " * 3,
+                "thumbnail": {"source": f"{self.base_url}/images/{slug}.jpg", "width": 600, "height": 800},
+            }
+        return pages
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"config": asdict(self.config), "requests": dict(self.requests), "errors": dict(self.errors)}
+
+    def __enter__(self) -> StandInServer:
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = StandInConfig()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--authors", type=int, default=defaults.authors)
+    parser.add_argument("--poems-per-author", type=int, default=defaults.poems_per_author)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        authors=args.authors,
+        poems_per_author=args.poems_per_author,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    server = StandInServer(config, args.host, args.port)
+    print(f"PoetryDB stand-in: {server.base_url}  Wikipedia API stand-in: {server.wikipedia_api}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,18 @@
 """Ingestion package for Daily Poetry corpus pipelines."""
 
 __all__ = [
+    "artifacts",
     "author_images",
+    "blob_store",
     "cli",
+    "columnar",
     "pipeline",
     "gutenberg",
+    "http_cache",
+    "http_client",
+    "instrumentation",
     "normalize",
+    "ratelimit",
     "dedupe",
+    "near_duplicates",
 ]
@@ -0,0 +1,206 @@
+"""Streaming JSONL artifact writers and readers with optional compression.
+
+Records are encoded as they are produced and written through a compressor
+in buffered chunks, so an artifact never has to be held in memory. The
+encoding is chosen by file suffix: ``.jsonl`` (plain), ``.jsonl.gz``
+(gzip, standard library) or ``.jsonl.zst`` (zstd, which needs the optional
+``zstandard`` package). Readers detect compression from the file's magic
+bytes, so callers never need to know how an artifact was written. Either
+side can take a ``BlobStore`` to move poem texts out of the artifact and
+back.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from daily_poetry_ingest.blob_store import BlobStore
+
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_FLUSH_BYTES = 1 << 16
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactStats:
+    """Size of one written artifact before and after compression."""
+
+    path: str
+    records: int
+    raw_bytes: int
+    written_bytes: int
+
+    @property
+    def compression_ratio(self) -> float:
+        return round(self.raw_bytes / self.written_bytes, 3) if self.written_bytes else 1.0
+
+    def as_report(self) -> dict:
+        return {
+            "records": self.records,
+            "raw_bytes": self.raw_bytes,
+            "written_bytes": self.written_bytes,
+            "compression_ratio": self.compression_ratio,
+        }
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:  # pragma: no cover - depends on the environment
+        raise RuntimeError("zstd artifacts require the optional 'zstandard' package") from None
+    return zstandard
+
+
+def check_compression(compression: str) -> str:
+    """Validate a compression name, failing early when its codec is unavailable."""
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"unknown artifact compression: {compression!r}")
+    if compression == "zstd":
+        _zstandard()
+    return compression
+
+
+def artifact_path(output_dir: Path, name: str, compression: str = "none") -> Path:
+    return output_dir / f"{name}.jsonl{COMPRESSION_SUFFIXES[compression]}"
+
+
+def find_artifact(output_dir: Path, name: str) -> Path | None:
+    """Return the existing ``name`` artifact in any encoding, if there is one."""
+
+    for compression in COMPRESSION_SUFFIXES:
+        path = artifact_path(output_dir, name, compression)
+        if path.exists():
+            return path
+    return None
+
+
+def remove_other_encodings(output_dir: Path, name: str, compression: str) -> None:
+    """Delete ``name`` artifacts left behind by a run with another compression."""
+
+    for other in COMPRESSION_SUFFIXES:
+        if other != compression:
+            artifact_path(output_dir, name, other).unlink(missing_ok=True)
+
+
+def _compression_for(path: Path) -> str:
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return compression
+    return "none"
+
+
+class JsonlWriter:
+    """Write records to a JSONL artifact as they arrive.
+
+    Output goes to a temporary sibling that replaces ``path`` on a clean
+    ``close``; on error the previous artifact is left untouched. Gzip output
+    stores no name or timestamp, so identical records give identical files.
+    With ``blob_store``, record texts are stored there and written as
+    ``text_ref`` fields.
+    """
+
+    def __init__(self, path: Path, *, blob_store: BlobStore | None = None) -> None:
+        self.path = path
+        self._blob_store = blob_store
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._raw = self._tmp_path.open("wb")
+        compression = _compression_for(path)
+        self._stream: IO[bytes]
+        if compression == "gzip":
+            self._stream = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, compresslevel=_GZIP_LEVEL, mtime=0)
+        elif compression == "zstd":
+            compressor = _zstandard().ZstdCompressor(level=_ZSTD_LEVEL)
+            self._stream = compressor.stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self.records = 0
+        self.raw_bytes = 0
+        self.stats: ArtifactStats | None = None
+
+    def __enter__(self) -> JsonlWriter:
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: dict) -> None:
+        if self._blob_store is not None:
+            record = self._blob_store.externalize(record)
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self.records += 1
+        if self._pending_bytes >= _FLUSH_BYTES:
+            self._flush()
+
+    def extend(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self.write(record)
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._stream.write(b"".join(self._pending))
+            self.raw_bytes += self._pending_bytes
+            self._pending = []
+            self._pending_bytes = 0
+
+    def close(self) -> ArtifactStats:
+        if self.stats is None:
+            self._flush()
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.close()
+            written_bytes = self._tmp_path.stat().st_size
+            os.replace(self._tmp_path, self.path)
+            self.stats = ArtifactStats(str(self.path), self.records, self.raw_bytes, written_bytes)
+        return self.stats
+
+    def abort(self) -> None:
+        self._raw.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def write_jsonl(path: Path, records: Iterable[dict], *, blob_store: BlobStore | None = None) -> ArtifactStats:
+    with JsonlWriter(path, blob_store=blob_store) as writer:
+        writer.extend(records)
+    return writer.close()
+
+
+def open_jsonl(path: Path) -> IO[str]:
+    """Open a JSONL artifact for text reading, decompressing if needed."""
+
+    with path.open("rb") as probe:
+        magic = probe.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        reader = _zstandard().ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def read_jsonl(path: Path, *, blob_store: BlobStore | None = None) -> Iterator[dict]:
+    """Yield the records of a JSONL artifact, resolving ``text_ref`` fields through ``blob_store`` if given."""
+
+    with open_jsonl(path) as handle:
+        for line in handle:
+            if line.strip():
+                record = json.loads(line)
+                yield record if blob_store is None else blob_store.resolve(record)
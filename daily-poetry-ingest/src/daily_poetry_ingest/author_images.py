@@ -6,6 +6,7 @@ produces nullable author metadata records for ingestion artifacts.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import time
 import urllib.parse
@@ -13,6 +14,10 @@ import urllib.request
 from dataclasses import dataclass
 from typing import Any
 
+from daily_poetry_ingest.http_cache import CacheMissError, HTTPCache
+from daily_poetry_ingest.http_client import USER_AGENT, record_bytes_received, urlopen_get
+from daily_poetry_ingest.ratelimit import TokenBucket
+
 
 @dataclass(frozen=True, slots=True)
 class AuthorImageRecord:
@@ -26,17 +31,42 @@ class AuthorImageRecord:
     bio_url: str | None = None
 
 
-def _fetch_json(url: str, timeout_seconds: float) -> Any:
-    request = urllib.request.Request(url, headers={"User-Agent": "daily-poetry-ingest/0.1"})
+def _fetch_json(
+    url: str,
+    timeout_seconds: float,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> Any:
+    def fetch(headers: dict[str, str]) -> tuple[int, Any, bytes]:
+        if limiter is not None:
+            limiter.acquire()
+        return urlopen_get(url, headers, timeout_seconds)
+
+    if cache is not None:
+        return cache.get_json(url, fetch)
+    if limiter is not None:
+        limiter.acquire()
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-        return json.loads(response.read().decode("utf-8"))
+        body = response.read()
+    record_bytes_received(len(body))
+    return json.loads(body.decode("utf-8"))
 
 
-def _fetch_with_retry(url: str, timeout_seconds: float, retries: int, backoff_seconds: float) -> Any:
+def _fetch_with_retry(
+    url: str,
+    timeout_seconds: float,
+    retries: int,
+    backoff_seconds: float,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> Any:
     last_error: Exception | None = None
     for attempt in range(retries + 1):
         try:
-            return _fetch_json(url, timeout_seconds)
+            return _fetch_json(url, timeout_seconds, cache, limiter)
+        except CacheMissError:
+            raise
         except Exception as exc:  # pragma: no cover - network variability
             last_error = exc
             if attempt < retries:
@@ -78,65 +108,54 @@ def _build_wikipedia_page_url(title: str) -> str:
     return "https://en.wikipedia.org/wiki/" + urllib.parse.quote(normalized, safe="()'/_-")
 
 
-def resolve_author_image(
-    author: str,
-    timeout_seconds: float,
-    retries: int,
-    backoff_seconds: float,
-    *,
-    enrich_bio: bool = True,
-    bio_max_chars: int = 280,
-) -> AuthorImageRecord:
-    """Resolve author image and optional bio metadata from Wikipedia."""
-
-    encoded = urllib.parse.quote(author, safe="")
-    endpoint = (
-        "https://en.wikipedia.org/w/api.php"
-        "?action=query&prop=pageimages|extracts&format=json&redirects=1"
-        f"&piprop=thumbnail|original&pithumbsize=600&exintro=1&explaintext=1&titles={encoded}"
-    )
+WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
+_WIKIPEDIA_QUERY_PARAMS = (
+    ("action", "query"),
+    ("prop", "pageimages|extracts"),
+    ("format", "json"),
+    ("redirects", "1"),
+    ("piprop", "thumbnail|original"),
+    ("pithumbsize", "600"),
+    ("exintro", "1"),
+    ("explaintext", "1"),
+)
+WIKIPEDIA_MAX_TITLES = 50
 
-    try:
-        payload = _fetch_with_retry(endpoint, timeout_seconds, retries, backoff_seconds)
-    except Exception:
-        return AuthorImageRecord(name=author, image_url=None, image_source=None)
-
-    query = payload.get("query") if isinstance(payload, dict) else None
-    pages = query.get("pages") if isinstance(query, dict) else None
-    if not isinstance(pages, dict):
-        return AuthorImageRecord(name=author, image_url=None, image_source=None)
-
-    for page in pages.values():
-        if not isinstance(page, dict):
-            continue
-        image_url = _extract_thumbnail(page)
-        image_source = "wikipedia" if image_url else None
-
-        bio_short: str | None = None
-        bio_source: str | None = None
-        bio_url: str | None = None
-        if enrich_bio:
-            extract = page.get("extract")
-            if isinstance(extract, str):
-                bio_short = _normalize_bio_text(extract, bio_max_chars)
-                if bio_short:
-                    bio_source = "wikipedia"
-                    title = page.get("title")
-                    if isinstance(title, str) and title.strip():
-                        bio_url = _build_wikipedia_page_url(title)
-                    else:
-                        bio_url = _build_wikipedia_page_url(author)
-
-        if image_url or bio_short:
-            return AuthorImageRecord(
-                name=author,
-                image_url=image_url,
-                image_source=image_source,
-                bio_short=bio_short,
-                bio_source=bio_source,
-                bio_url=bio_url,
-            )
 
+def _record_from_page(
+    author: str, page: dict, *, enrich_bio: bool, bio_max_chars: int
+) -> AuthorImageRecord | None:
+    image_url = _extract_thumbnail(page)
+    image_source = "wikipedia" if image_url else None
+
+    bio_short: str | None = None
+    bio_source: str | None = None
+    bio_url: str | None = None
+    if enrich_bio:
+        extract = page.get("extract")
+        if isinstance(extract, str):
+            bio_short = _normalize_bio_text(extract, bio_max_chars)
+            if bio_short:
+                bio_source = "wikipedia"
+                title = page.get("title")
+                if isinstance(title, str) and title.strip():
+                    bio_url = _build_wikipedia_page_url(title)
+                else:
+                    bio_url = _build_wikipedia_page_url(author)
+
+    if image_url or bio_short:
+        return AuthorImageRecord(
+            name=author,
+            image_url=image_url,
+            image_source=image_source,
+            bio_short=bio_short,
+            bio_source=bio_source,
+            bio_url=bio_url,
+        )
+    return None
+
+
+def _empty_record(author: str) -> AuthorImageRecord:
     return AuthorImageRecord(
         name=author,
         image_url=None,
@@ -147,6 +166,114 @@ def resolve_author_image(
     )
 
 
+def _title_map(query: dict, key: str) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    entries = query.get(key)
+    if isinstance(entries, list):
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("from"), str) and isinstance(entry.get("to"), str):
+                mapping[entry["from"]] = entry["to"]
+    return mapping
+
+
+def resolve_author_image_batch(
+    authors: list[str],
+    timeout_seconds: float,
+    retries: int,
+    backoff_seconds: float,
+    *,
+    enrich_bio: bool = True,
+    bio_max_chars: int = 280,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+    wikipedia_api: str = WIKIPEDIA_API,
+) -> dict[str, AuthorImageRecord]:
+    """Resolve up to ``WIKIPEDIA_MAX_TITLES`` authors with one query.
+
+    Titles are sent pipe-separated; the ``normalized``, ``converted`` and
+    ``redirects`` maps in the response lead each original name to its page.
+    Page fields split across ``continue`` responses (extracts are capped per
+    request) are merged before records are built. ``wikipedia_api`` is the
+    ``api.php`` endpoint queried.
+    """
+
+    if len(authors) > WIKIPEDIA_MAX_TITLES:
+        raise ValueError(f"at most {WIKIPEDIA_MAX_TITLES} authors per batch")
+    if not authors:
+        return {}
+
+    params = dict(_WIKIPEDIA_QUERY_PARAMS)
+    params.update({"titles": "|".join(authors), "pilimit": "max", "exlimit": "max"})
+    pages_by_title: dict[str, dict] = {}
+    renames: dict[str, str] = {}
+
+    try:
+        while True:
+            endpoint = wikipedia_api + "?" + urllib.parse.urlencode(params, safe="|")
+            payload = _fetch_with_retry(endpoint, timeout_seconds, retries, backoff_seconds, cache, limiter)
+            query = payload.get("query") if isinstance(payload, dict) else None
+            if isinstance(query, dict):
+                for key in ("normalized", "converted", "redirects"):
+                    renames.update(_title_map(query, key))
+                pages = query.get("pages")
+                if isinstance(pages, dict):
+                    for page in pages.values():
+                        if isinstance(page, dict) and isinstance(page.get("title"), str):
+                            pages_by_title.setdefault(page["title"], {}).update(page)
+            continuation = payload.get("continue") if isinstance(payload, dict) else None
+            if not isinstance(continuation, dict):
+                break
+            params.update({key: str(value) for key, value in continuation.items()})
+    except CacheMissError:
+        raise
+    except Exception:
+        return {author: _empty_record(author) for author in authors}
+
+    resolved: dict[str, AuthorImageRecord] = {}
+    for author in authors:
+        title = author
+        seen: set[str] = set()
+        while title in renames and title not in seen:
+            seen.add(title)
+            title = renames[title]
+        page = pages_by_title.get(title)
+        record = None
+        if page is not None:
+            record = _record_from_page(author, page, enrich_bio=enrich_bio, bio_max_chars=bio_max_chars)
+        resolved[author] = record or _empty_record(author)
+    return resolved
+
+
+def _record_to_dict(record: AuthorImageRecord) -> dict:
+    return {
+        "name": record.name,
+        "image_url": record.image_url,
+        "image_source": record.image_source,
+        "bio_short": record.bio_short,
+        "bio_source": record.bio_source,
+        "bio_url": record.bio_url,
+    }
+
+
+def _stable_batches(authors: list[str], max_size: int) -> list[list[str]]:
+    """Split ``authors`` into batches whose boundaries depend only on names.
+
+    A batch starts at each author whose name hash picks it as a boundary
+    (about one in ``max_size // 2``), and runs longer than ``max_size`` are
+    split. Adding or removing an author only changes the batch it falls in,
+    so the cached queries of every other batch keep their URLs.
+    """
+
+    spacing = max(1, max_size // 2)
+    batches: list[list[str]] = []
+    for author in authors:
+        digest = int.from_bytes(hashlib.blake2b(author.encode("utf-8"), digest_size=8).digest(), "little")
+        if not batches or digest % spacing == 0 or len(batches[-1]) >= max_size:
+            batches.append([])
+        batches[-1].append(author)
+    return batches
+
+
 def enrich_authors(
     authors: list[str],
     timeout_seconds: float,
@@ -154,53 +281,50 @@ def enrich_authors(
     backoff_seconds: float,
     rate_limit_rps: float,
     *,
+    rate_limit_burst: int = 1,
+    limiter: TokenBucket | None = None,
     enrich_bios: bool = True,
     bio_max_chars: int = 280,
+    cache: HTTPCache | None = None,
+    batch_size: int = WIKIPEDIA_MAX_TITLES,
+    wikipedia_api: str = WIKIPEDIA_API,
 ) -> tuple[list[dict], list[dict]]:
     """Enrich a sorted list of unique authors with nullable metadata.
 
-    Returns records and non-fatal errors.
+    Authors are resolved up to ``batch_size`` titles per Wikipedia query, in
+    batches that stay stable as authors come and go (see
+    ``_stable_batches``) so ``cache`` keeps hitting. Requests are admitted by
+    ``limiter`` when given (so callers can share one Wikipedia budget),
+    otherwise by a bucket built from the rate arguments. Responses served
+    from ``cache`` do not consume rate-limit tokens; an offline cache miss
+    is reported in the errors rather than passed off as an author without
+    metadata. Returns records and non-fatal errors.
     """
 
     records: list[dict] = []
     errors: list[dict] = []
-    delay = 1.0 / rate_limit_rps if rate_limit_rps > 0 else 0.0
+    bucket = limiter or TokenBucket(rate_limit_rps, rate_limit_burst)
+    step = max(1, min(batch_size, WIKIPEDIA_MAX_TITLES))
 
-    for author in authors:
+    for batch in _stable_batches(authors, step):
         try:
-            record = resolve_author_image(
-                author,
+            resolved = resolve_author_image_batch(
+                batch,
                 timeout_seconds,
                 retries,
                 backoff_seconds,
                 enrich_bio=enrich_bios,
                 bio_max_chars=bio_max_chars,
+                cache=cache,
+                limiter=bucket,
+                wikipedia_api=wikipedia_api,
             )
-            records.append(
-                {
-                    "name": record.name,
-                    "image_url": record.image_url,
-                    "image_source": record.image_source,
-                    "bio_short": record.bio_short,
-                    "bio_source": record.bio_source,
-                    "bio_url": record.bio_url,
-                }
-            )
-        except Exception as exc:  # pragma: no cover - defensive catch
-            records.append(
-                {
-                    "name": author,
-                    "image_url": None,
-                    "image_source": None,
-                    "bio_short": None,
-                    "bio_source": None,
-                    "bio_url": None,
-                }
-            )
-            errors.append({"kind": "author_image_error", "author": author, "reason": str(exc)})
-
-        if delay > 0:
-            time.sleep(delay)
+            for author in batch:
+                records.append(_record_to_dict(resolved.get(author) or _empty_record(author)))
+        except Exception as exc:
+            for author in batch:
+                records.append(_record_to_dict(_empty_record(author)))
+                errors.append({"kind": "author_image_error", "author": author, "reason": str(exc)})
 
     records.sort(key=lambda item: item["name"])
     return records, errors
@@ -0,0 +1,88 @@
+"""Content-addressed store for poem texts shared across ingestion runs.
+
+Poem identity is already ``content_hash`` (the SHA-256 of the canonical
+text), so a text only ever needs to be written once. With a store, poem
+and duplicate artifacts carry ``"text_ref": <content_hash>`` in place of
+``"text"``, and each text lives at ``<root>/<hash[:2]>/<hash[2:]>`` as
+UTF-8. Blobs already present are never rewritten, so a nightly run only
+writes the texts that changed. Blobs are never deleted by ingestion; the
+store can be removed and rebuilt by the next run at any time.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+TEXT_REF = "text_ref"
+
+
+def _swap_field(record: dict, old: str, new: str, value: object) -> dict:
+    # Rebuild rather than pop/insert so the field keeps its position.
+    swapped: dict = {}
+    for key, item in record.items():
+        if key == old:
+            swapped[new] = value
+        else:
+            swapped[key] = item
+    return swapped
+
+
+class BlobStore:
+    """Write-once text blobs keyed by content hash, with per-run counters."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._counted: set[str] = set()
+        self.blobs_written = 0
+        self.blobs_reused = 0
+        self.bytes_written = 0
+
+    def path_for(self, content_hash: str) -> Path:
+        if len(content_hash) < 3 or not content_hash.isalnum():
+            raise ValueError(f"invalid content hash: {content_hash!r}")
+        return self.root / content_hash[:2] / content_hash[2:]
+
+    def put(self, content_hash: str, text: str) -> None:
+        path = self.path_for(content_hash)
+        if path.exists():
+            if content_hash not in self._counted:
+                self._counted.add(content_hash)
+                self.blobs_reused += 1
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        encoded = text.encode("utf-8")
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(encoded)
+        os.replace(tmp_path, path)
+        self._counted.add(content_hash)
+        self.blobs_written += 1
+        self.bytes_written += len(encoded)
+
+    def get(self, content_hash: str) -> str:
+        # Bytes, not read_text: newline translation would change the hashed text.
+        return self.path_for(content_hash).read_bytes().decode("utf-8")
+
+    def externalize(self, record: dict) -> dict:
+        """Store ``record["text"]`` and return the record with a ``text_ref`` in its place."""
+
+        if "text" not in record:
+            return record
+        content_hash = record["content_hash"]
+        self.put(content_hash, record["text"])
+        return _swap_field(record, "text", TEXT_REF, content_hash)
+
+    def resolve(self, record: dict) -> dict:
+        """Return ``record`` with its ``text_ref`` replaced by the stored text."""
+
+        if TEXT_REF not in record:
+            return record
+        return _swap_field(record, TEXT_REF, "text", self.get(record[TEXT_REF]))
+
+    def stats(self) -> dict:
+        return {
+            "path": str(self.root),
+            "blobs_written": self.blobs_written,
+            "blobs_reused": self.blobs_reused,
+            "bytes_written": self.bytes_written,
+        }
@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from daily_poetry_ingest.author_images import WIKIPEDIA_API
 from daily_poetry_ingest.pipeline import (
     auto_worker_split,
     print_report,
@@ -18,10 +19,21 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--output-dir", type=Path, default=Path("artifacts/ingestion"))
     parser.add_argument("--source", choices=["poetrydb", "gutenberg"], default="poetrydb")
     parser.add_argument("--base-url", default="https://poetrydb.org")
+    parser.add_argument(
+        "--wikipedia-api",
+        default=WIKIPEDIA_API,
+        help="Wikipedia api.php endpoint used for author enrichment.",
+    )
     parser.add_argument("--timeout-seconds", type=float, default=20.0)
     parser.add_argument("--retries", type=int, default=3)
     parser.add_argument("--backoff-seconds", type=float, default=0.5)
     parser.add_argument("--rate-limit-rps", type=float, default=2.0)
+    parser.add_argument(
+        "--rate-limit-burst",
+        type=int,
+        default=1,
+        help="Requests that may be sent back-to-back before --rate-limit-rps applies.",
+    )
     parser.add_argument(
         "--enrich-author-bios",
         dest="enrich_author_bios",
@@ -41,8 +53,94 @@ def build_parser() -> argparse.ArgumentParser:
         default=280,
         help="Maximum length for enriched author bios. <=0 keeps full text.",
     )
-    parser.add_argument("--fetch-workers", type=int, default=None)
-    parser.add_argument("--normalize-workers", type=int, default=None)
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=None,
+        help="Concurrent PoetryDB fetch threads sharing one keep-alive connection pool.",
+    )
+    parser.add_argument(
+        "--normalize-workers",
+        type=int,
+        default=None,
+        help="Normalization worker processes (Gutenberg: extraction worker processes).",
+    )
+    parser.add_argument(
+        "--queue-batch-size",
+        type=int,
+        default=64,
+        help="Maximum PoetryDB records per batch exchanged between fetch and normalize workers.",
+    )
+    parser.add_argument(
+        "--queue-batch-max-bytes",
+        type=int,
+        default=1_000_000,
+        help="Approximate byte budget per worker batch. <=0 limits batches by count only.",
+    )
+    parser.add_argument(
+        "--http-cache-path",
+        type=Path,
+        default=None,
+        help="SQLite file caching PoetryDB and Wikipedia responses across runs.",
+    )
+    parser.add_argument(
+        "--http-cache-ttl-hours",
+        type=float,
+        default=24.0,
+        help="Serve cached PoetryDB responses without revalidation for this long.",
+    )
+    parser.add_argument(
+        "--author-cache-ttl-hours",
+        type=float,
+        default=24.0 * 30,
+        help="Serve cached Wikipedia author lookups without revalidation for this long.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve upstream responses only from --http-cache-path; never touch the network.",
+    )
+    parser.add_argument(
+        "--dedupe-max-in-memory",
+        type=int,
+        default=None,
+        help="Buffer at most this many poems during dedupe, spilling sorted runs to disk beyond it.",
+    )
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        default=None,
+        help="Also fold near-duplicate poems (MinHash/LSH) at this estimated similarity, e.g. 0.8.",
+    )
+    parser.add_argument(
+        "--columnar-artifacts",
+        action="store_true",
+        help="Also write poems/duplicates/authors as memory-mappable .dpcol columnar files.",
+    )
+    parser.add_argument(
+        "--artifact-compression",
+        choices=["none", "gzip", "zstd"],
+        default="none",
+        help="Compress JSONL artifacts as they are written (zstd needs the optional 'zstandard' package).",
+    )
+    parser.add_argument(
+        "--blob-store",
+        type=Path,
+        default=None,
+        help="Content-addressed poem text store shared across runs; artifacts then reference texts by hash.",
+    )
+    parser.add_argument(
+        "--trace-path",
+        type=Path,
+        default=None,
+        help="Also write per-stage timings as a Chrome trace JSON file (chrome://tracing, Perfetto).",
+    )
+    parser.add_argument(
+        "--poetrydb-manifest",
+        type=Path,
+        default=None,
+        help="JSON manifest of per-author payload fingerprints; unchanged authors are merged from the previous artifacts.",
+    )
     parser.add_argument("--gutenberg-catalog-csv", type=Path, default=None)
     parser.add_argument("--gutenberg-texts-dir", type=Path, default=None)
     parser.add_argument("--gutenberg-language", type=str, default="en")
@@ -52,12 +150,32 @@ def build_parser() -> argparse.ArgumentParser:
         default=40,
         help="Maximum non-empty poem lines allowed for strict Gutenberg extraction.",
     )
+    parser.add_argument(
+        "--gutenberg-chunk-size",
+        type=int,
+        default=32,
+        help="Catalog candidates per task submitted to the Gutenberg extraction pool.",
+    )
+    parser.add_argument(
+        "--gutenberg-text-index",
+        type=Path,
+        default=None,
+        help="JSON file caching the ebook id -> text path index; rebuilt when the texts directory changes.",
+    )
+    parser.add_argument(
+        "--gutenberg-manifest",
+        type=Path,
+        default=None,
+        help="JSON manifest of per-ebook extraction outcomes; only new or changed ebooks are re-extracted.",
+    )
     return parser
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    if args.offline and args.http_cache_path is None:
+        parser.error("--offline requires --http-cache-path")
 
     fetch_workers = args.fetch_workers
     normalize_workers = args.normalize_workers
@@ -76,8 +194,23 @@ def main() -> None:
             retries=args.retries,
             backoff_seconds=args.backoff_seconds,
             rate_limit_rps=args.rate_limit_rps,
+            rate_limit_burst=args.rate_limit_burst,
             enrich_author_bios=args.enrich_author_bios,
             author_bio_max_chars=args.author_bio_max_chars,
+            wikipedia_api=args.wikipedia_api,
+            queue_batch_size=args.queue_batch_size,
+            queue_batch_max_bytes=args.queue_batch_max_bytes,
+            http_cache_path=args.http_cache_path,
+            http_cache_ttl_seconds=args.http_cache_ttl_hours * 3600,
+            author_cache_ttl_seconds=args.author_cache_ttl_hours * 3600,
+            offline=args.offline,
+            manifest_path=args.poetrydb_manifest,
+            dedupe_max_in_memory=args.dedupe_max_in_memory,
+            near_duplicate_threshold=args.near_duplicate_threshold,
+            columnar_artifacts=args.columnar_artifacts,
+            artifact_compression=args.artifact_compression,
+            blob_store_dir=args.blob_store,
+            trace_path=args.trace_path,
         )
     else:
         if args.gutenberg_catalog_csv is None:
@@ -94,8 +227,23 @@ def main() -> None:
             retries=args.retries,
             backoff_seconds=args.backoff_seconds,
             rate_limit_rps=args.rate_limit_rps,
+            rate_limit_burst=args.rate_limit_burst,
             enrich_author_bios=args.enrich_author_bios,
             author_bio_max_chars=args.author_bio_max_chars,
+            wikipedia_api=args.wikipedia_api,
+            http_cache_path=args.http_cache_path,
+            author_cache_ttl_seconds=args.author_cache_ttl_hours * 3600,
+            offline=args.offline,
+            normalize_workers=normalize_workers,
+            extract_chunk_size=args.gutenberg_chunk_size,
+            text_index_path=args.gutenberg_text_index,
+            manifest_path=args.gutenberg_manifest,
+            dedupe_max_in_memory=args.dedupe_max_in_memory,
+            near_duplicate_threshold=args.near_duplicate_threshold,
+            columnar_artifacts=args.columnar_artifacts,
+            artifact_compression=args.artifact_compression,
+            blob_store_dir=args.blob_store,
+            trace_path=args.trace_path,
         )
     print_report(report)
 
@@ -0,0 +1,213 @@
+"""Compact columnar artifact format written alongside the JSONL artifacts.
+
+Layout of a ``.dpcol`` file (all integers little-endian)::
+
+    MAGIC
+    column sections, each starting on an 8-byte boundary
+    footer: UTF-8 JSON describing rows, columns, and sections
+    u64 footer length
+    MAGIC
+
+String columns are a ``u64`` offsets array (``rows + 1`` entries) followed by
+the concatenated UTF-8 values; integer columns are ``i64`` arrays. A column
+with missing values also has a one-byte-per-row null mask. An optional
+index is a ``u32`` array of row numbers sorted by one string column, which
+lets readers binary-search a memory-mapped file (for example by
+``content_hash``) without decoding it. The reader lives with its consumer,
+``app.seed_from_artifacts`` in the API package.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import IO
+
+from daily_poetry_ingest.artifacts import find_artifact, read_jsonl
+from daily_poetry_ingest.blob_store import BlobStore
+
+MAGIC = b"DPCOL\x00\x01\x00"
+FORMAT_VERSION = 1
+
+POEM_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("title", "str"),
+    ("author", "str"),
+    ("text", "str"),
+    ("linecount", "int"),
+    ("content_hash", "str"),
+    ("source", "str"),
+)
+DUPLICATE_COLUMNS = POEM_COLUMNS + (("canonical_content_hash", "str"), ("kind", "str"), ("similarity_ppm", "int"))
+AUTHOR_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("name", "str"),
+    ("image_url", "str"),
+    ("image_source", "str"),
+    ("bio_short", "str"),
+    ("bio_source", "str"),
+    ("bio_url", "str"),
+)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - big-endian hosts
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _Column:
+    def __init__(self, name: str, kind: str, spool: IO[bytes]) -> None:
+        self.name = name
+        self.kind = kind
+        self.spool = spool
+        self.offsets = array("Q", [0])
+        self.integers = array("q")
+        self.nulls = bytearray()
+
+    def add(self, value: object) -> None:
+        missing = value is None
+        self.nulls.append(1 if missing else 0)
+        if self.kind == "str":
+            if not missing:
+                if not isinstance(value, str):
+                    raise TypeError(f"column {self.name!r} expects str, got {type(value).__name__}")
+                encoded = value.encode("utf-8")
+                self.spool.write(encoded)
+                self.offsets.append(self.offsets[-1] + len(encoded))
+            else:
+                self.offsets.append(self.offsets[-1])
+        else:
+            if not missing and (isinstance(value, bool) or not isinstance(value, int)):
+                raise TypeError(f"column {self.name!r} expects int, got {type(value).__name__}")
+            self.integers.append(0 if missing else value)
+
+
+def _pad(handle: IO[bytes]) -> int:
+    position = handle.tell()
+    remainder = position % 8
+    if remainder:
+        handle.write(b"\x00" * (8 - remainder))
+        position += 8 - remainder
+    return position
+
+
+def _write_section(handle: IO[bytes], payload: bytes) -> list[int]:
+    start = _pad(handle)
+    handle.write(payload)
+    return [start, len(payload)]
+
+
+def write_columnar(
+    path: Path,
+    records: Iterable[dict],
+    columns: Sequence[tuple[str, str]],
+    *,
+    index_column: str | None = None,
+) -> int:
+    """Write ``records`` to ``path`` as a ``.dpcol`` file; return the row count.
+
+    Values are streamed to per-column spool files, so memory use is the
+    offsets arrays plus, when ``index_column`` is set, that column's keys.
+    """
+
+    names = [name for name, _ in columns]
+    if index_column is not None and dict(columns).get(index_column) != "str":
+        raise ValueError(f"index column must be a str column: {index_column!r}")
+
+    with tempfile.TemporaryDirectory(prefix="dpcol-", dir=path.parent) as spool_dir:
+        spools = [open(Path(spool_dir) / f"{idx}.bin", "w+b") for idx in range(len(columns))]
+        try:
+            built = [_Column(name, kind, spool) for (name, kind), spool in zip(columns, spools)]
+            keys: list[bytes] = []
+            rows = 0
+            for record in records:
+                for column in built:
+                    column.add(record.get(column.name))
+                if index_column is not None:
+                    keys.append((record.get(index_column) or "").encode("utf-8"))
+                rows += 1
+
+            tmp_path = path.with_name(path.name + ".tmp")
+            with tmp_path.open("wb") as handle:
+                handle.write(MAGIC)
+                described: dict[str, dict] = {}
+                for column in built:
+                    entry: dict = {"type": column.kind}
+                    if column.kind == "str":
+                        entry["offsets"] = _write_section(handle, _little_endian(column.offsets))
+                        column.spool.seek(0)
+                        entry["data"] = [_pad(handle), column.offsets[-1]]
+                        shutil.copyfileobj(column.spool, handle)
+                    else:
+                        entry["data"] = _write_section(handle, _little_endian(column.integers))
+                    entry["nulls"] = _write_section(handle, bytes(column.nulls)) if any(column.nulls) else None
+                    described[column.name] = entry
+
+                index = None
+                if index_column is not None:
+                    order = array("I", sorted(range(rows), key=keys.__getitem__))
+                    index = {"column": index_column, "rows": _write_section(handle, _little_endian(order))}
+
+                footer = json.dumps(
+                    {"version": FORMAT_VERSION, "rows": rows, "order": names, "columns": described, "index": index},
+                    separators=(",", ":"),
+                ).encode("utf-8")
+                handle.write(footer)
+                handle.write(len(footer).to_bytes(8, "little"))
+                handle.write(MAGIC)
+            os.replace(tmp_path, path)
+        finally:
+            for spool in spools:
+                spool.close()
+    return rows
+
+
+def _artifact_rows(output_dir: Path, name: str, blob_store: BlobStore | None = None) -> Iterable[dict]:
+    path = find_artifact(output_dir, name)
+    return read_jsonl(path, blob_store=blob_store) if path is not None else iter(())
+
+
+def _duplicate_rows(output_dir: Path, blob_store: BlobStore | None) -> Iterable[dict]:
+    # Similarity is stored as integer parts-per-million to keep columns typed.
+    for record in _artifact_rows(output_dir, "duplicates", blob_store):
+        similarity = record.get("similarity")
+        yield {**record, "similarity_ppm": None if similarity is None else round(similarity * 1_000_000)}
+
+
+COLUMNAR_ARTIFACTS = ("poems", "duplicates", "authors")
+
+
+def remove_columnar_artifacts(output_dir: Path) -> None:
+    """Delete ``.dpcol`` files left behind by an earlier run that wrote them.
+
+    Readers prefer a ``.dpcol`` file that is not older than its JSONL
+    artifact, so a run without columnar output must not leave old ones.
+    """
+
+    for name in COLUMNAR_ARTIFACTS:
+        (output_dir / f"{name}.dpcol").unlink(missing_ok=True)
+
+
+def write_columnar_artifacts(output_dir: Path, *, blob_store: BlobStore | None = None) -> dict[str, str]:
+    """Mirror ``poems``/``duplicates``/``authors`` JSONL artifacts (in any compression) as ``.dpcol`` files.
+
+    Texts referenced through ``blob_store`` are resolved, so ``.dpcol`` files are self-contained.
+    """
+
+    written: dict[str, str] = {}
+    targets = (
+        ("poems", _artifact_rows(output_dir, "poems", blob_store), POEM_COLUMNS, "content_hash"),
+        ("duplicates", _duplicate_rows(output_dir, blob_store), DUPLICATE_COLUMNS, "content_hash"),
+        ("authors", _artifact_rows(output_dir, "authors"), AUTHOR_COLUMNS, "name"),
+    )
+    for name, records, columns, index_column in targets:
+        path = output_dir / f"{name}.dpcol"
+        write_columnar(path, records, columns, index_column=index_column)
+        written[f"{name}_columnar"] = str(path)
+    return written
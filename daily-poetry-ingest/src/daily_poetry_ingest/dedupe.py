@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import heapq
+import itertools
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 
+from daily_poetry_ingest.artifacts import ArtifactStats, JsonlWriter
+from daily_poetry_ingest.blob_store import BlobStore
 from daily_poetry_ingest.normalize import NormalizedPoem
 
+# Spilled rows are JSON arrays; these are their column positions.
+_HASH, _AUTHOR, _TITLE, _TEXT, _SEQ, _LINECOUNT, _SOURCE = range(7)
+
+# Most run files merged at once; more runs are merged in passes so open file
+# descriptors stay bounded however large the input is.
+_MAX_FAN_IN = 64
+
 
 def dedupe_poems(poems: list[NormalizedPoem]) -> tuple[list[dict], list[dict]]:
     """Split normalized poems into canonical and duplicate records.
@@ -36,3 +51,208 @@ def dedupe_poems(poems: list[NormalizedPoem]) -> tuple[list[dict], list[dict]]:
         key=lambda p: (p["author"], p["title"], p["content_hash"], p["canonical_content_hash"])
     )
     return canonical, duplicates
+
+
+@dataclass(frozen=True, slots=True)
+class DedupeSummary:
+    """Counts and canonical authors of a written poems/duplicates artifact pair."""
+
+    canonical: int
+    duplicates: int
+    authors: list[str]
+    near_duplicates: int = 0
+    artifact_stats: dict[str, ArtifactStats] = field(default_factory=dict)
+
+
+def _row_record(row: list) -> dict:
+    return {
+        "title": row[_TITLE],
+        "author": row[_AUTHOR],
+        "text": row[_TEXT],
+        "linecount": row[_LINECOUNT],
+        "content_hash": row[_HASH],
+        "source": row[_SOURCE],
+    }
+
+
+class _RunSpiller:
+    """Buffer rows, spilling each full buffer to a sorted run file."""
+
+    def __init__(self, directory: Path, prefix: str, *, key, max_rows: int) -> None:
+        self._directory = directory
+        self._prefix = prefix
+        self._key = key
+        self._max_rows = max_rows
+        self._buffer: list[list] = []
+        self._paths: list[Path] = []
+
+    def add(self, row: list) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self._max_rows:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._buffer.sort(key=self._key)
+        path = self._directory / f"{self._prefix}-{len(self._paths):05d}.jsonl"
+        with path.open("w", encoding="utf-8") as handle:
+            for row in self._buffer:
+                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._paths.append(path)
+        self._buffer = []
+
+    def _merge_runs(self, paths: list[Path]) -> Iterator[list]:
+        handles = [path.open("r", encoding="utf-8") for path in paths]
+        try:
+            runs = [map(json.loads, handle) for handle in handles]
+            yield from heapq.merge(*runs, key=self._key)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def _merge_pass(self, merge_pass: int) -> None:
+        """Merge consecutive groups of ``_MAX_FAN_IN`` runs into one run each."""
+
+        merged_paths: list[Path] = []
+        for start in range(0, len(self._paths), _MAX_FAN_IN):
+            group = self._paths[start : start + _MAX_FAN_IN]
+            path = self._directory / f"{self._prefix}-pass{merge_pass}-{len(merged_paths):05d}.jsonl"
+            with path.open("w", encoding="utf-8") as handle:
+                for row in self._merge_runs(group):
+                    handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            for run_path in group:
+                run_path.unlink()
+            merged_paths.append(path)
+        self._paths = merged_paths
+
+    def merged(self) -> Iterator[list]:
+        """Yield every row in key order, holding one row per open run file in memory.
+
+        At most ``_MAX_FAN_IN`` run files are open at once; with more runs,
+        intermediate passes merge groups of them into fewer, longer runs first.
+        """
+
+        if self._buffer:
+            self._spill()
+        merge_pass = 0
+        while len(self._paths) > _MAX_FAN_IN:
+            merge_pass += 1
+            self._merge_pass(merge_pass)
+        yield from self._merge_runs(self._paths)
+
+
+def _group_key(row: list) -> tuple:
+    return (row[_HASH], row[_AUTHOR], row[_TITLE], row[_TEXT], row[_SEQ])
+
+
+def _canonical_key(row: list) -> tuple:
+    return (row[_AUTHOR], row[_TITLE], row[_HASH])
+
+
+def _duplicate_key(row: list) -> tuple:
+    # Rows in a duplicate group share content_hash and canonical hash, so the
+    # input sequence number reproduces the stable-sort order of dedupe_poems.
+    return (row[_AUTHOR], row[_TITLE], row[_HASH], row[_SEQ])
+
+
+class StreamingDeduper:
+    """Collect normalized poems and write canonical/duplicate JSONL artifacts.
+
+    Output matches ``dedupe_poems`` byte for byte. Without ``max_in_memory``
+    everything is deduplicated in memory. With it, poems are spilled to
+    sorted run files keyed by content hash once that many are buffered; the
+    runs are k-way merged to pick winners, and winners and duplicates are
+    sorted into output order the same way, so peak memory stays bounded by
+    ``max_in_memory`` poems plus one row per open run file (at most
+    ``_MAX_FAN_IN``; more runs are merged in several passes).
+    """
+
+    def __init__(self, *, max_in_memory: int | None = None, tmp_dir: Path | None = None) -> None:
+        self._max_in_memory = max_in_memory
+        self._tmp_dir = tmp_dir
+        self._poems: list[NormalizedPoem] = []
+        self._workdir: tempfile.TemporaryDirectory | None = None
+        self._runs: _RunSpiller | None = None
+        self._seq = itertools.count()
+        self.count = 0
+
+    def add(self, poem: NormalizedPoem) -> None:
+        self.count += 1
+        if self._runs is not None:
+            self._runs.add(self._row(poem))
+            return
+        self._poems.append(poem)
+        if self._max_in_memory is not None and len(self._poems) > self._max_in_memory:
+            self._start_spilling()
+
+    def extend(self, poems: Iterable[NormalizedPoem]) -> None:
+        for poem in poems:
+            self.add(poem)
+
+    def _row(self, poem: NormalizedPoem) -> list:
+        return [poem.content_hash, poem.author, poem.title, poem.text, next(self._seq), poem.linecount, poem.source]
+
+    def _start_spilling(self) -> None:
+        if self._tmp_dir is not None:
+            self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._workdir = tempfile.TemporaryDirectory(prefix="dedupe-", dir=self._tmp_dir)
+        self._runs = _RunSpiller(
+            Path(self._workdir.name), "group", key=_group_key, max_rows=max(1, self._max_in_memory or 1)
+        )
+        buffered, self._poems = self._poems, []
+        for poem in buffered:
+            self._runs.add(self._row(poem))
+
+    def write(self, poems_path: Path, duplicates_path: Path, *, blob_store: BlobStore | None = None) -> DedupeSummary:
+        if self._runs is None:
+            canonical, duplicates = dedupe_poems(self._poems)
+            self._poems = []
+            stats = {}
+            for name, path, records in (("poems", poems_path, canonical), ("duplicates", duplicates_path, duplicates)):
+                with JsonlWriter(path, blob_store=blob_store) as writer:
+                    writer.extend(records)
+                stats[name] = writer.close()
+            authors = sorted({record["author"] for record in canonical})
+            return DedupeSummary(
+                canonical=len(canonical), duplicates=len(duplicates), authors=authors, artifact_stats=stats
+            )
+
+        try:
+            return self._write_spilled(poems_path, duplicates_path, blob_store)
+        finally:
+            self._workdir.cleanup()
+            self._workdir = None
+            self._runs = None
+
+    def _write_spilled(
+        self, poems_path: Path, duplicates_path: Path, blob_store: BlobStore | None
+    ) -> DedupeSummary:
+        workdir = Path(self._workdir.name)
+        max_rows = max(1, self._max_in_memory or 1)
+        winners = _RunSpiller(workdir, "canonical", key=_canonical_key, max_rows=max_rows)
+        losers = _RunSpiller(workdir, "duplicate", key=_duplicate_key, max_rows=max_rows)
+        # Within one content hash the merged rows arrive ordered by
+        # (author, title, text, seq), so the first row is the winner.
+        current_hash = None
+        for row in self._runs.merged():
+            if row[_HASH] != current_hash:
+                current_hash = row[_HASH]
+                winners.add(row)
+            else:
+                losers.add(row)
+
+        authors: set[str] = set()
+        with JsonlWriter(poems_path, blob_store=blob_store) as poems_writer:
+            for row in winners.merged():
+                poems_writer.write(_row_record(row))
+                authors.add(row[_AUTHOR])
+        with JsonlWriter(duplicates_path, blob_store=blob_store) as duplicates_writer:
+            for row in losers.merged():
+                record = _row_record(row)
+                record["canonical_content_hash"] = row[_HASH]
+                duplicates_writer.write(record)
+        return DedupeSummary(
+            canonical=poems_writer.records,
+            duplicates=duplicates_writer.records,
+            authors=sorted(authors),
+            artifact_stats={"poems": poems_writer.close(), "duplicates": duplicates_writer.close()},
+        )
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import csv
+import json
+import mmap
+import os
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,9 +15,10 @@ from daily_poetry_ingest.normalize import NormalizationError, NormalizedPoem, no
 
 _START_MARKER_RE = re.compile(r"\*\*\*\s*START OF (?:THE|THIS) PROJECT GUTENBERG EBOOK", re.IGNORECASE)
 _END_MARKER_RE = re.compile(r"\*\*\*\s*END OF (?:THE|THIS) PROJECT GUTENBERG EBOOK", re.IGNORECASE)
+_START_MARKER_BYTES_RE = re.compile(rb"\*\*\*\s*START OF (?:THE|THIS) PROJECT GUTENBERG EBOOK", re.IGNORECASE)
+_END_MARKER_BYTES_RE = re.compile(rb"\*\*\*\s*END OF (?:THE|THIS) PROJECT GUTENBERG EBOOK", re.IGNORECASE)
 _NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 _MULTISPACE_RE = re.compile(r"\s+")
-_WHITESPACE_LINE_RE = re.compile(r"^\s*$")
 _HEADER_STOPWORDS = {
     "contents",
     "table of contents",
@@ -37,6 +42,19 @@ _TITLE_REJECT_TERMS = (
     "volume",
     "vol.",
 )
+_TITLE_SEARCH_LINES = 140
+_MAX_POEM_TEXT_CHARS = 9000
+_MAX_POEM_LINE_CHARS = 100
+_SHORT_LINE_CHARS = 72
+_MAX_LINE_WORDS = 14
+_MIN_ALPHA_CHARS = 120
+# Bodies larger than this are first decoded only up to this many bytes.
+DEFAULT_BODY_PREFIX_BYTES = 64 * 1024
+_TEXT_NAME_RE = re.compile(r"^(pg)?(\d+)(-0)?\.txt$")
+_TEXT_INDEX_VERSION = 2
+# Bump whenever extraction or normalization rules change so incremental
+# manifests written by older code are discarded.
+GUTENBERG_EXTRACTOR_VERSION = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -118,9 +136,7 @@ def load_catalog_candidates(catalog_path: Path, *, language: str = "en") -> tupl
     return candidates, errors
 
 
-def _read_gutenberg_text(texts_dir: Path, ebook_id: int) -> str:
-    """Load Gutenberg text from known cache layouts."""
-
+def _find_gutenberg_text_path(texts_dir: Path, ebook_id: int) -> Path:
     flat_names = (f"{ebook_id}.txt", f"pg{ebook_id}.txt", f"{ebook_id}-0.txt")
     nested_names = (f"pg{ebook_id}.txt", f"{ebook_id}.txt", f"{ebook_id}-0.txt")
 
@@ -130,10 +146,235 @@ def _read_gutenberg_text(texts_dir: Path, ebook_id: int) -> str:
 
     for path in candidate_paths:
         if path.exists():
-            return path.read_text(encoding="utf-8", errors="replace")
+            return path
     raise FileNotFoundError(f"No text file found for ebook_id={ebook_id}")
 
 
+def _text_name_rank(name: str, *, nested: bool) -> tuple[int, int] | None:
+    """Return ``(ebook_id, rank)`` for a text file name, mirroring the probe order."""
+
+    match = _TEXT_NAME_RE.match(name)
+    if match is None or (match.group(1) and match.group(3)):
+        return None
+    if match.group(3):
+        rank = 2
+    elif match.group(1):
+        rank = 0 if nested else 1
+    else:
+        rank = 1 if nested else 0
+    return int(match.group(2)), rank
+
+
+def _scan_nested(
+    directory: Path,
+    ebook_id: int,
+    base_rank: int,
+    best: dict[int, tuple[int, Path]],
+    mtimes: dict[str, int],
+    relative: str,
+) -> None:
+    mtimes[relative] = directory.stat().st_mtime_ns
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            ranked = _text_name_rank(entry.name, nested=True)
+            if ranked is None or ranked[0] != ebook_id or not entry.is_file():
+                continue
+            rank = base_rank + ranked[1]
+            if ebook_id not in best or rank < best[ebook_id][0]:
+                best[ebook_id] = (rank, Path(entry.path))
+
+
+def _scan_text_index(texts_dir: Path) -> tuple[dict[int, Path], dict[str, int]]:
+    """Build the index and record the mtime of every directory the scan read.
+
+    Each mtime is taken before the directory is listed, so a change made
+    during the scan still invalidates the result next time.
+    """
+
+    best: dict[int, tuple[int, Path]] = {}
+    mtimes: dict[str, int] = {}
+    if not texts_dir.is_dir():
+        return {}, mtimes
+    mtimes[""] = texts_dir.stat().st_mtime_ns
+    with os.scandir(texts_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name.isdigit():
+                    _scan_nested(Path(entry.path), int(entry.name), 3, best, mtimes, entry.name)
+                elif entry.name == "epub":
+                    mtimes["epub"] = entry.stat().st_mtime_ns
+                    with os.scandir(entry.path) as epub_entries:
+                        for epub_entry in epub_entries:
+                            if epub_entry.name.isdigit() and epub_entry.is_dir():
+                                _scan_nested(
+                                    Path(epub_entry.path),
+                                    int(epub_entry.name),
+                                    6,
+                                    best,
+                                    mtimes,
+                                    f"epub/{epub_entry.name}",
+                                )
+                continue
+            ranked = _text_name_rank(entry.name, nested=False)
+            if ranked is None or not entry.is_file():
+                continue
+            ebook_id, rank = ranked
+            if ebook_id not in best or rank < best[ebook_id][0]:
+                best[ebook_id] = (rank, Path(entry.path))
+    return {ebook_id: path for ebook_id, (_, path) in best.items()}, mtimes
+
+
+def build_text_index(texts_dir: Path) -> dict[int, Path]:
+    """Map ebook ids to text files with one ``os.scandir`` walk.
+
+    Covers the flat (``N.txt``), nested (``N/pgN.txt``) and ``epub/N/``
+    layouts and keeps, per id, the file ``_find_gutenberg_text_path`` would
+    have picked.
+    """
+
+    return _scan_text_index(texts_dir)[0]
+
+
+def _mtimes_unchanged(texts_dir: Path, mtimes: object) -> bool:
+    if not isinstance(mtimes, dict) or "" not in mtimes:
+        return False
+    for relative, mtime in mtimes.items():
+        try:
+            if (texts_dir / relative).stat().st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def load_text_index(texts_dir: Path, *, cache_path: Path | None = None) -> dict[int, Path]:
+    """Return the text index, reusing ``cache_path`` while directory mtimes match.
+
+    The cache records the mtime of every directory the scan listed (the
+    texts root, ``epub/``, and each per-ebook directory), so adding,
+    renaming, or removing a file anywhere in the layout triggers a rescan.
+    """
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = None
+        if (
+            isinstance(cached, dict)
+            and cached.get("version") == _TEXT_INDEX_VERSION
+            and cached.get("texts_dir") == str(texts_dir.resolve())
+            and _mtimes_unchanged(texts_dir, cached.get("mtimes"))
+        ):
+            return {int(ebook_id): texts_dir / relative for ebook_id, relative in cached["paths"].items()}
+
+    index, mtimes = _scan_text_index(texts_dir)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": _TEXT_INDEX_VERSION,
+            "texts_dir": str(texts_dir.resolve()),
+            "mtimes": mtimes,
+            "paths": {str(ebook_id): str(path.relative_to(texts_dir)) for ebook_id, path in sorted(index.items())},
+        }
+        cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    return index
+
+
+def extraction_fingerprint(candidate: GutenbergCandidate, path: Path, *, max_non_empty_lines: int) -> list:
+    """Everything an extraction outcome depends on besides the extractor itself."""
+
+    stat = path.stat()
+    return [candidate.title, candidate.author, stat.st_size, stat.st_mtime_ns, max_non_empty_lines]
+
+
+def load_extraction_manifest(path: Path) -> dict[int, dict]:
+    """Return ``ebook_id -> {"fingerprint", "poems", "errors"}`` from a previous run.
+
+    Missing, unreadable, or outdated manifests yield an empty mapping.
+    """
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != GUTENBERG_EXTRACTOR_VERSION:
+        return {}
+    return {int(ebook_id): entry for ebook_id, entry in payload.get("entries", {}).items()}
+
+
+class ExtractionManifestWriter:
+    """Stream manifest entries to ``path`` one ebook at a time.
+
+    Output goes to a temporary sibling that replaces ``path`` on a clean
+    ``close``; on error the previous manifest is left untouched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._handle = self._tmp_path.open("w", encoding="utf-8")
+        self._handle.write(f'{{"version": {GUTENBERG_EXTRACTOR_VERSION}, "entries": {{')
+        self.entries = 0
+        self._closed = False
+
+    def __enter__(self) -> ExtractionManifestWriter:
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, ebook_id: int, entry: dict) -> None:
+        separator = ", " if self.entries else ""
+        self._handle.write(f"{separator}{json.dumps(str(ebook_id))}: {json.dumps(entry)}")
+        self.entries += 1
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._handle.write("}}")
+            self._handle.close()
+            os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._closed = True
+        self._handle.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def read_gutenberg_body(path: Path, *, max_prefix_bytes: int | None = DEFAULT_BODY_PREFIX_BYTES) -> tuple[str, bool]:
+    """Decode the text between the START/END markers of an ebook file.
+
+    The file is memory-mapped and the markers are located on raw bytes, so
+    only the bounded body is ever decoded. Bodies longer than
+    ``max_prefix_bytes`` are cut at the last newline inside that budget.
+    Returns ``(body, complete)`` where ``complete`` is False for a prefix.
+    """
+
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return "", True
+        with mapped:
+            start_match = _START_MARKER_BYTES_RE.search(mapped)
+            end_match = _END_MARKER_BYTES_RE.search(mapped)
+            start_index = start_match.end() if start_match else 0
+            end_index = end_match.start() if end_match else len(mapped)
+            if start_index >= end_index:
+                start_index, end_index = 0, len(mapped)
+
+            if max_prefix_bytes is not None and end_index - start_index > max_prefix_bytes:
+                cut = mapped.rfind(b"\n", start_index, start_index + max_prefix_bytes)
+                if cut > start_index:
+                    return mapped[start_index:cut].decode("utf-8", errors="replace"), False
+            return mapped[start_index:end_index].decode("utf-8", errors="replace"), True
+
+
 def _slice_between_markers(raw_text: str) -> str:
     start_match = _START_MARKER_RE.search(raw_text)
     end_match = _END_MARKER_RE.search(raw_text)
@@ -145,85 +386,243 @@ def _slice_between_markers(raw_text: str) -> str:
     return raw_text[start_index:end_index]
 
 
-def _trim_front_matter(lines: list[str], title: str, author: str) -> list[str]:
+def _is_blank(line: str) -> bool:
+    return not line or line.isspace()
+
+
+class _LineTokens:
+    """Lazily computed, memoized ``_normalize_token_string`` per line index.
+
+    The front-matter and tail scans look at overlapping lines; each line is
+    normalized at most once and blank lines skip the regex work entirely.
+    """
+
+    __slots__ = ("_lines", "_tokens")
+
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = lines
+        self._tokens: list[str | None] = [None] * len(lines)
+
+    def __getitem__(self, idx: int) -> str:
+        token = self._tokens[idx]
+        if token is None:
+            line = self._lines[idx]
+            token = "" if _is_blank(line) else _normalize_token_string(line)
+            self._tokens[idx] = token
+        return token
+
+
+def _front_matter_end(lines: list[str], tokens: _LineTokens, title: str, author: str) -> int:
+    """Return the index of the first poem line after title/byline front matter."""
+
     normalized_title = _normalize_token_string(title)
     normalized_author = _normalize_token_string(author)
-    title_index = None
+    count = len(lines)
+    start = 0
 
-    for idx, line in enumerate(lines[:140]):
-        normalized_line = _normalize_token_string(line)
+    for idx in range(min(count, _TITLE_SEARCH_LINES)):
+        normalized_line = tokens[idx]
         if not normalized_line:
             continue
         if normalized_line == normalized_title or normalized_title in normalized_line:
-            title_index = idx
+            start = idx + 1
             break
 
-    if title_index is not None:
-        lines = lines[title_index + 1 :]
-
-    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
-        lines = lines[1:]
-
-    while lines:
-        current = _normalize_token_string(lines[0])
-        if not current:
-            lines = lines[1:]
-            continue
-        if current.startswith("by ") or current == normalized_author:
-            lines = lines[1:]
+    # Blank lines and lines without letters or digits both normalize to "".
+    while start < count:
+        current = tokens[start]
+        if not current or current.startswith("by ") or current == normalized_author:
+            start += 1
             continue
         break
+    return start
 
-    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
-        lines = lines[1:]
-    return lines
 
+def _tail_cutoff(lines: list[str], tokens: _LineTokens, start: int) -> int | None:
+    """Return the index of the first appendix-style header at least 8 lines into the poem."""
 
-def _trim_tail_sections(lines: list[str]) -> list[str]:
-    cutoff = len(lines)
-    for idx, line in enumerate(lines):
-        normalized = _normalize_token_string(line)
+    for idx in range(start + 8, len(lines)):
+        normalized = tokens[idx]
         if not normalized:
             continue
         if normalized in _HEADER_STOPWORDS or normalized.startswith("chapter "):
-            if idx >= 8:
-                cutoff = idx
-                break
-    lines = lines[:cutoff]
-    while lines and _WHITESPACE_LINE_RE.match(lines[-1]):
-        lines.pop()
-    return lines
+            return idx
+    return None
 
 
-def _is_strict_poem_shape(lines: list[str], *, max_non_empty_lines: int = 120) -> bool:
-    non_empty = [line for line in lines if line.strip()]
-    if len(non_empty) < 8 or len(non_empty) > max_non_empty_lines:
-        return False
+@dataclass(frozen=True, slots=True)
+class PoemShapeProfile:
+    """Shape metrics gathered in one pass over a candidate poem region.
+
+    ``rejection`` names the strict-shape rule the region failed, or is
+    ``None`` when it passed. ``complete`` is false when the scan stopped at a
+    limit that more lines could only exceed further; the counts then cover
+    the lines up to that point.
+
+    ``alpha_chars`` is only checked against a minimum, so a ``stop_early``
+    scan stops counting letters once it has seen 120 of them; the value is
+    then a lower bound. Use ``stop_early=False`` for the exact count.
+    """
+
+    non_empty_lines: int
+    blank_lines: int
+    text_chars: int
+    short_lines: int
+    wordy_lines: int
+    max_line_chars: int
+    alpha_chars: int
+    rejection: str | None
+    complete: bool
+
+    @property
+    def passed(self) -> bool:
+        return self.rejection is None
+
+
+def _limit_rejection(
+    non_empty: int, text_chars: int, line_chars: int, short: int, wordy: int, *, max_non_empty_lines: int
+) -> str | None:
+    """Rules already broken for good: adding lines can never fix them."""
+
+    if non_empty > max_non_empty_lines:
+        return "too_many_lines"
+    if text_chars > _MAX_POEM_TEXT_CHARS:
+        return "text_too_long"
+    if line_chars > _MAX_POEM_LINE_CHARS:
+        return "line_too_long"
+    # The region can hold at most max_non_empty_lines lines, so these ratios
+    # are already out of reach.
+    if 10 * (non_empty - short) > max_non_empty_lines:
+        return "too_few_short_lines"
+    if wordy > max(1, max_non_empty_lines // 12):
+        return "too_many_wordy_lines"
+    return None
+
+
+def profile_poem_shape(
+    lines: list[str],
+    *,
+    max_non_empty_lines: int = 120,
+    start: int = 0,
+    end: int | None = None,
+    stop_early: bool = True,
+) -> PoemShapeProfile:
+    """Measure ``lines[start:end]`` against the strict poem-shape rules.
+
+    With ``stop_early`` the scan returns as soon as a rule is broken in a way
+    later lines cannot repair, so long prose regions are rejected after a
+    bounded number of lines, and ``alpha_chars`` is capped (see
+    ``PoemShapeProfile``).
+    """
+
+    end = len(lines) if end is None else end
+    non_empty = blank = text_chars = short = wordy = max_line_chars = alpha_chars = 0
+    rejection = None
+    complete = True
+
+    for idx in range(start, end):
+        line = lines[idx]
+        if not line.strip():
+            blank += 1
+            continue
+        line_chars = len(line)
+        non_empty += 1
+        text_chars += line_chars
+        if line_chars > max_line_chars:
+            max_line_chars = line_chars
+        if line_chars <= _SHORT_LINE_CHARS:
+            short += 1
+        # More than 14 words need at least 29 characters.
+        if line_chars >= 29 and len(line.split()) > _MAX_LINE_WORDS:
+            wordy += 1
+        if alpha_chars < _MIN_ALPHA_CHARS or not stop_early:
+            alpha_chars += sum(map(str.isalpha, line))
+        if stop_early:
+            rejection = _limit_rejection(
+                non_empty, text_chars, line_chars, short, wordy, max_non_empty_lines=max_non_empty_lines
+            )
+            if rejection is not None:
+                complete = False
+                break
 
-    text_length = sum(len(line) for line in non_empty)
-    if text_length < 180 or text_length > 9000:
-        return False
+    if complete:
+        if non_empty < 8 or non_empty > max_non_empty_lines:
+            rejection = "too_few_lines" if non_empty < 8 else "too_many_lines"
+        elif text_chars < 180 or text_chars > _MAX_POEM_TEXT_CHARS:
+            rejection = "text_too_short" if text_chars < 180 else "text_too_long"
+        elif short / non_empty < 0.9:
+            rejection = "too_few_short_lines"
+        elif max_line_chars > _MAX_POEM_LINE_CHARS:
+            rejection = "line_too_long"
+        elif wordy > max(1, non_empty // 12):
+            rejection = "too_many_wordy_lines"
+        elif blank < 1:
+            rejection = "no_blank_lines"
+        elif alpha_chars < _MIN_ALPHA_CHARS:
+            rejection = "too_few_letters"
+
+    return PoemShapeProfile(
+        non_empty_lines=non_empty,
+        blank_lines=blank,
+        text_chars=text_chars,
+        short_lines=short,
+        wordy_lines=wordy,
+        max_line_chars=max_line_chars,
+        alpha_chars=alpha_chars,
+        rejection=rejection,
+        complete=complete,
+    )
 
-    short_lines = sum(1 for line in non_empty if len(line) <= 72)
-    if short_lines / len(non_empty) < 0.9:
-        return False
 
-    if any(len(line) > 100 for line in non_empty):
-        return False
+def _is_strict_poem_shape(lines: list[str], *, max_non_empty_lines: int = 120) -> bool:
+    return profile_poem_shape(lines, max_non_empty_lines=max_non_empty_lines).passed
 
-    word_counts = [len(line.split()) for line in non_empty]
-    if sum(1 for count in word_counts if count > 14) > max(1, len(word_counts) // 12):
-        return False
 
-    blank_lines = len(lines) - len(non_empty)
-    if blank_lines < 1:
-        return False
+def _body_lines(body: str) -> list[str]:
+    bounded = body.replace("\r\n", "\n").replace("\r", "\n")
+    return [line.rstrip() for line in bounded.split("\n")]
 
-    alpha_chars = sum(1 for char in "\n".join(non_empty) if char.isalpha())
-    if alpha_chars < 120:
-        return False
 
-    return True
+def _extract_poem_lines(
+    lines: list[str],
+    title: str,
+    author: str,
+    *,
+    max_non_empty_lines: int,
+    is_prefix: bool = False,
+) -> tuple[list[str] | None, bool, str | None]:
+    """Apply strict extraction to body lines; return ``(poem_lines, decided, rejection)``.
+
+    For a prefix of the body the answer is only final when the tail cutoff
+    falls inside the prefix, or when the prefix alone already breaks a limit
+    that the full body could only push further (it can only add lines to the
+    poem region). ``rejection`` names the failed rule when ``poem_lines`` is
+    ``None``.
+    """
+
+    if is_prefix and len(lines) < _TITLE_SEARCH_LINES:
+        return None, False, None
+
+    tokens = _LineTokens(lines)
+    start = _front_matter_end(lines, tokens, title, author)
+    cutoff = _tail_cutoff(lines, tokens, start)
+    if is_prefix and cutoff is None:
+        profile = profile_poem_shape(lines, max_non_empty_lines=max_non_empty_lines, start=start)
+        if not profile.complete:
+            return None, True, profile.rejection
+        return None, False, None
+
+    end = len(lines) if cutoff is None else cutoff
+    while end > start and _is_blank(lines[end - 1]):
+        end -= 1
+    if start >= end:
+        return None, True, "empty_body"
+
+    poem_lines = lines[start:end]
+    profile = profile_poem_shape(poem_lines, max_non_empty_lines=max_non_empty_lines)
+    if not profile.passed:
+        return None, True, profile.rejection
+    return poem_lines, True, None
 
 
 def extract_strict_poem_lines(
@@ -235,35 +634,39 @@ def extract_strict_poem_lines(
 ) -> list[str] | None:
     """Return poem lines when text passes strict full-poem checks."""
 
-    bounded = _slice_between_markers(raw_text).replace("\r\n", "\n").replace("\r", "\n")
-    lines = [line.rstrip() for line in bounded.split("\n")]
-    lines = _trim_front_matter(lines, title, author)
-    lines = _trim_tail_sections(lines)
-
-    while lines and _WHITESPACE_LINE_RE.match(lines[0]):
-        lines = lines[1:]
-    while lines and _WHITESPACE_LINE_RE.match(lines[-1]):
-        lines.pop()
-
-    if not lines or not _is_strict_poem_shape(lines, max_non_empty_lines=max_non_empty_lines):
-        return None
-    return lines
+    lines = _body_lines(_slice_between_markers(raw_text))
+    poem_lines, _, _ = _extract_poem_lines(lines, title, author, max_non_empty_lines=max_non_empty_lines)
+    return poem_lines
 
 
-def normalize_gutenberg_candidate(
-    candidate: GutenbergCandidate,
-    raw_text: str,
+def _extract_from_file(
+    path: Path,
+    title: str,
+    author: str,
     *,
-    max_non_empty_lines: int = 120,
-) -> NormalizedPoem | NormalizationError:
-    """Normalize a strict Gutenberg candidate into canonical poem format."""
-
-    poem_lines = extract_strict_poem_lines(
-        raw_text,
-        candidate.title,
-        candidate.author,
+    max_non_empty_lines: int,
+    max_prefix_bytes: int | None = DEFAULT_BODY_PREFIX_BYTES,
+) -> tuple[list[str] | None, str | None]:
+    body, complete = read_gutenberg_body(path, max_prefix_bytes=max_prefix_bytes)
+    poem_lines, decided, rejection = _extract_poem_lines(
+        _body_lines(body),
+        title,
+        author,
         max_non_empty_lines=max_non_empty_lines,
+        is_prefix=not complete,
+    )
+    if decided:
+        return poem_lines, rejection
+    body, _ = read_gutenberg_body(path, max_prefix_bytes=None)
+    poem_lines, _, rejection = _extract_poem_lines(
+        _body_lines(body), title, author, max_non_empty_lines=max_non_empty_lines
     )
+    return poem_lines, rejection
+
+
+def _normalize_poem_lines(
+    candidate: GutenbergCandidate, poem_lines: list[str] | None
+) -> NormalizedPoem | NormalizationError:
     if poem_lines is None:
         return NormalizationError(
             reason="strict_extraction_failed",
@@ -279,39 +682,76 @@ def normalize_gutenberg_candidate(
     )
 
 
+def normalize_gutenberg_candidate(
+    candidate: GutenbergCandidate,
+    raw_text: str,
+    *,
+    max_non_empty_lines: int = 120,
+) -> NormalizedPoem | NormalizationError:
+    """Normalize a strict Gutenberg candidate into canonical poem format."""
+
+    poem_lines = extract_strict_poem_lines(
+        raw_text,
+        candidate.title,
+        candidate.author,
+        max_non_empty_lines=max_non_empty_lines,
+    )
+    return _normalize_poem_lines(candidate, poem_lines)
+
+
 def ingest_gutenberg_candidates(
     candidates: list[GutenbergCandidate],
     *,
     texts_dir: Path,
     max_non_empty_lines: int = 120,
+    text_paths: Mapping[int, Path] | None = None,
 ) -> tuple[list[NormalizedPoem], list[dict]]:
-    """Load, strictly parse, and normalize Gutenberg candidates."""
+    """Load, strictly parse, and normalize Gutenberg candidates.
+
+    When ``text_paths`` (see ``load_text_index``) is given, files are looked
+    up there instead of probing the cache layouts on disk. Ebook files are
+    read through ``read_gutenberg_body``, so oversized texts are usually
+    rejected after decoding only a bounded prefix.
+    """
 
     poems: list[NormalizedPoem] = []
     errors: list[dict] = []
 
     for candidate in candidates:
         try:
-            raw_text = _read_gutenberg_text(texts_dir, candidate.ebook_id)
+            if text_paths is None:
+                path = _find_gutenberg_text_path(texts_dir, candidate.ebook_id)
+            elif candidate.ebook_id in text_paths:
+                path = text_paths[candidate.ebook_id]
+            else:
+                raise FileNotFoundError(f"No text file found for ebook_id={candidate.ebook_id}")
         except FileNotFoundError as exc:
             errors.append({"kind": "text_missing", "ebook_id": candidate.ebook_id, "reason": str(exc)})
             continue
 
-        normalized = normalize_gutenberg_candidate(
-            candidate,
-            raw_text,
-            max_non_empty_lines=max_non_empty_lines,
-        )
-        if isinstance(normalized, NormalizationError):
-            errors.append(
-                {
-                    "kind": "extract_error",
-                    "ebook_id": candidate.ebook_id,
-                    "title": candidate.title,
-                    "author": candidate.author,
-                    "reason": normalized.reason,
-                }
+        try:
+            poem_lines, rejection = _extract_from_file(
+                path,
+                candidate.title,
+                candidate.author,
+                max_non_empty_lines=max_non_empty_lines,
             )
+        except OSError as exc:
+            # The index can name a file that was moved or removed since it was built.
+            errors.append({"kind": "text_missing", "ebook_id": candidate.ebook_id, "reason": str(exc)})
+            continue
+        normalized = _normalize_poem_lines(candidate, poem_lines)
+        if isinstance(normalized, NormalizationError):
+            error = {
+                "kind": "extract_error",
+                "ebook_id": candidate.ebook_id,
+                "title": candidate.title,
+                "author": candidate.author,
+                "reason": normalized.reason,
+            }
+            if rejection is not None:
+                error["shape_rejection"] = rejection
+            errors.append(error)
             continue
 
         poems.append(
@@ -0,0 +1,143 @@
+"""SQLite-backed HTTP response cache for upstream JSON fetches.
+
+Responses are keyed by URL. Entries younger than the TTL are served without
+touching the network; older entries are revalidated with ``If-None-Match`` /
+``If-Modified-Since`` so unchanged payloads cost a 304 instead of a download.
+In offline mode only cached entries are served, regardless of age.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import urllib.error
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+FetchFn = Callable[[dict[str, str]], tuple[int, Mapping[str, str], bytes]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a URL has no cached response."""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Stored response body with its validators."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    fetched_at: float
+
+
+class HTTPCache:
+    """Thread-safe on-disk cache shared by fetch threads and enrichment.
+
+    Several instances may point at the same file with different TTLs (for
+    example PoetryDB payloads versus slower-changing Wikipedia lookups).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float = 24 * 3600,
+        offline: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.offline = offline
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, etag, last_modified, body, fetched_at FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(url=row[0], etag=row[1], last_modified=row[2], body=bytes(row[3]), fetched_at=row[4])
+
+    def store(self, url: str, body: bytes, *, etag: str | None, last_modified: str | None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, self._clock()),
+            )
+            self._conn.commit()
+
+    def _touch(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (self._clock(), url))
+            self._conn.commit()
+
+    def get_bytes(self, url: str, fetch: FetchFn) -> bytes:
+        """Return the body for ``url``, calling ``fetch(headers)`` only when needed."""
+
+        cached = self.lookup(url)
+        if cached is not None and (self.offline or self._clock() - cached.fetched_at < self.ttl_seconds):
+            with self._lock:
+                self.hits += 1
+            return cached.body
+        if self.offline:
+            raise CacheMissError(f"No cached response for {url} (offline mode)")
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        status, response_headers, body = fetch(headers)
+        if status == 304 and cached is not None:
+            with self._lock:
+                self.revalidated += 1
+            self._touch(url)
+            return cached.body
+        if status != 200:
+            raise urllib.error.HTTPError(url, status, f"HTTP {status}", response_headers, None)
+
+        with self._lock:
+            self.misses += 1
+        self.store(url, body, etag=response_headers.get("ETag"), last_modified=response_headers.get("Last-Modified"))
+        return body
+
+    def get_json(self, url: str, fetch: FetchFn) -> Any:
+        return json.loads(self.get_bytes(url, fetch).decode("utf-8"))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
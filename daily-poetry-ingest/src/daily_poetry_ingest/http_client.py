@@ -0,0 +1,146 @@
+"""Keep-alive HTTP helpers shared by ingestion fetch stages.
+
+Only the standard library is used: ``http.client`` connections are pooled per
+host so concurrent fetch threads reuse TCP/TLS sessions instead of opening a
+new one per request.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any
+
+USER_AGENT = "daily-poetry-ingest/0.1"
+
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_received_lock = threading.Lock()
+_received_bytes = 0
+
+
+def record_bytes_received(count: int) -> None:
+    global _received_bytes
+    with _received_lock:
+        _received_bytes += count
+
+
+def bytes_received() -> int:
+    """Response body bytes received by this process through these helpers so far."""
+
+    return _received_bytes
+
+
+def urlopen_get(url: str, headers: dict[str, str], timeout_seconds: float) -> tuple[int, Any, bytes]:
+    """One-shot GET via ``urllib`` returning ``(status, headers, body)``.
+
+    HTTP error statuses are returned rather than raised so callers such as
+    the response cache can handle ``304 Not Modified`` themselves.
+    """
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **headers})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            body = response.read()
+            record_bytes_received(len(body))
+            return response.status, response.headers, body
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, b""
+
+
+class KeepAliveConnectionPool:
+    """Thread-safe pool of persistent HTTP connections keyed by host."""
+
+    def __init__(self, *, max_connections_per_host: int = 8, timeout_seconds: float = 20.0) -> None:
+        self._max_idle = max(1, max_connections_per_host)
+        self._timeout_seconds = timeout_seconds
+        self._idle: dict[tuple[str, str, int], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def _idle_queue(self, key: tuple[str, str, int]) -> queue.LifoQueue:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is None:
+                idle = queue.LifoQueue(maxsize=self._max_idle)
+                self._idle[key] = idle
+            return idle
+
+    def _new_connection(self, key: tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self._timeout_seconds)
+        return http.client.HTTPConnection(host, port, timeout=self._timeout_seconds)
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        try:
+            self._idle_queue(key).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Issue a GET and return ``(status, headers, body)``.
+
+        Idle connections that the server already closed are retried once on a
+        fresh connection; other errors propagate to the caller.
+        """
+
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme or "http"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, parsed.hostname or "", port)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += "?" + parsed.query
+        request_headers = {"User-Agent": USER_AGENT}
+        if headers:
+            request_headers.update(headers)
+
+        for attempt in range(2):
+            try:
+                connection = self._idle_queue(key).get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._new_connection(key)
+                reused = False
+            try:
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+                record_bytes_received(len(body))
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            return response.status, response.headers, body
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def get_json(self, url: str) -> Any:
+        status, headers, body = self.get(url)
+        if status != 200:
+            raise urllib.error.HTTPError(url, status, f"HTTP {status}", headers, None)
+        return json.loads(body.decode("utf-8"))
+
+    def close(self) -> None:
+        with self._lock:
+            idle_queues = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_queues:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
@@ -0,0 +1,196 @@
+"""Per-stage timing and resource metrics for ingestion runs.
+
+A ``RunTimer`` records named stages (wall time, process CPU time, CPU time
+of reaped worker processes, item counts), periodic queue-depth samples, and
+the bytes received over HTTP while the run was active. ``as_report`` is
+written to ``report.json`` under ``timings``; ``write_chrome_trace`` exports
+the same data in the Chrome trace event format (open it in
+``chrome://tracing`` or Perfetto).
+
+A stage's ``cpu_seconds`` is process CPU time, so it covers every thread in
+the main process while the stage ran; ``child_cpu_seconds`` covers worker
+processes that finished (were joined) during it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from daily_poetry_ingest.http_client import bytes_received
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+_MAX_QUEUE_SAMPLES = 512
+
+
+def _cpu_times() -> tuple[float, float]:
+    children = os.times()
+    return time.process_time(), children.children_user + children.children_system
+
+
+def _peak_rss_bytes() -> tuple[int | None, int | None]:
+    if resource is None:  # pragma: no cover - Windows
+        return None, None
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    )
+
+
+class Stage:
+    """One timed stage; set ``items`` to have a throughput reported."""
+
+    __slots__ = ("name", "start", "end", "cpu", "child_cpu", "items", "thread", "_cpu_start", "_child_cpu_start")
+
+    def __init__(self, name: str, start: float, thread: str) -> None:
+        self.name = name
+        self.start = start
+        self.end = start
+        self.cpu = 0.0
+        self.child_cpu = 0.0
+        self.items: int | None = None
+        self.thread = thread
+        self._cpu_start, self._child_cpu_start = _cpu_times()
+
+    def close(self, end: float) -> None:
+        cpu_end, child_cpu_end = _cpu_times()
+        self.end = end
+        self.cpu = cpu_end - self._cpu_start
+        self.child_cpu = child_cpu_end - self._child_cpu_start
+
+    def as_report(self) -> dict:
+        wall = self.end - self.start
+        return {
+            "wall_seconds": round(wall, 6),
+            "cpu_seconds": round(self.cpu, 6),
+            "child_cpu_seconds": round(self.child_cpu, 6),
+            "items": self.items,
+            "items_per_second": round(self.items / wall, 3) if self.items is not None and wall > 0 else None,
+        }
+
+
+class RunTimer:
+    """Collect stage timings, queue depths, and transfer totals for one run."""
+
+    def __init__(self, *, queue_sample_interval: float = 0.1) -> None:
+        self._origin = time.perf_counter()
+        self._bytes_origin = bytes_received()
+        self._stages: list[Stage] = []
+        self._queues: dict[str, list[tuple[float, int]]] = {}
+        self._sample_interval = queue_sample_interval
+        self._last_sample = float("-inf")
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def start(self, name: str, *, thread: str = "main") -> Stage:
+        """Open a stage that may overlap others; close it with ``finish``."""
+
+        return Stage(name, self.now(), thread)
+
+    def finish(self, stage: Stage, *, items: int | None = None) -> None:
+        stage.close(self.now())
+        if items is not None:
+            stage.items = items
+        with self._lock:
+            self._stages.append(stage)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """Time the enclosed block as one stage."""
+
+        stage = self.start(name)
+        try:
+            yield stage
+        finally:
+            self.finish(stage)
+
+    def sample_queues(self, depths: dict[str, int | None], *, force: bool = False) -> None:
+        """Record queue depths, at most once per sampling interval unless ``force``d."""
+
+        now = self.now()
+        if not force and now - self._last_sample < self._sample_interval:
+            return
+        self._last_sample = now
+        for name, depth in depths.items():
+            if depth is None:
+                continue
+            samples = self._queues.setdefault(name, [])
+            samples.append((now, depth))
+            if len(samples) > _MAX_QUEUE_SAMPLES:
+                # Halve the resolution rather than grow without bound.
+                del samples[1::2]
+                self._sample_interval *= 2
+
+    def as_report(self) -> dict:
+        peak_rss, peak_child_rss = _peak_rss_bytes()
+        with self._lock:
+            stages = sorted(self._stages, key=lambda stage: stage.start)
+        return {
+            "total_wall_seconds": round(self.now(), 6),
+            "stages": {stage.name: stage.as_report() for stage in stages},
+            "queue_depths": {
+                name: {
+                    "max": max(depth for _, depth in samples),
+                    "mean": round(sum(depth for _, depth in samples) / len(samples), 3),
+                    "samples": [[round(at, 3), depth] for at, depth in samples],
+                }
+                for name, samples in self._queues.items()
+            },
+            "bytes_fetched": bytes_received() - self._bytes_origin,
+            "peak_rss_bytes": peak_rss,
+            "peak_child_rss_bytes": peak_child_rss,
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        pid = os.getpid()
+        threads: dict[str, int] = {}
+        events: list[dict] = []
+        with self._lock:
+            stages = sorted(self._stages, key=lambda stage: stage.start)
+        for stage in stages:
+            tid = threads.setdefault(stage.thread, len(threads))
+            events.append(
+                {
+                    "name": stage.name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": round(stage.start * 1e6),
+                    "dur": round((stage.end - stage.start) * 1e6),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": stage.as_report(),
+                }
+            )
+        for name, tid in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+        for name, samples in self._queues.items():
+            for at, depth in samples:
+                events.append({"name": name, "ph": "C", "ts": round(at * 1e6), "pid": pid, "args": {"depth": depth}})
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def queue_depth(message_queue) -> int | None:
+    """``qsize()`` where the platform supports it (macOS multiprocessing queues do not)."""
+
+    try:
+        return message_queue.qsize()
+    except NotImplementedError:  # pragma: no cover - macOS
+        return None
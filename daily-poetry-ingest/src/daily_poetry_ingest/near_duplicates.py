@@ -0,0 +1,238 @@
+"""Near-duplicate poem detection with MinHash signatures and LSH banding.
+
+Exact dedupe only merges byte-identical canonical texts. Versions of the same
+poem from different sources usually differ in punctuation, spelling, or
+stanza breaks, so canonical poems are compared on word shingles instead:
+each poem gets a MinHash signature, signatures are split into bands, and
+only poems sharing a band bucket are compared, which keeps the work close to
+linear in corpus size.
+
+Signatures use one-permutation hashing with rotation densification: every
+shingle is hashed once and binned, instead of being re-hashed per signature
+slot, which keeps signature cost linear in poem length in pure Python.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+from daily_poetry_ingest.artifacts import read_jsonl, write_jsonl
+from daily_poetry_ingest.blob_store import BlobStore
+from daily_poetry_ingest.dedupe import DedupeSummary
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _shingle_hashes(text: str, shingle_size: int) -> set[int]:
+    """Hash word shingles of ``text`` after dropping case, punctuation, and layout."""
+
+    words = _WORD_RE.findall(text.lower())
+    size = min(shingle_size, len(words))
+    if size == 0:
+        return set()
+    return {_hash64(" ".join(words[idx : idx + size])) for idx in range(len(words) - size + 1)}
+
+
+def minhash_signature(
+    text: str,
+    *,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+) -> tuple[int, ...] | None:
+    """Return the MinHash signature of ``text``, or ``None`` when it has no words."""
+
+    hashes = _shingle_hashes(text, shingle_size)
+    if not hashes:
+        return None
+
+    bins: list[int | None] = [None] * num_perm
+    for value in hashes:
+        slot = value % num_perm
+        rank = value // num_perm
+        current = bins[slot]
+        if current is None or rank < current:
+            bins[slot] = rank
+
+    # An empty bin borrows the nearest non-empty bin to its right (wrapping
+    # around), offset by the distance so borrowed values never equal native ones.
+    offset = (1 << 64) // num_perm + 1
+    signature = list(bins)
+    nearest = None
+    distance = 0
+    for slot in list(range(num_perm - 1, -1, -1)) * 2:
+        if bins[slot] is not None:
+            nearest, distance = bins[slot], 0
+        else:
+            distance += 1
+            if nearest is not None:
+                signature[slot] = nearest + distance * offset
+    return tuple(signature)
+
+
+def estimate_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity: the fraction of matching signature slots."""
+
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def _find(parents: list[int], item: int) -> int:
+    while parents[item] != item:
+        parents[item] = parents[parents[item]]
+        item = parents[item]
+    return item
+
+
+def cluster_signatures(
+    signatures: Sequence[tuple[int, ...] | None],
+    *,
+    threshold: float,
+    bands: int = DEFAULT_BANDS,
+) -> list[list[int]]:
+    """Group signature indices whose estimated similarity reaches ``threshold``.
+
+    Candidate pairs come from LSH buckets (one per band); every pair in a
+    bucket that is not already in one cluster is verified on the full
+    signature before clusters are joined, so the result does not depend on
+    input order. Clusters are connected components of verified pairs, so two
+    members may only be linked through others. Returns clusters of two or
+    more indices, each sorted, in order of their smallest index.
+    """
+
+    parents = list(range(len(signatures)))
+    for band in range(bands):
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        for idx, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            rows = len(signature) // bands
+            buckets.setdefault(signature[band * rows : (band + 1) * rows], []).append(idx)
+        for members in buckets.values():
+            for position, left in enumerate(members):
+                for right in members[position + 1 :]:
+                    root_left, root_right = _find(parents, left), _find(parents, right)
+                    if root_left == root_right:
+                        continue
+                    if estimate_similarity(signatures[left], signatures[right]) >= threshold:
+                        parents[root_right] = root_left
+
+    clusters: dict[int, list[int]] = {}
+    for idx in range(len(signatures)):
+        clusters.setdefault(_find(parents, idx), []).append(idx)
+    return sorted((members for members in clusters.values() if len(members) > 1), key=lambda members: members[0])
+
+
+def _duplicate_sort_key(record: dict) -> tuple:
+    return (record["author"], record["title"], record["content_hash"], record["canonical_content_hash"])
+
+
+def dedupe_near_duplicates(
+    poems_path: Path,
+    duplicates_path: Path,
+    *,
+    threshold: float = 0.8,
+    num_perm: int = DEFAULT_NUM_PERM,
+    bands: int = DEFAULT_BANDS,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    blob_store: BlobStore | None = None,
+) -> DedupeSummary:
+    """Move near-duplicate canonical poems into the duplicates artifact.
+
+    Within each cluster the winner is chosen by the exact-dedupe rule (the
+    smallest ``(author, title, text)``); members whose estimated similarity to
+    it reaches ``threshold`` are written to ``duplicates.jsonl`` with
+    ``kind: "near_duplicate"``, the winner's ``canonical_content_hash``, and
+    that ``similarity``. Members only chained to the winner through others
+    are not moved with it; the same rule is applied again to them, so every
+    recorded ``similarity`` reaches ``threshold``.
+    Exact duplicates that pointed at a loser are re-pointed to its winner, so
+    every ``canonical_content_hash`` stays in ``poems.jsonl``. Both files keep
+    their usual sort order. Only signatures are held for the
+    whole corpus; texts are re-read for cluster members.
+
+    Artifacts written with a ``blob_store`` are read and rewritten through it.
+    Returns the summary of the rewritten artifacts, including how many poems
+    were moved.
+    """
+
+    if bands < 1 or num_perm % bands:
+        raise ValueError("num_perm must be a positive multiple of bands")
+
+    signatures = [
+        minhash_signature(record["text"], num_perm=num_perm, shingle_size=shingle_size)
+        for record in read_jsonl(poems_path, blob_store=blob_store)
+    ]
+    clusters = cluster_signatures(signatures, threshold=threshold, bands=bands)
+    cluster_of = {idx: cluster_id for cluster_id, members in enumerate(clusters) for idx in members}
+
+    members_by_cluster: list[list[tuple[int, dict]]] = [[] for _ in clusters]
+    for idx, record in enumerate(read_jsonl(poems_path, blob_store=blob_store)):
+        if idx in cluster_of:
+            members_by_cluster[cluster_of[idx]].append((idx, record))
+
+    losers: set[int] = set()
+    winner_of: dict[str, str] = {}
+    near_duplicates: list[dict] = []
+    for members in members_by_cluster:
+        remaining = sorted(members, key=lambda item: (item[1]["author"], item[1]["title"], item[1]["text"]))
+        while len(remaining) > 1:
+            (winner_idx, winner), candidates = remaining[0], remaining[1:]
+            remaining = []
+            for idx, record in candidates:
+                similarity = estimate_similarity(signatures[idx], signatures[winner_idx])
+                if similarity < threshold:
+                    remaining.append((idx, record))
+                    continue
+                losers.add(idx)
+                winner_of[record["content_hash"]] = winner["content_hash"]
+                near_duplicates.append(
+                    {
+                        **record,
+                        "canonical_content_hash": winner["content_hash"],
+                        "kind": "near_duplicate",
+                        "similarity": round(similarity, 4),
+                    }
+                )
+    near_duplicates.sort(key=_duplicate_sort_key)
+
+    authors: set[str] = set()
+
+    def kept_poems() -> Iterator[dict]:
+        for idx, record in enumerate(read_jsonl(poems_path)):
+            if idx not in losers:
+                authors.add(record["author"])
+                yield record
+
+    def existing_duplicates() -> Iterator[dict]:
+        # Records sharing (author, title, content_hash) share a canonical, so
+        # re-pointing the last sort-key field keeps the stream sorted.
+        for record in read_jsonl(duplicates_path):
+            canonical_hash = record["canonical_content_hash"]
+            if canonical_hash in winner_of:
+                record = {**record, "canonical_content_hash": winner_of[canonical_hash]}
+            yield record
+
+    poems_stats = write_jsonl(poems_path, kept_poems(), blob_store=blob_store)
+    duplicates_stats = write_jsonl(
+        duplicates_path,
+        heapq.merge(existing_duplicates(), near_duplicates, key=_duplicate_sort_key),
+        blob_store=blob_store,
+    )
+    return DedupeSummary(
+        canonical=poems_stats.records,
+        duplicates=duplicates_stats.records,
+        authors=sorted(authors),
+        near_duplicates=len(near_duplicates),
+        artifact_stats={"poems": poems_stats, "duplicates": duplicates_stats},
+    )
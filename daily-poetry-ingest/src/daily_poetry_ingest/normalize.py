@@ -7,8 +7,16 @@ pipeline and exercised by tests.
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+# hashlib releases the GIL while hashing buffers larger than this many bytes.
+_GIL_RELEASE_BYTES = 2048
+# Bump whenever normalization rules change so incremental manifests written
+# by older code are discarded and their authors re-normalized.
+NORMALIZER_VERSION = 1
+
 
 @dataclass(frozen=True, slots=True)
 class NormalizedPoem:
@@ -30,12 +38,6 @@ class NormalizationError:
     input_record: dict
 
 
-def _clean_line(value: object) -> str:
-    if not isinstance(value, str):
-        raise ValueError("line is not a string")
-    return value.rstrip()
-
-
 def canonical_text(lines: list[object]) -> str:
     """Build canonical poem text while preserving stanza breaks.
 
@@ -44,7 +46,10 @@ def canonical_text(lines: list[object]) -> str:
     - Removes trailing blank lines at EOF.
     """
 
-    cleaned = [_clean_line(line) for line in lines]
+    try:
+        cleaned = list(map(str.rstrip, lines))
+    except TypeError:
+        raise ValueError("line is not a string") from None
     while cleaned and cleaned[-1] == "":
         cleaned.pop()
     return "\n".join(cleaned)
@@ -56,8 +61,8 @@ def compute_content_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def normalize_record(record: dict) -> NormalizedPoem | NormalizationError:
-    """Normalize a raw PoetryDB record into a canonical shape."""
+def _canonical_fields(record: dict) -> tuple[str, str, str] | NormalizationError:
+    """Validate ``record`` and return its stripped ``(title, author, text)``."""
 
     title = record.get("title")
     author = record.get("author")
@@ -78,11 +83,82 @@ def normalize_record(record: dict) -> NormalizedPoem | NormalizationError:
     if not text:
         return NormalizationError(reason="empty_text", input_record=record)
 
+    return title.strip(), author.strip(), text
+
+
+def normalize_record(record: dict) -> NormalizedPoem | NormalizationError:
+    """Normalize a raw PoetryDB record into a canonical shape."""
+
+    fields = _canonical_fields(record)
+    if isinstance(fields, NormalizationError):
+        return fields
+    title, author, text = fields
+
     linecount = text.count("\n") + 1
     return NormalizedPoem(
-        title=title.strip(),
-        author=author.strip(),
+        title=title,
+        author=author,
         text=text,
         linecount=linecount,
         content_hash=compute_content_hash(text),
     )
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedBatch:
+    """Result of ``normalize_records``: poems and errors, each in input order."""
+
+    poems: list[NormalizedPoem]
+    errors: list[NormalizationError]
+
+
+def _hash_buffers(buffers: list[bytes]) -> list[str]:
+    return [hashlib.sha256(buffer).hexdigest() for buffer in buffers]
+
+
+def normalize_records(records: Sequence[dict], *, workers: int = 1) -> NormalizedBatch:
+    """Normalize a batch of raw records; equivalent to ``normalize_record`` on each.
+
+    Validation and canonical text run on the calling thread. Content hashes
+    are then computed over the UTF-8 buffers; with ``workers > 1``, buffers
+    large enough for ``hashlib`` to release the GIL are split across a thread
+    pool while small ones are hashed inline, where threads would only contend.
+    """
+
+    errors: list[NormalizationError] = []
+    prepared: list[tuple[str, str, str]] = []
+    for record in records:
+        fields = _canonical_fields(record)
+        if isinstance(fields, NormalizationError):
+            errors.append(fields)
+        else:
+            prepared.append(fields)
+
+    buffers = [text.encode("utf-8") for _, _, text in prepared]
+    large = [idx for idx, buffer in enumerate(buffers) if len(buffer) > _GIL_RELEASE_BYTES]
+    if workers > 1 and len(large) > 1:
+        digests: list[str | None] = [None] * len(buffers)
+        large_set = set(large)
+        for idx, buffer in enumerate(buffers):
+            if idx not in large_set:
+                digests[idx] = hashlib.sha256(buffer).hexdigest()
+        slices = [large[offset::workers] for offset in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashed = pool.map(_hash_buffers, [[buffers[idx] for idx in part] for part in slices])
+            for part, part_digests in zip(slices, hashed):
+                for idx, digest in zip(part, part_digests):
+                    digests[idx] = digest
+    else:
+        digests = _hash_buffers(buffers)
+
+    poems = [
+        NormalizedPoem(
+            title=title,
+            author=author,
+            text=text,
+            linecount=text.count("\n") + 1,
+            content_hash=digest,
+        )
+        for (title, author, text), digest in zip(prepared, digests)
+    ]
+    return NormalizedBatch(poems=poems, errors=errors)
@@ -1,22 +1,59 @@
-"""Multiprocess PoetryDB ingestion pipeline."""
+"""PoetryDB and Gutenberg ingestion pipelines.
+
+PoetryDB fetches are I/O-bound and run on threads sharing a keep-alive
+connection pool; normalization is CPU-bound and runs on worker processes.
+"""
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import multiprocessing as mp
+import os
 import queue
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.request
+from collections import Counter
+from collections.abc import Iterator, Mapping
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
-from daily_poetry_ingest.author_images import enrich_authors
-from daily_poetry_ingest.dedupe import dedupe_poems
-from daily_poetry_ingest.gutenberg import ingest_gutenberg_candidates, load_catalog_candidates
-from daily_poetry_ingest.normalize import NormalizationError, NormalizedPoem, normalize_record
+from daily_poetry_ingest.artifacts import (
+    ArtifactStats,
+    artifact_path,
+    check_compression,
+    find_artifact,
+    read_jsonl,
+    remove_other_encodings,
+    write_jsonl,
+)
+from daily_poetry_ingest.author_images import WIKIPEDIA_API, enrich_authors
+from daily_poetry_ingest.blob_store import TEXT_REF, BlobStore
+from daily_poetry_ingest.columnar import remove_columnar_artifacts, write_columnar_artifacts
+from daily_poetry_ingest.dedupe import DedupeSummary, StreamingDeduper
+from daily_poetry_ingest.gutenberg import (
+    ExtractionManifestWriter,
+    GutenbergCandidate,
+    extraction_fingerprint,
+    ingest_gutenberg_candidates,
+    load_catalog_candidates,
+    load_extraction_manifest,
+    load_text_index,
+)
+from daily_poetry_ingest.http_cache import CacheMissError, HTTPCache
+from daily_poetry_ingest.http_client import USER_AGENT, KeepAliveConnectionPool, record_bytes_received, urlopen_get
+from daily_poetry_ingest.instrumentation import RunTimer, queue_depth
+from daily_poetry_ingest.near_duplicates import dedupe_near_duplicates
+from daily_poetry_ingest.normalize import NORMALIZER_VERSION, NormalizedPoem, normalize_records
+from daily_poetry_ingest.ratelimit import TokenBucket
+
+
+_DEFAULT_FETCH_CONCURRENCY = 8
 
 
 class _ProgressRenderer:
@@ -72,18 +109,49 @@ class _ProgressRenderer:
             sys.stderr.flush()
 
 
-def _fetch_json(url: str, timeout_seconds: float) -> Any:
-    request = urllib.request.Request(url, headers={"User-Agent": "daily-poetry-ingest/0.1"})
+def _fetch_json(
+    url: str,
+    timeout_seconds: float,
+    pool: KeepAliveConnectionPool | None = None,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> Any:
+    def fetch(headers: dict[str, str]) -> tuple[int, Any, bytes]:
+        # Only requests that reach the network spend rate-limit tokens.
+        if limiter is not None:
+            limiter.acquire()
+        if pool is not None:
+            return pool.get(url, headers)
+        return urlopen_get(url, headers, timeout_seconds)
+
+    if cache is not None:
+        return cache.get_json(url, fetch)
+    if limiter is not None:
+        limiter.acquire()
+    if pool is not None:
+        return pool.get_json(url)
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-        data = response.read().decode("utf-8")
-        return json.loads(data)
+        body = response.read()
+    record_bytes_received(len(body))
+    return json.loads(body.decode("utf-8"))
 
 
-def _fetch_with_retry(url: str, timeout_seconds: float, retries: int, backoff_seconds: float) -> Any:
+def _fetch_with_retry(
+    url: str,
+    timeout_seconds: float,
+    retries: int,
+    backoff_seconds: float,
+    pool: KeepAliveConnectionPool | None = None,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> Any:
     last_error: Exception | None = None
     for attempt in range(retries + 1):
         try:
-            return _fetch_json(url, timeout_seconds)
+            return _fetch_json(url, timeout_seconds, pool, cache, limiter)
+        except CacheMissError:
+            raise
         except Exception as exc:  # pragma: no cover - network behavior varies
             last_error = exc
             if attempt < retries:
@@ -92,26 +160,150 @@ def _fetch_with_retry(url: str, timeout_seconds: float, retries: int, backoff_se
     raise last_error
 
 
-def fetch_authors(base_url: str, timeout_seconds: float, retries: int, backoff_seconds: float) -> list[str]:
+def fetch_authors(
+    base_url: str,
+    timeout_seconds: float,
+    retries: int,
+    backoff_seconds: float,
+    pool: KeepAliveConnectionPool | None = None,
+    cache: HTTPCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> list[str]:
     payload = _fetch_with_retry(
-        f"{base_url}/author", timeout_seconds=timeout_seconds, retries=retries, backoff_seconds=backoff_seconds
+        f"{base_url}/author",
+        timeout_seconds=timeout_seconds,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        pool=pool,
+        cache=cache,
+        limiter=limiter,
     )
     authors = payload.get("authors", []) if isinstance(payload, dict) else []
     return [author for author in authors if isinstance(author, str) and author.strip()]
 
 
+class _AuthorEnrichmentStage:
+    """Enrich authors on a background thread while poems are fetched and normalized.
+
+    Enrichment starts from the names known up front (the PoetryDB author list
+    or the Gutenberg catalog candidates). ``join`` waits for it, enriches any
+    canonical author that was not in the initial list, and keeps only records
+    for the authors that actually made it into the canonical set. Both passes
+    use the ``limiter`` in ``enrich_kwargs``, which callers share with any
+    other requests made during the run.
+    """
+
+    def __init__(self, authors: list[str], *, timer: RunTimer | None = None, **enrich_kwargs: Any) -> None:
+        self._authors = sorted({author.strip() for author in authors if author.strip()})
+        self._timer = timer
+        self._enrich_kwargs = enrich_kwargs
+        self._result: tuple[list[dict], list[dict]] | None = None
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="author-enrichment", daemon=True)
+
+    def start(self) -> "_AuthorEnrichmentStage":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        stage = self._timer.start("enrich_authors", thread="author-enrichment") if self._timer else None
+        try:
+            self._result = enrich_authors(self._authors, **self._enrich_kwargs)
+        except BaseException as exc:  # pragma: no cover - surfaced by join
+            self._error = exc
+        finally:
+            if stage is not None:
+                self._timer.finish(stage, items=len(self._authors))
+
+    def join(self, canonical_authors: list[str]) -> tuple[list[dict], list[dict]]:
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        assert self._result is not None
+        records, errors = self._result
+
+        wanted = set(canonical_authors)
+        known = set(self._authors)
+        missing = [author for author in canonical_authors if author not in known]
+        if missing:
+            extra_records, extra_errors = enrich_authors(missing, **self._enrich_kwargs)
+            records = records + extra_records
+            errors = errors + extra_errors
+
+        records = sorted((record for record in records if record.get("name") in wanted), key=lambda r: r["name"])
+        errors = [error for error in errors if error.get("author") in wanted]
+        return records, errors
+
+
+def _estimate_record_bytes(record: dict) -> int:
+    size = 0
+    for key in ("title", "author"):
+        value = record.get(key)
+        if isinstance(value, str):
+            size += len(value)
+    lines = record.get("lines")
+    if isinstance(lines, list):
+        size += sum(len(line) + 1 for line in lines if isinstance(line, str))
+    return size
+
+
+def _batch_records(records: list[dict], max_records: int, max_bytes: int) -> list[list[dict]]:
+    """Group records into batches bounded by record count and approximate size."""
+
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    current_bytes = 0
+    for record in records:
+        record_bytes = _estimate_record_bytes(record)
+        if current and (
+            len(current) >= max_records or (max_bytes > 0 and current_bytes + record_bytes > max_bytes)
+        ):
+            batches.append(current)
+            current = []
+            current_bytes = 0
+        current.append(record)
+        current_bytes += record_bytes
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _encode_poem(poem: NormalizedPoem) -> tuple:
+    return (poem.title, poem.author, poem.text, poem.linecount, poem.content_hash, poem.source)
+
+
+def _decode_poem(encoded: tuple) -> NormalizedPoem:
+    return NormalizedPoem(*encoded)
+
+
+def _payload_fingerprint(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 def _fetch_worker(
     base_url: str,
-    author_queue: mp.Queue,
+    author_queue: queue.Queue,
     raw_queue: mp.Queue,
     error_queue: mp.Queue,
-    fetch_progress_queue: mp.Queue,
+    fetch_progress_queue: queue.Queue,
     timeout_seconds: float,
     retries: int,
     backoff_seconds: float,
-    rate_limit_rps: float,
+    pool: KeepAliveConnectionPool,
+    limiter: TokenBucket,
+    batch_size: int = 64,
+    batch_max_bytes: int = 1_000_000,
+    cache: HTTPCache | None = None,
+    previous_fingerprints: Mapping[str, str] | None = None,
 ) -> None:
-    delay = 1.0 / rate_limit_rps if rate_limit_rps > 0 else 0.0
+    """Fetch thread body: pull authors until the ``None`` sentinel arrives.
+
+    Record batches go to the normalizers as ``(author, records)``. With
+    ``previous_fingerprints`` (incremental mode) each payload is fingerprinted
+    and an author whose payload is unchanged is not sent for normalization.
+    """
+
     while True:
         author = author_queue.get()
         if author is None:
@@ -119,45 +311,59 @@ def _fetch_worker(
 
         url_author = urllib.parse.quote(author, safe="")
         endpoint = f"{base_url}/author/{url_author}"
+        fingerprint = None
+        unchanged = False
         try:
-            payload = _fetch_with_retry(endpoint, timeout_seconds, retries, backoff_seconds)
+            payload = _fetch_with_retry(endpoint, timeout_seconds, retries, backoff_seconds, pool, cache, limiter)
             if isinstance(payload, list):
-                for record in payload:
-                    if isinstance(record, dict):
-                        raw_queue.put(record)
+                if previous_fingerprints is not None:
+                    fingerprint = _payload_fingerprint(payload)
+                    unchanged = previous_fingerprints.get(author) == fingerprint
+                if not unchanged:
+                    records = [record for record in payload if isinstance(record, dict)]
+                    for batch in _batch_records(records, batch_size, batch_max_bytes):
+                        raw_queue.put((author, batch))
             else:
                 error_queue.put({"kind": "fetch_error", "author": author, "reason": "unexpected_payload"})
         except Exception as exc:  # pragma: no cover - network behavior varies
             error_queue.put({"kind": "fetch_error", "author": author, "reason": str(exc)})
         finally:
-            fetch_progress_queue.put({"kind": "fetch_done"})
-
-        if delay > 0:
-            time.sleep(delay)
+            fetch_progress_queue.put(
+                {"kind": "fetch_done", "author": author, "fingerprint": fingerprint, "unchanged": unchanged}
+            )
 
 
 def _normalize_worker(raw_queue: mp.Queue, normalized_queue: mp.Queue, error_queue: mp.Queue) -> None:
+    """Normalize record batches, replying with one message per batch.
+
+    Poems travel back as compact field tuples (see ``_encode_poem``) and
+    normalization errors ride along in the same message, tagged with the
+    author whose payload the batch came from.
+    """
+
     while True:
-        record = raw_queue.get()
-        if record is None:
+        item = raw_queue.get()
+        if item is None:
             normalized_queue.put({"kind": "normalize_worker_done"})
             return
 
-        result = normalize_record(record)
-        if isinstance(result, NormalizationError):
-            error_queue.put(
-                {
-                    "kind": "normalize_error",
-                    "reason": result.reason,
-                    "title": record.get("title"),
-                    "author": record.get("author"),
-                }
-            )
-        else:
-            normalized_queue.put({"kind": "normalized", "payload": asdict(result)})
+        author, batch = item
 
+        result = normalize_records(batch)
+        poems = [_encode_poem(poem) for poem in result.poems]
+        errors = [
+            {
+                "kind": "normalize_error",
+                "reason": error.reason,
+                "title": error.input_record.get("title"),
+                "author": error.input_record.get("author"),
+            }
+            for error in result.errors
+        ]
+        normalized_queue.put({"kind": "normalized_batch", "author": author, "poems": poems, "errors": errors})
 
-def _drain_queue(message_queue: mp.Queue) -> list[dict]:
+
+def _drain_queue(message_queue: mp.Queue | queue.Queue) -> list[dict]:
     items: list[dict] = []
     while True:
         try:
@@ -167,30 +373,76 @@ def _drain_queue(message_queue: mp.Queue) -> list[dict]:
     return items
 
 
-def _write_jsonl(path: Path, records: list[dict]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for record in records:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+def _write_deduped(
+    deduper: StreamingDeduper,
+    output_dir: Path,
+    *,
+    near_duplicate_threshold: float | None = None,
+    compression: str = "none",
+    blob_store: BlobStore | None = None,
+) -> DedupeSummary:
+    """Write ``poems.jsonl`` and ``duplicates.jsonl`` from the collected poems.
+
+    With ``near_duplicate_threshold`` the exact-dedupe output is then passed
+    through the MinHash/LSH near-duplicate stage. ``compression`` selects the
+    artifact encoding (see ``artifacts``); copies left in another encoding
+    by earlier runs are removed. With ``blob_store`` poem texts are written
+    to the store and referenced from the artifacts.
+    """
+
+    poems_path = artifact_path(output_dir, "poems", compression)
+    duplicates_path = artifact_path(output_dir, "duplicates", compression)
+    summary = deduper.write(poems_path, duplicates_path, blob_store=blob_store)
+    if near_duplicate_threshold is not None:
+        summary = dedupe_near_duplicates(
+            poems_path, duplicates_path, threshold=near_duplicate_threshold, blob_store=blob_store
+        )
+    remove_other_encodings(output_dir, "poems", compression)
+    remove_other_encodings(output_dir, "duplicates", compression)
+    return summary
+
+
+def _artifact_bytes(stats: Mapping[str, ArtifactStats]) -> dict:
+    report = {name: item.as_report() for name, item in stats.items()}
+    total = ArtifactStats(
+        path="",
+        records=sum(item.records for item in stats.values()),
+        raw_bytes=sum(item.raw_bytes for item in stats.values()),
+        written_bytes=sum(item.written_bytes for item in stats.values()),
+    )
+    report["total"] = total.as_report()
+    return report
 
 
 def _build_report(
     *,
     source: str,
     output_dir: Path,
-    canonical: list[dict],
-    duplicates: list[dict],
+    dedupe: DedupeSummary,
     author_records: list[dict],
     errors: list[dict],
     extra_metrics: dict | None = None,
+    columnar: bool = False,
+    compression: str = "none",
+    blob_store: BlobStore | None = None,
+    timer: RunTimer | None = None,
+    trace_path: Path | None = None,
 ) -> dict:
-    poems_path = output_dir / "poems.jsonl"
-    duplicates_path = output_dir / "duplicates.jsonl"
-    authors_path = output_dir / "authors.jsonl"
+    """Write ``authors.jsonl`` and ``report.json`` (plus optional columnar files).
+
+    The report's ``timings`` section comes from ``timer`` (see
+    ``instrumentation``); ``trace_path`` also receives it as a Chrome trace.
+    """
+
+    timer = timer or RunTimer()
+    stage = timer.start("write_artifacts")
+    poems_path = artifact_path(output_dir, "poems", compression)
+    duplicates_path = artifact_path(output_dir, "duplicates", compression)
+    authors_path = artifact_path(output_dir, "authors", compression)
     report_path = output_dir / "report.json"
 
-    _write_jsonl(poems_path, canonical)
-    _write_jsonl(duplicates_path, duplicates)
-    _write_jsonl(authors_path, author_records)
+    authors_stats = write_jsonl(authors_path, author_records)
+    remove_other_encodings(output_dir, "authors", compression)
 
     report = {
         "source": source,
@@ -204,8 +456,9 @@ def _build_report(
             for record in author_records
             if not (isinstance(record.get("bio_short"), str) and record["bio_short"].strip())
         ),
-        "canonical_poems": len(canonical),
-        "duplicates": len(duplicates),
+        "canonical_poems": dedupe.canonical,
+        "duplicates": dedupe.duplicates,
+        "near_duplicates": dedupe.near_duplicates,
         "errors": errors,
         "artifacts": {
             "poems": str(poems_path),
@@ -213,9 +466,22 @@ def _build_report(
             "authors": str(authors_path),
             "report": str(report_path),
         },
+        "compression": compression,
+        "artifact_bytes": _artifact_bytes({**dedupe.artifact_stats, "authors": authors_stats}),
     }
+    if columnar:
+        report["artifacts"].update(write_columnar_artifacts(output_dir, blob_store=blob_store))
+    else:
+        remove_columnar_artifacts(output_dir)
+    if blob_store is not None:
+        report["blob_store"] = blob_store.stats()
     if extra_metrics:
         report.update(extra_metrics)
+    timer.finish(stage, items=len(author_records))
+    report["timings"] = timer.as_report()
+    if trace_path is not None:
+        timer.write_chrome_trace(trace_path)
+        report["artifacts"]["trace"] = str(trace_path)
 
     with report_path.open("w", encoding="utf-8") as handle:
         json.dump(report, handle, indent=2)
@@ -224,6 +490,172 @@ def _build_report(
     return report
 
 
+def _extract_gutenberg_chunk(
+    task: tuple[list[GutenbergCandidate], dict[int, Path]],
+    *,
+    texts_dir: Path,
+    max_non_empty_lines: int,
+) -> list[tuple[list[NormalizedPoem], list[dict]]]:
+    """Extract a chunk, returning one ``(poems, errors)`` outcome per candidate.
+
+    A failure on one ebook becomes that candidate's ``extract_error`` rather
+    than propagating, since ``imap`` would re-raise it in the parent and
+    discard every other chunk's results.
+    """
+
+    chunk, text_paths = task
+    outcomes: list[tuple[list[NormalizedPoem], list[dict]]] = []
+    for candidate in chunk:
+        try:
+            outcome = ingest_gutenberg_candidates(
+                [candidate],
+                texts_dir=texts_dir,
+                max_non_empty_lines=max_non_empty_lines,
+                text_paths=text_paths,
+            )
+        except Exception as exc:
+            error = {
+                "kind": "extract_error",
+                "ebook_id": candidate.ebook_id,
+                "title": candidate.title,
+                "author": candidate.author,
+                "reason": f"{type(exc).__name__}: {exc}",
+            }
+            outcome = ([], [error])
+        outcomes.append(outcome)
+    return outcomes
+
+
+def _candidate_fingerprint(
+    candidate: GutenbergCandidate, text_index: dict[int, Path], *, max_non_empty_lines: int
+) -> list | None:
+    path = text_index.get(candidate.ebook_id)
+    if path is None:
+        return None
+    try:
+        return extraction_fingerprint(candidate, path, max_non_empty_lines=max_non_empty_lines)
+    except OSError:
+        return None
+
+
+_POETRYDB_MANIFEST_VERSION = 1
+
+
+def _poem_key(poem: NormalizedPoem) -> list[str]:
+    return [poem.author, poem.title, poem.content_hash]
+
+
+def _load_previous_poems(
+    output_dir: Path, blob_store: BlobStore | None = None
+) -> dict[tuple[str, str, str], list[NormalizedPoem]]:
+    """Index the normalized poems behind the last run's poems/duplicates artifacts.
+
+    Records whose ``text_ref`` cannot be resolved through ``blob_store`` are
+    skipped, so the authors they belong to are simply re-normalized.
+    """
+
+    previous: dict[tuple[str, str, str], list[NormalizedPoem]] = {}
+    for name in ("poems", "duplicates"):
+        path = find_artifact(output_dir, name)
+        if path is None:
+            continue
+        for record in read_jsonl(path):
+            if TEXT_REF in record:
+                try:
+                    record = blob_store.resolve(record) if blob_store is not None else None
+                except OSError:
+                    record = None
+                if record is None:
+                    continue
+            poem = NormalizedPoem(
+                title=record["title"],
+                author=record["author"],
+                text=record["text"],
+                linecount=record["linecount"],
+                content_hash=record["content_hash"],
+                source=record["source"],
+            )
+            previous.setdefault((poem.author, poem.title, poem.content_hash), []).append(poem)
+    return previous
+
+
+def _load_poetrydb_manifest(
+    path: Path, *, base_url: str, output_dir: Path, blob_store: BlobStore | None = None
+) -> tuple[dict[str, dict], dict[str, list[NormalizedPoem]]]:
+    """Return reusable manifest entries and each such author's previous poems.
+
+    An author is only reusable when every poem the manifest lists for it is
+    still present in the previous artifacts under ``output_dir``. Manifests
+    written for another ``base_url`` or ``NORMALIZER_VERSION`` are discarded.
+    """
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _POETRYDB_MANIFEST_VERSION
+        or payload.get("base_url") != base_url
+        or payload.get("normalizer_version") != NORMALIZER_VERSION
+    ):
+        return {}, {}
+
+    previous = _load_previous_poems(output_dir, blob_store)
+    entries: dict[str, dict] = {}
+    reused: dict[str, list[NormalizedPoem]] = {}
+    for author, entry in payload.get("authors", {}).items():
+        poems: list[NormalizedPoem] = []
+        for key in entry["poems"]:
+            matches = previous.get(tuple(key))
+            if not matches:
+                break
+            poems.append(matches.pop())
+        else:
+            entries[author] = entry
+            reused[author] = poems
+    return entries, reused
+
+
+def _write_poetrydb_manifest(path: Path, *, base_url: str, entries: Mapping[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": _POETRYDB_MANIFEST_VERSION,
+        "base_url": base_url,
+        "normalizer_version": NORMALIZER_VERSION,
+        "authors": dict(sorted(entries.items())),
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _count_shape_rejections(errors: list[dict]) -> dict[str, int]:
+    counts = Counter(error["shape_rejection"] for error in errors if "shape_rejection" in error)
+    return dict(sorted(counts.items()))
+
+
+def _open_http_cache(http_cache_path: Path | None, *, ttl_seconds: float, offline: bool) -> HTTPCache | None:
+    """Open a view of the shared response cache with its own TTL."""
+
+    if http_cache_path is None:
+        if offline:
+            raise ValueError("offline mode requires an HTTP cache path")
+        return None
+    return HTTPCache(http_cache_path, ttl_seconds=ttl_seconds, offline=offline)
+
+
+def _close_http_caches(**caches: HTTPCache | None) -> dict:
+    """Close caches and return their hit/miss counters for the report."""
+
+    metrics: dict = {}
+    for name, cache in caches.items():
+        if cache is not None:
+            metrics[name] = cache.stats()
+            cache.close()
+    return {"http_cache": metrics} if metrics else {}
+
+
 def run_poetrydb_ingestion(
     output_dir: Path,
     base_url: str = "https://poetrydb.org",
@@ -233,28 +665,116 @@ def run_poetrydb_ingestion(
     retries: int = 3,
     backoff_seconds: float = 0.5,
     rate_limit_rps: float = 2.0,
+    rate_limit_burst: int = 1,
     enrich_author_bios: bool = True,
     author_bio_max_chars: int = 280,
+    wikipedia_api: str = WIKIPEDIA_API,
+    queue_batch_size: int = 64,
+    queue_batch_max_bytes: int = 1_000_000,
+    http_cache_path: Path | None = None,
+    http_cache_ttl_seconds: float = 24 * 3600,
+    author_cache_ttl_seconds: float = 30 * 24 * 3600,
+    offline: bool = False,
+    manifest_path: Path | None = None,
+    dedupe_max_in_memory: int | None = None,
+    near_duplicate_threshold: float | None = None,
+    columnar_artifacts: bool = False,
+    artifact_compression: str = "none",
+    blob_store_dir: Path | None = None,
+    trace_path: Path | None = None,
 ) -> dict:
-    """Run ingestion end-to-end and write artifacts into output_dir."""
-
+    """Run ingestion end-to-end and write artifacts into output_dir.
+
+    With ``manifest_path`` the run is incremental: the manifest records a
+    fingerprint of each author's last payload and the poems it normalized to.
+    Authors whose payload is unchanged are not re-normalized; their poems are
+    taken from the previous artifacts in ``output_dir`` and merged before
+    deduplication, so the output matches a full run.
+
+    Normalized poems stream into a ``StreamingDeduper`` as batches arrive;
+    ``dedupe_max_in_memory`` bounds how many it buffers before spilling
+    sorted runs to disk. ``near_duplicate_threshold`` enables the
+    near-duplicate stage (see ``near_duplicates``) at that estimated Jaccard
+    similarity. ``artifact_compression`` (``"none"``, ``"gzip"`` or ``"zstd"``)
+    selects how the JSONL artifacts are encoded as they are streamed out.
+    With ``blob_store_dir`` poem texts go to a content-addressed store shared
+    across runs (see ``blob_store``) and the artifacts reference them.
+
+    Per-stage wall/CPU time, throughput, sampled queue depths, peak RSS and
+    bytes fetched are reported under ``timings``; ``trace_path`` also writes
+    them as a Chrome trace.
+    """
+
+    timer = RunTimer()
+    check_compression(artifact_compression)
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    authors = fetch_authors(base_url, timeout_seconds, retries, backoff_seconds)
-
-    author_queue: mp.Queue = mp.Queue()
+    blob_store = BlobStore(blob_store_dir) if blob_store_dir is not None else None
+    if manifest_path is not None:
+        manifest, reusable_poems = _load_poetrydb_manifest(
+            manifest_path, base_url=base_url, output_dir=output_dir, blob_store=blob_store
+        )
+        previous_fingerprints = {author: entry["fingerprint"] for author, entry in manifest.items()}
+    else:
+        manifest, reusable_poems, previous_fingerprints = {}, {}, None
+
+    fetch_concurrency = max(1, fetch_workers)
+    pool = KeepAliveConnectionPool(max_connections_per_host=fetch_concurrency, timeout_seconds=timeout_seconds)
+    limiter = TokenBucket(rate_limit_rps, rate_limit_burst)
+    source_cache = _open_http_cache(http_cache_path, ttl_seconds=http_cache_ttl_seconds, offline=offline)
+    author_cache = _open_http_cache(http_cache_path, ttl_seconds=author_cache_ttl_seconds, offline=offline)
+    with timer.stage("fetch_authors") as stage:
+        authors = fetch_authors(base_url, timeout_seconds, retries, backoff_seconds, pool, source_cache, limiter)
+        stage.items = len(authors)
+
+    author_queue: queue.Queue = queue.Queue()
     raw_queue: mp.Queue = mp.Queue()
     normalized_queue: mp.Queue = mp.Queue()
     error_queue: mp.Queue = mp.Queue()
-    fetch_progress_queue: mp.Queue = mp.Queue()
+    fetch_progress_queue: queue.Queue = queue.Queue()
 
     for author in authors:
         author_queue.put(author)
-    for _ in range(fetch_workers):
+    for _ in range(fetch_concurrency):
         author_queue.put(None)
 
-    fetch_processes = [
-        mp.Process(
+    def sample_queues(force: bool = False) -> None:
+        timer.sample_queues(
+            {
+                "author_queue": author_queue.qsize(),
+                "raw_queue": queue_depth(raw_queue),
+                "normalized_queue": queue_depth(normalized_queue),
+            },
+            force=force,
+        )
+
+    normalize_stage = timer.start("normalize")
+    normalize_processes = [
+        mp.Process(target=_normalize_worker, args=(raw_queue, normalized_queue, error_queue))
+        for _ in range(normalize_workers)
+    ]
+    for process in normalize_processes:
+        process.start()
+
+    # Enrichment overlaps the PoetryDB fetch, so it draws from the same bucket
+    # to keep the whole run within the configured global rate.
+    enrichment = _AuthorEnrichmentStage(
+        authors,
+        timeout_seconds=timeout_seconds,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        rate_limit_rps=rate_limit_rps,
+        rate_limit_burst=rate_limit_burst,
+        limiter=limiter,
+        enrich_bios=enrich_author_bios,
+        bio_max_chars=author_bio_max_chars,
+        cache=author_cache,
+        wikipedia_api=wikipedia_api,
+        timer=timer,
+    ).start()
+
+    fetch_stage = timer.start("fetch")
+    fetch_threads = [
+        threading.Thread(
             target=_fetch_worker,
             args=(
                 base_url,
@@ -265,90 +785,137 @@ def run_poetrydb_ingestion(
                 timeout_seconds,
                 retries,
                 backoff_seconds,
-                rate_limit_rps,
+                pool,
+                limiter,
+                queue_batch_size,
+                queue_batch_max_bytes,
+                source_cache,
+                previous_fingerprints,
             ),
+            daemon=True,
         )
-        for _ in range(fetch_workers)
-    ]
-    normalize_processes = [
-        mp.Process(target=_normalize_worker, args=(raw_queue, normalized_queue, error_queue))
-        for _ in range(normalize_workers)
+        for _ in range(fetch_concurrency)
     ]
-
-    for process in fetch_processes + normalize_processes:
-        process.start()
+    for thread in fetch_threads:
+        thread.start()
 
     progress = _ProgressRenderer()
     fetch_done = 0
     normalized_done = 0
     total_authors = len(authors)
     errors: list[dict] = []
+    fetched: dict[str, dict] = {}
+    deduper = StreamingDeduper(max_in_memory=dedupe_max_in_memory, tmp_dir=output_dir)
+    normalized_by_author: dict[str, dict] = {}
+    done_count = 0
 
+    def consume_normalized(message: dict) -> None:
+        nonlocal done_count, normalized_done
+        if message.get("kind") == "normalize_worker_done":
+            done_count += 1
+        elif message.get("kind") == "normalized_batch":
+            poems = [_decode_poem(encoded) for encoded in message["poems"]]
+            deduper.extend(poems)
+            errors.extend(message["errors"])
+            normalized_done += len(message["poems"]) + len(message["errors"])
+            if manifest_path is not None:
+                outcome = normalized_by_author.setdefault(message["author"], {"poems": [], "errors": []})
+                outcome["poems"].extend(_poem_key(poem) for poem in poems)
+                outcome["errors"].extend(message["errors"])
+
+    # Normalized batches are consumed while fetching continues, so they never
+    # pile up in the queue and the deduper's memory bound holds throughout.
     while fetch_done < total_authors:
         for message in _drain_queue(fetch_progress_queue):
             if message.get("kind") == "fetch_done":
                 fetch_done += 1
+                fetched[message["author"]] = message
+        for message in _drain_queue(normalized_queue):
+            consume_normalized(message)
         for error in _drain_queue(error_queue):
             errors.append(error)
         progress.render_poetrydb(fetch_done=fetch_done, fetch_total=total_authors, normalized_done=normalized_done)
+        sample_queues()
         time.sleep(0.02)
 
-    for process in fetch_processes:
-        process.join()
+    for thread in fetch_threads:
+        thread.join()
+    pool.close()
+    timer.finish(fetch_stage, items=total_authors)
+    sample_queues(force=True)
 
     progress.render_poetrydb(fetch_done=fetch_done, fetch_total=total_authors, normalized_done=normalized_done)
 
     for _ in range(normalize_workers):
         raw_queue.put(None)
 
-    normalized_payloads: list[NormalizedPoem] = []
-    done_count = 0
     while done_count < normalize_workers:
-        message = normalized_queue.get()
-        if message.get("kind") == "normalize_worker_done":
-            done_count += 1
-        elif message.get("kind") == "normalized":
-            payload = message["payload"]
-            normalized_payloads.append(NormalizedPoem(**payload))
-            normalized_done += 1
-
-        for error in _drain_queue(error_queue):
-            errors.append(error)
-            if error.get("kind") == "normalize_error":
-                normalized_done += 1
+        consume_normalized(normalized_queue.get())
+        errors.extend(_drain_queue(error_queue))
         progress.render_poetrydb(fetch_done=fetch_done, fetch_total=total_authors, normalized_done=normalized_done)
+        sample_queues()
 
     for process in normalize_processes:
         process.join()
+    timer.finish(normalize_stage, items=normalized_done)
     errors.extend(_drain_queue(error_queue))
     progress.render_poetrydb(fetch_done=fetch_done, fetch_total=total_authors, normalized_done=normalized_done, force=True)
 
-    canonical, duplicates = dedupe_poems(normalized_payloads)
-    unique_authors = sorted({record["author"] for record in canonical if isinstance(record.get("author"), str)})
-    author_records, author_errors = enrich_authors(
-        unique_authors,
-        timeout_seconds=timeout_seconds,
-        retries=retries,
-        backoff_seconds=backoff_seconds,
-        rate_limit_rps=rate_limit_rps,
-        enrich_bios=enrich_author_bios,
-        bio_max_chars=author_bio_max_chars,
+    # Merge unchanged authors back in from the previous artifacts. Authors are
+    # visited in fetch order so errors keep a stable order.
+    dedupe_stage = timer.start("dedupe_write")
+    manifest_entries: dict[str, dict] = {}
+    authors_unchanged = 0
+    for author in authors:
+        message = fetched.get(author)
+        if message is None or message["fingerprint"] is None:
+            continue
+        if message["unchanged"]:
+            authors_unchanged += 1
+            deduper.extend(reusable_poems[author])
+            errors.extend(manifest[author]["errors"])
+            manifest_entries[author] = manifest[author]
+        else:
+            outcome = normalized_by_author.get(author, {"poems": [], "errors": []})
+            manifest_entries[author] = {"fingerprint": message["fingerprint"], **outcome}
+
+    dedupe = _write_deduped(
+        deduper,
+        output_dir,
+        near_duplicate_threshold=near_duplicate_threshold,
+        compression=artifact_compression,
+        blob_store=blob_store,
     )
+    timer.finish(dedupe_stage, items=deduper.count)
+    with timer.stage("enrich_join"):
+        author_records, author_errors = enrichment.join(dedupe.authors)
     errors.extend(author_errors)
 
-    return _build_report(
+    extra_metrics = {
+        "base_url": base_url,
+        "authors_requested": len(authors),
+        "normalized_poems": deduper.count,
+    }
+    if manifest_path is not None:
+        extra_metrics["authors_unchanged"] = authors_unchanged
+        extra_metrics["authors_changed"] = len(manifest_entries) - authors_unchanged
+    extra_metrics.update(_close_http_caches(source=source_cache, authors=author_cache))
+    report = _build_report(
         source="poetrydb",
         output_dir=output_dir,
-        canonical=canonical,
-        duplicates=duplicates,
+        dedupe=dedupe,
         author_records=author_records,
         errors=errors,
-        extra_metrics={
-            "base_url": base_url,
-            "authors_requested": len(authors),
-            "normalized_poems": len(normalized_payloads),
-        },
+        extra_metrics=extra_metrics,
+        columnar=columnar_artifacts,
+        compression=artifact_compression,
+        blob_store=blob_store,
+        timer=timer,
+        trace_path=trace_path,
     )
+    if manifest_path is not None:
+        _write_poetrydb_manifest(manifest_path, base_url=base_url, entries=manifest_entries)
+    return report
 
 
 def run_gutenberg_ingestion(
@@ -362,54 +929,172 @@ def run_gutenberg_ingestion(
     retries: int = 3,
     backoff_seconds: float = 0.5,
     rate_limit_rps: float = 2.0,
+    rate_limit_burst: int = 1,
     enrich_author_bios: bool = True,
     author_bio_max_chars: int = 280,
+    wikipedia_api: str = WIKIPEDIA_API,
+    http_cache_path: Path | None = None,
+    author_cache_ttl_seconds: float = 30 * 24 * 3600,
+    offline: bool = False,
+    normalize_workers: int = 1,
+    extract_chunk_size: int = 32,
+    text_index_path: Path | None = None,
+    manifest_path: Path | None = None,
+    dedupe_max_in_memory: int | None = None,
+    near_duplicate_threshold: float | None = None,
+    columnar_artifacts: bool = False,
+    artifact_compression: str = "none",
+    blob_store_dir: Path | None = None,
+    trace_path: Path | None = None,
 ) -> dict:
-    """Run strict Project Gutenberg ingestion and write standard artifacts."""
-
+    """Run strict Project Gutenberg ingestion and write standard artifacts.
+
+    With ``normalize_workers > 1`` candidates are extracted on a process pool
+    in chunks of ``extract_chunk_size``; results are consumed in submission
+    order so output stays deterministic. Ebook files are located through one
+    directory index (``load_text_index``), cached at ``text_index_path`` when given.
+
+    With ``manifest_path`` the run is incremental: per-ebook outcomes are kept
+    in that manifest keyed on the catalog row, text file size/mtime, and
+    extractor version, and only new or changed candidates are re-extracted.
+    The full artifact set is still written. ``dedupe_max_in_memory`` switches
+    deduplication to bounded-memory run files (see ``StreamingDeduper``) and
+    ``near_duplicate_threshold`` enables near-duplicate clustering,
+    ``artifact_compression`` selects the JSONL artifact encoding, and
+    ``blob_store_dir`` moves poem texts into a shared content-addressed store.
+    Stage timings are reported as for PoetryDB (``timings``, ``trace_path``).
+    """
+
+    timer = RunTimer()
+    check_compression(artifact_compression)
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    candidates, metadata_errors = load_catalog_candidates(catalog_csv, language=language)
-    progress = _ProgressRenderer()
-    total_candidates = len(candidates)
-
-    if total_candidates == 0:
-        progress.render_gutenberg(processed=0, total=0, force=True)
-        normalized_payloads = []
-        extract_errors = []
-    else:
-        # Run per-candidate to provide progress without introducing third-party deps.
-        normalized_payloads = []
-        extract_errors = []
-        for index, candidate in enumerate(candidates, start=1):
-            poems, errors = ingest_gutenberg_candidates(
-                [candidate],
-                texts_dir=texts_dir,
-                max_non_empty_lines=max_non_empty_lines,
-            )
-            normalized_payloads.extend(poems)
-            extract_errors.extend(errors)
-            if index < total_candidates:
-                progress.render_gutenberg(processed=index, total=total_candidates)
-        progress.render_gutenberg(processed=total_candidates, total=total_candidates, force=True)
-    canonical, duplicates = dedupe_poems(normalized_payloads)
-    unique_authors = sorted({record["author"] for record in canonical if isinstance(record.get("author"), str)})
-    author_records, author_errors = enrich_authors(
-        unique_authors,
+    blob_store = BlobStore(blob_store_dir) if blob_store_dir is not None else None
+    author_cache = _open_http_cache(http_cache_path, ttl_seconds=author_cache_ttl_seconds, offline=offline)
+
+    with timer.stage("load_catalog") as stage:
+        candidates, metadata_errors = load_catalog_candidates(catalog_csv, language=language)
+        text_index = load_text_index(texts_dir, cache_path=text_index_path)
+        stage.items = len(candidates)
+
+    # Reuse outcomes whose catalog row and text file are unchanged since the
+    # manifest was written; everything else is (re)extracted.
+    plan_stage = timer.start("plan_extraction")
+    manifest = load_extraction_manifest(manifest_path) if manifest_path is not None else {}
+    reused: dict[int, dict] = {}
+    fingerprints: list[list | None] = [None] * len(candidates)
+    pending: list[int] = []
+    for position, candidate in enumerate(candidates):
+        if manifest_path is None:
+            pending.append(position)
+            continue
+        fingerprint = _candidate_fingerprint(candidate, text_index, max_non_empty_lines=max_non_empty_lines)
+        fingerprints[position] = fingerprint
+        entry = manifest.get(candidate.ebook_id)
+        if fingerprint is not None and entry is not None and entry["fingerprint"] == fingerprint:
+            reused[position] = entry
+        else:
+            pending.append(position)
+    del manifest
+    timer.finish(plan_stage, items=len(candidates))
+
+    extract = functools.partial(
+        _extract_gutenberg_chunk,
+        texts_dir=texts_dir,
+        max_non_empty_lines=max_non_empty_lines,
+    )
+    chunk_size = max(1, extract_chunk_size)
+    chunks = [pending[offset : offset + chunk_size] for offset in range(0, len(pending), chunk_size)]
+    # Ship each task only the index entries it needs rather than the whole index.
+    tasks = []
+    for chunk in chunks:
+        chunk_candidates = [candidates[position] for position in chunk]
+        text_paths = {c.ebook_id: text_index[c.ebook_id] for c in chunk_candidates if c.ebook_id in text_index}
+        tasks.append((chunk_candidates, text_paths))
+    # Fork the extraction pool before any background threads exist.
+    extract_pool = mp.Pool(processes=normalize_workers) if normalize_workers > 1 and len(chunks) > 1 else None
+
+    enrichment = _AuthorEnrichmentStage(
+        [candidate.author for candidate in candidates],
         timeout_seconds=timeout_seconds,
         retries=retries,
         backoff_seconds=backoff_seconds,
         rate_limit_rps=rate_limit_rps,
+        rate_limit_burst=rate_limit_burst,
+        # One bucket for the initial pass and any late authors enriched in join().
+        limiter=TokenBucket(rate_limit_rps, rate_limit_burst),
         enrich_bios=enrich_author_bios,
         bio_max_chars=author_bio_max_chars,
+        cache=author_cache,
+        wikipedia_api=wikipedia_api,
+        timer=timer,
+    ).start()
+    progress = _ProgressRenderer()
+    total_candidates = len(candidates)
+    extract_stage = timer.start("extract")
+
+    def extracted_outcomes() -> Iterator[tuple[list[NormalizedPoem], list[dict]]]:
+        # Pool results arrive in submission order, i.e. in candidate order.
+        for consumed, chunk_outcomes in enumerate(results, start=1):
+            timer.sample_queues({"extract_backlog_chunks": len(chunks) - consumed})
+            yield from chunk_outcomes
+
+    # Outcomes stream into the deduper and the manifest in candidate order, so
+    # neither the extracted poems nor the manifest entries pile up in memory.
+    deduper = StreamingDeduper(max_in_memory=dedupe_max_in_memory, tmp_dir=output_dir)
+    manifest_writer: ExtractionManifestWriter | None = None
+    extract_errors: list[dict] = []
+    if extract_pool is not None:
+        results = extract_pool.imap(extract, tasks)
+    else:
+        results = map(extract, tasks)
+    fresh_outcomes = extracted_outcomes()
+    try:
+        if manifest_path is not None:
+            manifest_writer = ExtractionManifestWriter(manifest_path)
+        for position, (candidate, fingerprint) in enumerate(zip(candidates, fingerprints)):
+            entry = reused.pop(position, None)
+            if entry is not None:
+                poems, errors = [NormalizedPoem(**poem) for poem in entry["poems"]], entry["errors"]
+            else:
+                poems, errors = next(fresh_outcomes)
+                if fingerprint is not None:
+                    entry = {"fingerprint": fingerprint, "poems": [asdict(poem) for poem in poems], "errors": errors}
+            deduper.extend(poems)
+            extract_errors.extend(errors)
+            if manifest_writer is not None and entry is not None:
+                manifest_writer.write(candidate.ebook_id, entry)
+            if position + 1 < total_candidates:
+                progress.render_gutenberg(processed=position + 1, total=total_candidates)
+    except BaseException:
+        if manifest_writer is not None:
+            manifest_writer.abort()
+        raise
+    finally:
+        if extract_pool is not None:
+            extract_pool.close()
+            extract_pool.join()
+    if manifest_writer is not None:
+        manifest_writer.close()
+    progress.render_gutenberg(processed=total_candidates, total=total_candidates, force=True)
+    timer.finish(extract_stage, items=len(pending))
+
+    dedupe_stage = timer.start("dedupe_write")
+    dedupe = _write_deduped(
+        deduper,
+        output_dir,
+        near_duplicate_threshold=near_duplicate_threshold,
+        compression=artifact_compression,
+        blob_store=blob_store,
     )
+    timer.finish(dedupe_stage, items=deduper.count)
+    with timer.stage("enrich_join"):
+        author_records, author_errors = enrichment.join(dedupe.authors)
     errors = metadata_errors + extract_errors + author_errors
 
     return _build_report(
         source="gutenberg",
         output_dir=output_dir,
-        canonical=canonical,
-        duplicates=duplicates,
+        dedupe=dedupe,
         author_records=author_records,
         errors=errors,
         extra_metrics={
@@ -418,8 +1103,18 @@ def run_gutenberg_ingestion(
             "language": language,
             "max_non_empty_lines": max_non_empty_lines,
             "catalog_candidates": len(candidates),
-            "normalized_poems": len(normalized_payloads),
+            "extract_workers": normalize_workers if extract_pool is not None else 1,
+            "candidates_extracted": len(pending),
+            "candidates_reused": total_candidates - len(pending),
+            "normalized_poems": deduper.count,
+            "shape_rejections": _count_shape_rejections(extract_errors),
+            **_close_http_caches(authors=author_cache),
         },
+        columnar=columnar_artifacts,
+        compression=artifact_compression,
+        blob_store=blob_store,
+        timer=timer,
+        trace_path=trace_path,
     )
 
 
@@ -432,8 +1127,23 @@ def run_ingestion(
     retries: int = 3,
     backoff_seconds: float = 0.5,
     rate_limit_rps: float = 2.0,
+    rate_limit_burst: int = 1,
     enrich_author_bios: bool = True,
     author_bio_max_chars: int = 280,
+    wikipedia_api: str = WIKIPEDIA_API,
+    queue_batch_size: int = 64,
+    queue_batch_max_bytes: int = 1_000_000,
+    http_cache_path: Path | None = None,
+    http_cache_ttl_seconds: float = 24 * 3600,
+    author_cache_ttl_seconds: float = 30 * 24 * 3600,
+    offline: bool = False,
+    manifest_path: Path | None = None,
+    dedupe_max_in_memory: int | None = None,
+    near_duplicate_threshold: float | None = None,
+    columnar_artifacts: bool = False,
+    artifact_compression: str = "none",
+    blob_store_dir: Path | None = None,
+    trace_path: Path | None = None,
 ) -> dict:
     """Backward-compatible alias for PoetryDB ingestion."""
 
@@ -446,20 +1156,36 @@ def run_ingestion(
         retries=retries,
         backoff_seconds=backoff_seconds,
         rate_limit_rps=rate_limit_rps,
+        rate_limit_burst=rate_limit_burst,
         enrich_author_bios=enrich_author_bios,
         author_bio_max_chars=author_bio_max_chars,
+        wikipedia_api=wikipedia_api,
+        queue_batch_size=queue_batch_size,
+        queue_batch_max_bytes=queue_batch_max_bytes,
+        http_cache_path=http_cache_path,
+        http_cache_ttl_seconds=http_cache_ttl_seconds,
+        author_cache_ttl_seconds=author_cache_ttl_seconds,
+        offline=offline,
+        manifest_path=manifest_path,
+        dedupe_max_in_memory=dedupe_max_in_memory,
+        near_duplicate_threshold=near_duplicate_threshold,
+        columnar_artifacts=columnar_artifacts,
+        artifact_compression=artifact_compression,
+        blob_store_dir=blob_store_dir,
+        trace_path=trace_path,
     )
 
 
 def auto_worker_split(cpu_count: int | None = None) -> tuple[int, int]:
-    """Choose fetch/normalize worker counts while using available cores."""
+    """Choose fetch concurrency and normalize process count.
+
+    Fetching runs on threads, so its concurrency does not consume cores;
+    normalization gets every core except the one hosting the main process.
+    """
 
     total = cpu_count or (mp.cpu_count() or 2)
-    if total <= 2:
-        return 1, 1
-    fetch = max(1, total // 2)
-    normalize = max(1, total - fetch)
-    return fetch, normalize
+    normalize = max(1, total - 1)
+    return _DEFAULT_FETCH_CONCURRENCY, normalize
 
 
 def print_report(report: dict) -> None:
@@ -476,8 +1202,15 @@ def print_report(report: dict) -> None:
         "normalized_poems",
         "canonical_poems",
         "duplicates",
+        "near_duplicates",
     ):
         if key in report:
             lines.append(f"{key}: {report[key]}")
     lines.append(f"errors: {len(report['errors'])}")
+    timings = report.get("timings")
+    if timings:
+        slowest = max(timings["stages"].items(), key=lambda item: item[1]["wall_seconds"], default=None)
+        lines.append(f"wall_seconds: {timings['total_wall_seconds']:.2f}")
+        if slowest is not None:
+            lines.append(f"slowest_stage: {slowest[0]} ({slowest[1]['wall_seconds']:.2f}s)")
     sys.stdout.write("\n".join(lines) + "\n")
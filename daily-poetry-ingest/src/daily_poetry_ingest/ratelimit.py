@@ -0,0 +1,52 @@
+"""Thread-safe token-bucket rate limiting for upstream HTTP calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Global request budget of ``rate`` per second with ``burst`` capacity.
+
+    Callers reserve a token under the lock and sleep outside it, so any number
+    of threads sharing one bucket are admitted at exactly the configured rate.
+    A non-positive rate disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._rate > 0
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the seconds waited."""
+
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -0,0 +1,63 @@
+import gzip
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.artifacts import (
+    JsonlWriter,
+    artifact_path,
+    check_compression,
+    find_artifact,
+    read_jsonl,
+    remove_other_encodings,
+    write_jsonl,
+)
+
+
+class ArtifactTests(unittest.TestCase):
+    def test_gzip_artifact_round_trips_and_reports_sizes(self) -> None:
+        records = [{"title": f"Poem {idx}", "text": "Ó the same line again\n" * 20} for idx in range(200)]
+
+        with TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            plain = write_jsonl(artifact_path(output_dir, "poems"), records)
+            compressed_path = artifact_path(output_dir, "poems", "gzip")
+            compressed = write_jsonl(compressed_path, records)
+            first_bytes = compressed_path.read_bytes()
+            write_jsonl(compressed_path, records)
+
+            self.assertEqual(compressed_path.name, "poems.jsonl.gz")
+            self.assertEqual(compressed_path.read_bytes(), first_bytes)
+            self.assertEqual(gzip.decompress(first_bytes), (output_dir / "poems.jsonl").read_bytes())
+            self.assertEqual(list(read_jsonl(compressed_path)), records)
+            self.assertEqual(list(read_jsonl(output_dir / "poems.jsonl")), records)
+
+            self.assertEqual(plain.records, 200)
+            self.assertEqual(plain.raw_bytes, plain.written_bytes)
+            self.assertEqual(compressed.raw_bytes, plain.raw_bytes)
+            self.assertEqual(compressed.written_bytes, len(first_bytes))
+            self.assertGreater(compressed.compression_ratio, 10)
+
+            remove_other_encodings(output_dir, "poems", "gzip")
+            self.assertEqual(find_artifact(output_dir, "poems"), compressed_path)
+
+    def test_failed_write_keeps_previous_artifact(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "poems.jsonl.gz"
+            write_jsonl(path, [{"title": "kept"}])
+
+            with self.assertRaises(RuntimeError):
+                with JsonlWriter(path) as writer:
+                    writer.write({"title": "partial"})
+                    raise RuntimeError("boom")
+
+            self.assertEqual(list(read_jsonl(path)), [{"title": "kept"}])
+            self.assertEqual(sorted(item.name for item in Path(tmp).iterdir()), ["poems.jsonl.gz"])
+
+    def test_check_compression_rejects_unknown_codec(self) -> None:
+        with self.assertRaises(ValueError):
+            check_compression("lz4")
+
+
+if __name__ == "__main__":
+    unittest.main()
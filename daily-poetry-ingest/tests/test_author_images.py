@@ -1,21 +1,31 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
-from daily_poetry_ingest.author_images import AuthorImageRecord, enrich_authors
+from daily_poetry_ingest.author_images import (
+    AuthorImageRecord,
+    _stable_batches,
+    enrich_authors,
+    resolve_author_image_batch,
+)
+from daily_poetry_ingest.http_cache import HTTPCache
 
 
 class AuthorImageTests(unittest.TestCase):
     def test_enrich_authors_handles_missing_images_with_null(self) -> None:
         with patch(
-            "daily_poetry_ingest.author_images.resolve_author_image",
-            return_value=AuthorImageRecord(
-                name="No Image",
-                image_url=None,
-                image_source=None,
-                bio_short=None,
-                bio_source=None,
-                bio_url=None,
-            ),
+            "daily_poetry_ingest.author_images.resolve_author_image_batch",
+            return_value={
+                "No Image": AuthorImageRecord(
+                    name="No Image",
+                    image_url=None,
+                    image_source=None,
+                    bio_short=None,
+                    bio_source=None,
+                    bio_url=None,
+                )
+            },
         ):
             records, errors = enrich_authors(
                 ["No Image"],
@@ -50,10 +60,10 @@ class AuthorImageTests(unittest.TestCase):
             ),
         }
 
-        def fake_resolver(author: str, *_args, **_kwargs):
-            return mapping[author]
+        def fake_resolver(authors: list[str], *_args, **_kwargs):
+            return {author: mapping[author] for author in authors}
 
-        with patch("daily_poetry_ingest.author_images.resolve_author_image", side_effect=fake_resolver):
+        with patch("daily_poetry_ingest.author_images.resolve_author_image_batch", side_effect=fake_resolver):
             records, errors = enrich_authors(
                 ["B", "A"],
                 timeout_seconds=1,
@@ -67,6 +77,84 @@ class AuthorImageTests(unittest.TestCase):
         self.assertEqual(records[0]["image_source"], "wikipedia")
         self.assertEqual(records[0]["bio_source"], "wikipedia")
 
+    def test_resolve_author_image_batch_maps_renames_and_merges_continuations(self) -> None:
+        responses = [
+            {
+                "continue": {"excontinue": "1", "continue": "||"},
+                "query": {
+                    "normalized": [{"from": "john keats", "to": "John keats"}],
+                    "redirects": [{"from": "John keats", "to": "John Keats"}],
+                    "pages": {
+                        "1": {"pageid": 1, "title": "John Keats", "thumbnail": {"source": "https://img/keats.jpg"}},
+                        "2": {"pageid": 2, "title": "Emily Dickinson"},
+                        "-1": {"title": "Nobody Known", "missing": ""},
+                    },
+                },
+            },
+            {
+                "query": {
+                    "pages": {
+                        "2": {"pageid": 2, "title": "Emily Dickinson", "extract": "American poet."},
+                    },
+                },
+            },
+        ]
+        endpoints: list[str] = []
+
+        def fake_fetch(endpoint: str, *_args, **_kwargs):
+            endpoints.append(endpoint)
+            return responses[len(endpoints) - 1]
+
+        with patch("daily_poetry_ingest.author_images._fetch_with_retry", side_effect=fake_fetch):
+            resolved = resolve_author_image_batch(
+                ["john keats", "Emily Dickinson", "Nobody Known"],
+                timeout_seconds=1,
+                retries=0,
+                backoff_seconds=0,
+                wikipedia_api="http://127.0.0.1:8000/w/api.php",
+            )
+
+        self.assertEqual(len(endpoints), 2)
+        self.assertTrue(endpoints[0].startswith("http://127.0.0.1:8000/w/api.php?"))
+        self.assertIn("titles=john+keats|Emily+Dickinson|Nobody+Known", endpoints[0])
+        self.assertIn("excontinue=1", endpoints[1])
+        self.assertEqual(resolved["john keats"].image_url, "https://img/keats.jpg")
+        self.assertEqual(resolved["Emily Dickinson"].bio_short, "American poet.")
+        self.assertEqual(resolved["Emily Dickinson"].bio_url, "https://en.wikipedia.org/wiki/Emily_Dickinson")
+        self.assertIsNone(resolved["Nobody Known"].image_url)
+        self.assertIsNone(resolved["Nobody Known"].bio_short)
+
+    def test_stable_batches_survive_an_added_author(self) -> None:
+        authors = sorted(f"Author {idx:04d}" for idx in range(600))
+        before = _stable_batches(authors, 50)
+        after = _stable_batches(sorted(authors + ["Author 0300a"]), 50)
+
+        self.assertEqual([author for batch in before for author in batch], authors)
+        self.assertTrue(all(0 < len(batch) <= 50 for batch in before + after))
+        changed = {tuple(batch) for batch in after} - {tuple(batch) for batch in before}
+        self.assertLessEqual(len(changed), 2)
+        self.assertGreater(len(before), 12)
+
+    def test_offline_cache_misses_are_reported_as_errors(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            cache = HTTPCache(Path(tmp_dir) / "cache.sqlite", offline=True)
+            records, errors = enrich_authors(
+                ["A", "B"],
+                timeout_seconds=1,
+                retries=0,
+                backoff_seconds=0,
+                rate_limit_rps=0,
+                cache=cache,
+            )
+            cache.close()
+
+        self.assertEqual([record["name"] for record in records], ["A", "B"])
+        self.assertEqual(
+            [(error["kind"], error["author"]) for error in errors],
+            [("author_image_error", "A"), ("author_image_error", "B")],
+        )
+        self.assertIn("offline mode", errors[0]["reason"])
+
 
 if __name__ == "__main__":
     unittest.main()
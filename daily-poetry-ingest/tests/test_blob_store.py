@@ -0,0 +1,80 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.artifacts import read_jsonl
+from daily_poetry_ingest.blob_store import BlobStore
+from daily_poetry_ingest.dedupe import StreamingDeduper
+from daily_poetry_ingest.normalize import NormalizedPoem, compute_content_hash
+
+
+def _poem(title: str, author: str, text: str) -> NormalizedPoem:
+    return NormalizedPoem(
+        title=title,
+        author=author,
+        text=text,
+        linecount=text.count("\n") + 1,
+        content_hash=compute_content_hash(text),
+    )
+
+
+class BlobStoreTests(unittest.TestCase):
+    def test_externalize_and_resolve_keep_field_order(self) -> None:
+        record = {"title": "T", "text": "line one\nline two", "content_hash": "abc123", "source": "poetrydb"}
+
+        with TemporaryDirectory() as tmp:
+            store = BlobStore(Path(tmp))
+            stored = store.externalize(record)
+            blob_path = Path(tmp) / "ab" / "c123"
+
+            self.assertEqual(list(stored), ["title", "text_ref", "content_hash", "source"])
+            self.assertEqual(stored["text_ref"], "abc123")
+            self.assertEqual(blob_path.read_text(encoding="utf-8"), "line one\nline two")
+            self.assertEqual(store.resolve(stored), record)
+            with self.assertRaises(ValueError):
+                store.put("../x", "text")
+
+    def test_texts_with_carriage_returns_round_trip(self) -> None:
+        text = "line one\r\nline two\rline three"
+
+        with TemporaryDirectory() as tmp:
+            store = BlobStore(Path(tmp))
+            store.put(compute_content_hash(text), text)
+            self.assertEqual(store.get(compute_content_hash(text)), text)
+
+    def test_deduper_writes_each_text_once_across_runs(self) -> None:
+        poems = [
+            _poem("A", "Ann", "shared text"),
+            _poem("B", "Bea", "shared text"),
+            _poem("C", "Cal", "only once"),
+        ]
+
+        with TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            first_store = BlobStore(base / "blobs")
+            deduper = StreamingDeduper()
+            deduper.extend(poems)
+            deduper.write(base / "poems.jsonl", base / "duplicates.jsonl", blob_store=first_store)
+            shared_blob = first_store.path_for(compute_content_hash("shared text"))
+            written_at = shared_blob.stat().st_mtime_ns
+
+            second_store = BlobStore(base / "blobs")
+            deduper = StreamingDeduper(max_in_memory=1, tmp_dir=base)
+            deduper.extend(poems)
+            deduper.write(base / "poems.jsonl", base / "duplicates.jsonl", blob_store=second_store)
+
+            stored_poems = list(read_jsonl(base / "poems.jsonl"))
+            resolved = list(read_jsonl(base / "poems.jsonl", blob_store=second_store))
+            duplicates = list(read_jsonl(base / "duplicates.jsonl", blob_store=second_store))
+
+            self.assertEqual(shared_blob.stat().st_mtime_ns, written_at)
+
+        self.assertEqual((first_store.blobs_written, first_store.blobs_reused), (2, 0))
+        self.assertEqual((second_store.blobs_written, second_store.blobs_reused), (0, 2))
+        self.assertTrue(all("text" not in record for record in stored_poems))
+        self.assertEqual([record["text"] for record in resolved], ["shared text", "only once"])
+        self.assertEqual(duplicates[0]["text"], "shared text")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import struct
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.columnar import MAGIC, POEM_COLUMNS, remove_columnar_artifacts, write_columnar
+
+
+def _read_footer(data: bytes) -> dict:
+    footer_length = struct.unpack_from("<Q", data, len(data) - 16)[0]
+    return json.loads(data[len(data) - 16 - footer_length : len(data) - 16])
+
+
+def _string_value(data: bytes, meta: dict, row: int) -> str:
+    start, end = struct.unpack_from("<QQ", data, meta["offsets"][0] + 8 * row)
+    return data[meta["data"][0] + start : meta["data"][0] + end].decode("utf-8")
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_write_columnar_round_trips_typed_columns_and_index(self) -> None:
+        records = [
+            {"title": "Río", "author": "B", "text": "line one\nline two", "linecount": 2, "content_hash": "ff"},
+            {"title": "Ode", "author": "A", "text": "x", "linecount": 1, "content_hash": "0a", "source": "poetrydb"},
+            {"title": "", "author": "C", "text": "y", "linecount": 1, "content_hash": "7c", "source": "gutenberg"},
+        ]
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "poems.dpcol"
+            rows = write_columnar(path, records, POEM_COLUMNS, index_column="content_hash")
+            data = path.read_bytes()
+            leftovers = sorted(item.name for item in Path(tmp).iterdir())
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(leftovers, ["poems.dpcol"])
+        self.assertEqual(data[:8], MAGIC)
+        self.assertEqual(data[-8:], MAGIC)
+
+        footer = _read_footer(data)
+        self.assertEqual(footer["rows"], 3)
+        self.assertEqual(footer["order"], [name for name, _ in POEM_COLUMNS])
+        columns = footer["columns"]
+        for meta in columns.values():
+            self.assertEqual(meta["data"][0] % 8, 0)
+
+        self.assertEqual([_string_value(data, columns["title"], row) for row in range(3)], ["Río", "Ode", ""])
+        self.assertEqual(_string_value(data, columns["text"], 0), "line one\nline two")
+        linecounts = struct.unpack_from("<3q", data, columns["linecount"]["data"][0])
+        self.assertEqual(linecounts, (2, 1, 1))
+
+        self.assertIsNone(columns["title"]["nulls"])
+        null_mask = data[columns["source"]["nulls"][0] : columns["source"]["nulls"][0] + 3]
+        self.assertEqual(null_mask, b"\x01\x00\x00")
+
+        index = footer["index"]
+        self.assertEqual(index["column"], "content_hash")
+        order = struct.unpack_from("<3I", data, index["rows"][0])
+        self.assertEqual([records[row]["content_hash"] for row in order], ["0a", "7c", "ff"])
+
+    def test_write_columnar_rejects_mistyped_values(self) -> None:
+        with TemporaryDirectory() as tmp:
+            with self.assertRaises(TypeError):
+                write_columnar(Path(tmp) / "poems.dpcol", [{"linecount": "2"}], POEM_COLUMNS)
+
+    def test_remove_columnar_artifacts_deletes_only_dpcol_files(self) -> None:
+        with TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            for name in ("poems.dpcol", "duplicates.dpcol", "poems.jsonl"):
+                (output_dir / name).write_bytes(b"")
+            remove_columnar_artifacts(output_dir)
+            remaining = sorted(item.name for item in output_dir.iterdir())
+
+        self.assertEqual(remaining, ["poems.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
+import heapq
+import json
+import random
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
 
-from daily_poetry_ingest.dedupe import dedupe_poems
-from daily_poetry_ingest.normalize import NormalizedPoem
+from daily_poetry_ingest import dedupe
+from daily_poetry_ingest.dedupe import StreamingDeduper, dedupe_poems
+from daily_poetry_ingest.normalize import NormalizedPoem, compute_content_hash
 
 
 class DedupeTests(unittest.TestCase):
@@ -37,6 +44,70 @@ class DedupeTests(unittest.TestCase):
         self.assertEqual(len(canonical), 2)
         self.assertEqual(len(duplicates), 0)
 
+    def test_streaming_deduper_spilled_output_matches_in_memory(self) -> None:
+        rng = random.Random(7)
+        poems = []
+        for idx in range(500):
+            text = f"verse {rng.randrange(120)}"
+            poems.append(
+                NormalizedPoem(
+                    title=f"T{rng.randrange(5)}",
+                    author=f"A{rng.randrange(4)}",
+                    text=text,
+                    linecount=1,
+                    content_hash=compute_content_hash(text),
+                    source=f"s{idx}",
+                )
+            )
+        canonical, duplicates = dedupe_poems(poems)
+
+        with TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            deduper = StreamingDeduper(max_in_memory=37, tmp_dir=base / "spill")
+            deduper.extend(poems)
+            summary = deduper.write(base / "poems.jsonl", base / "duplicates.jsonl")
+            written_canonical = [json.loads(line) for line in (base / "poems.jsonl").open(encoding="utf-8")]
+            written_duplicates = [json.loads(line) for line in (base / "duplicates.jsonl").open(encoding="utf-8")]
+            leftover = list((base / "spill").iterdir())
+
+        self.assertEqual(written_canonical, canonical)
+        self.assertEqual(written_duplicates, duplicates)
+        self.assertEqual(summary.canonical, len(canonical))
+        self.assertEqual(summary.duplicates, len(duplicates))
+        self.assertEqual(summary.authors, sorted({record["author"] for record in canonical}))
+        self.assertEqual(leftover, [])
+
+    def test_streaming_deduper_merges_many_runs_in_passes(self) -> None:
+        poems = []
+        for idx in range(200):
+            text = f"verse {idx % 70}"
+            poems.append(NormalizedPoem(f"T{idx % 3}", f"A{idx % 5}", text, 1, compute_content_hash(text), f"s{idx}"))
+        canonical, duplicates = dedupe_poems(poems)
+
+        fan_ins: list[int] = []
+        real_merge = heapq.merge
+
+        def recording_merge(*iterables, **kwargs):
+            fan_ins.append(len(iterables))
+            return real_merge(*iterables, **kwargs)
+
+        with TemporaryDirectory() as tmp_dir, mock.patch.object(dedupe, "_MAX_FAN_IN", 3), mock.patch.object(
+            dedupe.heapq, "merge", recording_merge
+        ):
+            base = Path(tmp_dir)
+            deduper = StreamingDeduper(max_in_memory=7, tmp_dir=base / "spill")
+            deduper.extend(poems)
+            deduper.write(base / "poems.jsonl", base / "duplicates.jsonl")
+            written_canonical = [json.loads(line) for line in (base / "poems.jsonl").open(encoding="utf-8")]
+            written_duplicates = [json.loads(line) for line in (base / "duplicates.jsonl").open(encoding="utf-8")]
+            leftover = list((base / "spill").iterdir())
+
+        self.assertEqual(written_canonical, canonical)
+        self.assertEqual(written_duplicates, duplicates)
+        self.assertGreater(len(fan_ins), 3)
+        self.assertLessEqual(max(fan_ins), 3)
+        self.assertEqual(leftover, [])
+
 
 if __name__ == "__main__":
     unittest.main()
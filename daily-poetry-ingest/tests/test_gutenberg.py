@@ -1,8 +1,24 @@
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from daily_poetry_ingest.gutenberg import extract_strict_poem_lines, ingest_gutenberg_candidates, load_catalog_candidates
+from unittest.mock import patch
+
+from daily_poetry_ingest.gutenberg import (
+    ExtractionManifestWriter,
+    GutenbergCandidate,
+    _extract_from_file,
+    _find_gutenberg_text_path,
+    build_text_index,
+    extract_strict_poem_lines,
+    ingest_gutenberg_candidates,
+    load_catalog_candidates,
+    load_extraction_manifest,
+    load_text_index,
+    profile_poem_shape,
+    read_gutenberg_body,
+)
 
 
 _VALID_POEM_TEXT = """*** START OF THE PROJECT GUTENBERG EBOOK 9999 ***
@@ -136,6 +152,176 @@ by Walt Whitman
         self.assertEqual(poems_strict, [])
         self.assertEqual(len(errors_strict), 1)
         self.assertEqual(errors_strict[0]["kind"], "extract_error")
+        self.assertEqual(errors_strict[0]["shape_rejection"], "too_many_lines")
+
+    def test_profile_poem_shape_reports_rejection_and_stops_early(self) -> None:
+        poem = _VALID_POEM_TEXT.splitlines()[4:-1]
+        profile = profile_poem_shape(poem)
+        self.assertTrue(profile.passed)
+        self.assertTrue(profile.complete)
+        self.assertEqual(profile.non_empty_lines, 8)
+        self.assertEqual(profile.blank_lines, 1)
+        exact = profile_poem_shape(poem, stop_early=False)
+        self.assertGreaterEqual(profile.alpha_chars, 120)
+        self.assertLess(profile.alpha_chars, exact.alpha_chars)
+        self.assertEqual(exact.alpha_chars, sum(char.isalpha() for char in "".join(poem)))
+
+        self.assertEqual(profile_poem_shape(poem[:4]).rejection, "too_few_lines")
+        self.assertEqual(profile_poem_shape([line for line in poem if line]).rejection, "no_blank_lines")
+
+        prose = poem + ["And the verse runs on and on without any header, far past the width of verse."] * 5000
+        early = profile_poem_shape(prose)
+        full = profile_poem_shape(prose, stop_early=False)
+        self.assertFalse(early.passed)
+        self.assertFalse(early.complete)
+        self.assertLess(early.non_empty_lines, 30)
+        self.assertEqual(full.non_empty_lines, 5008)
+        self.assertEqual(full.rejection, "too_many_lines")
+
+    def test_extract_strict_poem_lines_skips_long_preamble_and_ornaments(self) -> None:
+        text = _VALID_POEM_TEXT.replace(
+            "by Walt Whitman\n",
+            "by Walt Whitman\n" + "\n" * 3000 + "* * *\nWalt Whitman\n",
+        )
+
+        lines = extract_strict_poem_lines(text, "O Captain! My Captain!", "Walt Whitman")
+
+        self.assertIsNotNone(lines)
+        self.assertEqual(lines[0], "O Captain! my Captain! our fearful trip is done,")
+        self.assertEqual(lines[-1], "Fallen cold and dead.")
+
+    def test_read_gutenberg_body_bounds_decoding_to_markers_and_prefix(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "10.txt"
+            path.write_text("Header\n" + _VALID_POEM_TEXT + "\nLicense text", encoding="utf-8")
+
+            body, complete = read_gutenberg_body(path)
+            prefix, prefix_complete = read_gutenberg_body(path, max_prefix_bytes=64)
+
+        self.assertTrue(complete)
+        self.assertTrue(body.startswith(" 9999 ***\nO Captain!"))
+        self.assertTrue(body.rstrip().endswith("Fallen cold and dead."))
+        self.assertFalse(prefix_complete)
+        self.assertTrue(body.startswith(prefix))
+        self.assertLessEqual(len(prefix.encode("utf-8")), 64)
+
+    def test_bounded_file_extraction_matches_full_text_extraction(self) -> None:
+        poem_with_notes = _VALID_POEM_TEXT.replace(
+            "Fallen cold and dead.\n",
+            "Fallen cold and dead.\n\nNOTES\n\n" + "A long editorial note about the text.\n" * 5000,
+        )
+        long_prose = _VALID_POEM_TEXT.replace(
+            "Fallen cold and dead.\n",
+            "Fallen cold and dead.\n" + "And the verse runs on and on without any header.\n" * 5000,
+        )
+        results = {}
+        with TemporaryDirectory() as tmp_dir:
+            for name, text in (("short", _VALID_POEM_TEXT), ("notes", poem_with_notes), ("prose", long_prose)):
+                path = Path(tmp_dir) / f"{name}.txt"
+                path.write_text(text, encoding="utf-8")
+                with patch("daily_poetry_ingest.gutenberg.read_gutenberg_body", wraps=read_gutenberg_body) as reader:
+                    bounded, _ = _extract_from_file(
+                        path,
+                        "O Captain! My Captain!",
+                        "Walt Whitman",
+                        max_non_empty_lines=120,
+                        max_prefix_bytes=16 * 1024,
+                    )
+                expected = extract_strict_poem_lines(text, "O Captain! My Captain!", "Walt Whitman")
+                self.assertEqual(bounded, expected, name)
+                # Every case is decided without decoding the full body.
+                self.assertEqual(reader.call_count, 1, name)
+                results[name] = bounded
+
+        self.assertIsNotNone(results["notes"])
+        self.assertIsNone(results["prose"])
+
+    def test_build_text_index_matches_probe_order_across_layouts(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            files = [
+                "10.txt",
+                "pg10.txt",
+                "11-0.txt",
+                "pg11.txt",
+                "12/12.txt",
+                "12/pg12.txt",
+                "13/13-0.txt",
+                "epub/13/pg13.txt",
+                "epub/14/14.txt",
+                "15/pg16.txt",
+                "notes.txt",
+            ]
+            for name in files:
+                (root / name).parent.mkdir(parents=True, exist_ok=True)
+                (root / name).write_text("x", encoding="utf-8")
+
+            index = build_text_index(root)
+
+            self.assertEqual(sorted(index), [10, 11, 12, 13, 14])
+            for ebook_id, path in index.items():
+                self.assertEqual(path, _find_gutenberg_text_path(root, ebook_id))
+
+    def test_load_text_index_reuses_cache_until_directory_changes(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir) / "texts"
+            root.mkdir()
+            (root / "10.txt").write_text("x", encoding="utf-8")
+            cache_path = Path(tmp_dir) / "index.json"
+
+            first = load_text_index(root, cache_path=cache_path)
+            with patch("daily_poetry_ingest.gutenberg._scan_text_index") as rebuild:
+                second = load_text_index(root, cache_path=cache_path)
+            rebuild.assert_not_called()
+
+            (root / "11.txt").write_text("x", encoding="utf-8")
+            os.utime(root, ns=(root.stat().st_atime_ns, root.stat().st_mtime_ns + 1_000_000_000))
+            third = load_text_index(root, cache_path=cache_path)
+
+        self.assertEqual(first, {10: root / "10.txt"})
+        self.assertEqual(second, first)
+        self.assertEqual(sorted(third), [10, 11])
+
+    def test_renamed_nested_file_rescans_and_stale_paths_are_reported(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir) / "texts"
+            (root / "12").mkdir(parents=True)
+            (root / "12" / "12-0.txt").write_text(_VALID_POEM_TEXT, encoding="utf-8")
+            cache_path = Path(tmp_dir) / "index.json"
+
+            first = load_text_index(root, cache_path=cache_path)
+            (root / "12" / "12-0.txt").rename(root / "12" / "pg12.txt")
+            nested = root / "12"
+            os.utime(nested, ns=(nested.stat().st_atime_ns, nested.stat().st_mtime_ns + 1_000_000_000))
+            second = load_text_index(root, cache_path=cache_path)
+
+            candidate = GutenbergCandidate(ebook_id=12, title="O Captain! My Captain!", author="Walt Whitman", language="en")
+            poems, errors = ingest_gutenberg_candidates([candidate], texts_dir=root, text_paths=first)
+
+        self.assertEqual(first, {12: root / "12" / "12-0.txt"})
+        self.assertEqual(second, {12: root / "12" / "pg12.txt"})
+        self.assertEqual(poems, [])
+        self.assertEqual([error["kind"] for error in errors], ["text_missing"])
+
+    def test_extraction_manifest_writer_streams_entries_and_keeps_old_manifest_on_error(self) -> None:
+        entry = {"fingerprint": ["row", 10, 20], "poems": [], "errors": []}
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "manifest.json"
+            with ExtractionManifestWriter(path) as writer:
+                writer.write(7, entry)
+                writer.write(3, {**entry, "errors": [{"kind": "extract_error", "ebook_id": 3}]})
+            written = load_extraction_manifest(path)
+
+            with self.assertRaises(RuntimeError), ExtractionManifestWriter(path) as writer:
+                writer.write(9, entry)
+                raise RuntimeError("extraction failed")
+            after_error = load_extraction_manifest(path)
+            leftovers = sorted(item.name for item in Path(tmp_dir).iterdir())
+
+        self.assertEqual(sorted(written), [3, 7])
+        self.assertEqual(written[7], entry)
+        self.assertEqual(after_error, written)
+        self.assertEqual(leftovers, ["manifest.json"])
 
 
 def _write_catalog(path: Path, *, rows: list[str]) -> Path:
@@ -0,0 +1,69 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.http_cache import CacheMissError, HTTPCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HTTPCacheTests(unittest.TestCase):
+    def test_fresh_entries_skip_network_and_stale_entries_revalidate(self) -> None:
+        clock = _FakeClock()
+        calls: list[dict] = []
+
+        def fetch(headers: dict[str, str]):
+            calls.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return 304, {}, b""
+            return 200, {"ETag": '"v1"'}, b'{"authors": ["A"]}'
+
+        with TemporaryDirectory() as tmp_dir:
+            cache = HTTPCache(Path(tmp_dir) / "cache.sqlite", ttl_seconds=60, clock=clock)
+            first = cache.get_json("https://poetrydb.org/author", fetch)
+            second = cache.get_json("https://poetrydb.org/author", fetch)
+            clock.now += 120
+            third = cache.get_json("https://poetrydb.org/author", fetch)
+            stats = cache.stats()
+            cache.close()
+
+        self.assertEqual(first, {"authors": ["A"]})
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+        self.assertEqual(calls, [{}, {"If-None-Match": '"v1"'}])
+        self.assertEqual(stats, {"hits": 1, "revalidated": 1, "misses": 1})
+
+    def test_offline_serves_stale_entries_and_raises_on_miss(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "cache.sqlite"
+            online = HTTPCache(path, ttl_seconds=0)
+            online.get_json("https://example.org/a", lambda _headers: (200, {}, b"[1]"))
+            online.close()
+
+            offline = HTTPCache(path, ttl_seconds=0, offline=True)
+            self.assertEqual(offline.get_json("https://example.org/a", lambda _headers: self.fail("network")), [1])
+            with self.assertRaises(CacheMissError):
+                offline.get_json("https://example.org/b", lambda _headers: self.fail("network"))
+            offline.close()
+
+    def test_counters_are_exact_under_concurrent_fetches(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            cache = HTTPCache(Path(tmp_dir) / "cache.sqlite", ttl_seconds=3600)
+            cache.get_json("https://example.org/a", lambda _headers: (200, {}, b"[1]"))
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: cache.get_json("https://example.org/a", self.fail), range(400)))
+            stats = cache.stats()
+            cache.close()
+
+        self.assertEqual(stats, {"hits": 400, "revalidated": 0, "misses": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import threading
+import unittest
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from daily_poetry_ingest.http_client import KeepAliveConnectionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[tuple[str, int]] = set()
+
+    def log_message(self, *_args) -> None:
+        return
+
+    def do_GET(self) -> None:
+        _Handler.connections.add(self.client_address)
+        status = 404 if self.path == "/missing" else 200
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class KeepAliveConnectionPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sequential_requests_reuse_one_connection(self) -> None:
+        pool = KeepAliveConnectionPool(max_connections_per_host=2, timeout_seconds=5)
+        try:
+            payloads = [pool.get_json(f"{self.base_url}/author/{idx}") for idx in range(5)]
+        finally:
+            pool.close()
+
+        self.assertEqual([payload["path"] for payload in payloads], [f"/author/{idx}" for idx in range(5)])
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_non_200_raises_http_error(self) -> None:
+        pool = KeepAliveConnectionPool(timeout_seconds=5)
+        try:
+            with self.assertRaises(urllib.error.HTTPError):
+                pool.get_json(f"{self.base_url}/missing")
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.http_client import record_bytes_received
+from daily_poetry_ingest.instrumentation import RunTimer
+
+
+class RunTimerTests(unittest.TestCase):
+    def test_report_covers_stages_queues_and_bytes(self) -> None:
+        timer = RunTimer(queue_sample_interval=0)
+        with timer.stage("fetch") as stage:
+            record_bytes_received(1234)
+            stage.items = 10
+        overlapping = timer.start("normalize", thread="worker")
+        for depth in range(1200):
+            timer.sample_queues({"raw_queue": depth, "unsupported": None})
+        timer.finish(overlapping, items=5)
+
+        report = timer.as_report()
+
+        self.assertEqual(list(report["stages"]), ["fetch", "normalize"])
+        self.assertEqual(report["stages"]["fetch"]["items"], 10)
+        self.assertGreater(report["stages"]["fetch"]["items_per_second"], 0)
+        self.assertGreaterEqual(report["stages"]["normalize"]["cpu_seconds"], 0)
+        self.assertEqual(report["bytes_fetched"], 1234)
+        raw_queue = report["queue_depths"]["raw_queue"]
+        self.assertGreater(raw_queue["max"], 1100)
+        self.assertLessEqual(len(raw_queue["samples"]), 512)
+        self.assertNotIn("unsupported", report["queue_depths"])
+
+        with TemporaryDirectory() as tmp:
+            trace_path = Path(tmp) / "trace.json"
+            timer.write_chrome_trace(trace_path)
+            events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+
+        spans = [event for event in events if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in spans], ["fetch", "normalize"])
+        self.assertNotEqual(spans[0]["tid"], spans[1]["tid"])
+        self.assertTrue(any(event["ph"] == "C" and event["name"] == "raw_queue" for event in events))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from daily_poetry_ingest.dedupe import dedupe_poems
+from daily_poetry_ingest.near_duplicates import (
+    cluster_signatures,
+    dedupe_near_duplicates,
+    estimate_similarity,
+    minhash_signature,
+)
+from daily_poetry_ingest.normalize import normalize_record
+
+_OZYMANDIAS = [
+    "I met a traveller from an antique land,",
+    "Who said—“Two vast and trunkless legs of stone",
+    "Stand in the desert. . . . Near them, on the sand,",
+    "Half sunk a shattered visage lies, whose frown,",
+    "And wrinkled lip, and sneer of cold command,",
+    "Tell that its sculptor well those passions read",
+    "Which yet survive, stamped on these lifeless things,",
+    "The hand that mocked them, and the heart that fed;",
+    "",
+    "And on the pedestal, these words appear:",
+    "My name is Ozymandias, King of Kings;",
+    "Look on my Works, ye Mighty, and despair!",
+    "Nothing beside remains. Round the decay",
+    "Of that colossal Wreck, boundless and bare",
+    "The lone and level sands stretch far away.”",
+]
+
+
+def _variant() -> list[str]:
+    lines = [line.replace("—“", " ").replace("”", "").replace(". . . .", ".") for line in _OZYMANDIAS]
+    lines[0] = "I met a traveler from an antique land"
+    lines.insert(4, "")
+    return lines
+
+
+class NearDuplicateTests(unittest.TestCase):
+    def test_signature_similarity_tracks_shared_wording(self) -> None:
+        original = minhash_signature("\n".join(_OZYMANDIAS))
+        variant = minhash_signature("\n".join(_variant()))
+        unrelated = minhash_signature("Shall I compare thee to a summer's day? Thou art more lovely and more temperate")
+
+        self.assertEqual(original, minhash_signature("\n".join(_OZYMANDIAS)))
+        self.assertGreater(estimate_similarity(original, variant), 0.8)
+        self.assertLess(estimate_similarity(original, unrelated), 0.2)
+        self.assertIsNone(minhash_signature("... --- ..."))
+        self.assertEqual(cluster_signatures([original, unrelated, variant, None], threshold=0.8), [[0, 2]])
+
+    def test_dedupe_near_duplicates_moves_cluster_losers_to_duplicates(self) -> None:
+        poems = [
+            normalize_record({"title": "Ozymandias", "author": "Percy Bysshe Shelley", "lines": _OZYMANDIAS}),
+            normalize_record({"title": "Ozymandias", "author": "P. B. Shelley", "lines": _variant()}),
+            normalize_record({"title": "Ozymandias", "author": "Shelley", "lines": _OZYMANDIAS}),
+            normalize_record({"title": "Sonnet 18", "author": "William Shakespeare", "lines": ["Shall I compare thee"]}),
+        ]
+        canonical, duplicates = dedupe_poems(poems)
+
+        with TemporaryDirectory() as tmp_dir:
+            poems_path = Path(tmp_dir) / "poems.jsonl"
+            duplicates_path = Path(tmp_dir) / "duplicates.jsonl"
+            for path, records in ((poems_path, canonical), (duplicates_path, duplicates)):
+                path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+            summary = dedupe_near_duplicates(poems_path, duplicates_path, threshold=0.8)
+            kept = [json.loads(line) for line in poems_path.read_text(encoding="utf-8").splitlines()]
+            moved = [json.loads(line) for line in duplicates_path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual([record["author"] for record in kept], ["P. B. Shelley", "William Shakespeare"])
+        self.assertEqual(summary.canonical, 2)
+        self.assertEqual(summary.near_duplicates, 1)
+        self.assertEqual(summary.authors, ["P. B. Shelley", "William Shakespeare"])
+        self.assertEqual([record["author"] for record in moved], ["Percy Bysshe Shelley", "Shelley"])
+        near = moved[0]
+        self.assertEqual(near["kind"], "near_duplicate")
+        self.assertEqual(near["canonical_content_hash"], kept[0]["content_hash"])
+        self.assertGreater(near["similarity"], 0.8)
+        self.assertNotIn("kind", moved[1])
+
+
+    def test_cluster_signatures_checks_every_pair_in_a_bucket(self) -> None:
+        # All three share band 0; only the last two are similar, and they share no other band.
+        signatures = [
+            (1, 1, 1, 1, 5, 6, 7, 8),
+            (1, 1, 1, 1, 2, 2, 2, 3),
+            (1, 1, 1, 1, 2, 2, 2, 4),
+        ]
+
+        self.assertEqual(cluster_signatures(signatures, threshold=0.75, bands=2), [[1, 2]])
+        self.assertEqual(cluster_signatures(signatures[::-1], threshold=0.75, bands=2), [[0, 1]])
+
+    def test_exact_duplicates_of_a_near_duplicate_loser_follow_the_winner(self) -> None:
+        poems = [
+            normalize_record({"title": "Ozymandias", "author": "Percy Bysshe Shelley", "lines": _OZYMANDIAS}),
+            normalize_record({"title": "Ozymandias", "author": "Shelley", "lines": _OZYMANDIAS}),
+            normalize_record({"title": "Ozymandias", "author": "P. B. Shelley", "lines": _variant()}),
+        ]
+        canonical, duplicates = dedupe_poems(poems)
+        loser_hash = canonical[1]["content_hash"]
+        self.assertEqual([record["canonical_content_hash"] for record in duplicates], [loser_hash])
+
+        with TemporaryDirectory() as tmp_dir:
+            poems_path = Path(tmp_dir) / "poems.jsonl"
+            duplicates_path = Path(tmp_dir) / "duplicates.jsonl"
+            for path, records in ((poems_path, canonical), (duplicates_path, duplicates)):
+                path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+            dedupe_near_duplicates(poems_path, duplicates_path, threshold=0.8)
+            kept = [json.loads(line) for line in poems_path.read_text(encoding="utf-8").splitlines()]
+            moved = [json.loads(line) for line in duplicates_path.read_text(encoding="utf-8").splitlines()]
+
+        kept_hashes = {record["content_hash"] for record in kept}
+        self.assertNotIn(loser_hash, kept_hashes)
+        self.assertEqual([record["author"] for record in moved], ["Percy Bysshe Shelley", "Shelley"])
+        self.assertTrue(all(record["canonical_content_hash"] in kept_hashes for record in moved))
+
+
+    def test_chained_members_stay_canonical_unless_similar_to_the_winner(self) -> None:
+        words = [f"word{idx}" for idx in range(100)]
+        poems = [
+            normalize_record({"title": "Chain", "author": author, "lines": words[start : start + 60]})
+            for author, start in (("A", 0), ("B", 20), ("C", 40))
+        ]
+        signatures = [minhash_signature(poem.text) for poem in poems]
+        self.assertEqual(cluster_signatures(signatures, threshold=0.4), [[0, 1, 2]])
+        self.assertLess(estimate_similarity(signatures[0], signatures[2]), 0.4)
+
+        canonical, duplicates = dedupe_poems(poems)
+        with TemporaryDirectory() as tmp_dir:
+            poems_path = Path(tmp_dir) / "poems.jsonl"
+            duplicates_path = Path(tmp_dir) / "duplicates.jsonl"
+            for path, records in ((poems_path, canonical), (duplicates_path, duplicates)):
+                path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+            summary = dedupe_near_duplicates(poems_path, duplicates_path, threshold=0.4)
+            kept = [json.loads(line) for line in poems_path.read_text(encoding="utf-8").splitlines()]
+            moved = [json.loads(line) for line in duplicates_path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual([record["author"] for record in kept], ["A", "C"])
+        self.assertEqual([record["author"] for record in moved], ["B"])
+        self.assertEqual(moved[0]["canonical_content_hash"], kept[0]["content_hash"])
+        self.assertGreaterEqual(moved[0]["similarity"], 0.4)
+        self.assertEqual(summary.near_duplicates, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from daily_poetry_ingest.normalize import canonical_text, normalize_record
+from daily_poetry_ingest.normalize import canonical_text, normalize_record, normalize_records
 
 
 class NormalizeTests(unittest.TestCase):
@@ -18,6 +18,24 @@ class NormalizeTests(unittest.TestCase):
         result = normalize_record({"author": "A", "lines": ["x"]})
         self.assertEqual(result.reason, "missing_title")
 
+    def test_normalize_record_rejects_non_string_lines(self) -> None:
+        result = normalize_record({"title": "T", "author": "A", "lines": ["x", 3]})
+        self.assertEqual(result.reason, "invalid_line_type")
+
+    def test_normalize_records_matches_per_record_results_in_order(self) -> None:
+        records = [
+            {"title": f" T{idx} ", "author": "A", "lines": [f"line {idx} " * (400 if idx % 3 else 1), ""]}
+            for idx in range(12)
+        ]
+        records.insert(5, {"title": "T", "author": "A", "lines": []})
+        records.insert(9, {"author": "A", "lines": ["x"]})
+
+        expected = [normalize_record(record) for record in records]
+        for workers in (1, 3):
+            batch = normalize_records(records, workers=workers)
+            self.assertEqual(batch.poems, [result for result in expected if not hasattr(result, "reason")])
+            self.assertEqual([error.reason for error in batch.errors], ["missing_lines", "missing_title"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,13 @@
+import gzip
 import json
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
-from daily_poetry_ingest.pipeline import run_gutenberg_ingestion
+from daily_poetry_ingest.gutenberg import GutenbergCandidate, ingest_gutenberg_candidates
+from daily_poetry_ingest.pipeline import _extract_gutenberg_chunk, run_gutenberg_ingestion
 
 
 _POEM_TEXT = """*** START OF THE PROJECT GUTENBERG EBOOK 10 ***
@@ -51,7 +54,9 @@ class GutenbergPipelineTests(unittest.TestCase):
                 texts_dir=texts,
                 language="en",
                 rate_limit_rps=0,
+                trace_path=base / "trace.json",
             )
+            trace = json.loads((base / "trace.json").read_text(encoding="utf-8"))
 
             poems_path = output / "poems.jsonl"
             authors_path = output / "authors.jsonl"
@@ -74,6 +79,159 @@ class GutenbergPipelineTests(unittest.TestCase):
             self.assertEqual(report["canonical_poems"], 1)
             self.assertEqual(report["normalized_poems"], 1)
 
+            stages = report["timings"]["stages"]
+            self.assertEqual(
+                set(stages),
+                {"load_catalog", "plan_extraction", "extract", "enrich_authors", "dedupe_write", "enrich_join", "write_artifacts"},
+            )
+            self.assertEqual(stages["extract"]["items"], 1)
+            self.assertEqual({event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}, set(stages))
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_run_gutenberg_ingestion_compresses_artifacts(self, mock_enrich_authors) -> None:
+        mock_enrich_authors.return_value = ([], [])
+
+        with TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            catalog = base / "catalog.csv"
+            texts = base / "texts"
+            output = base / "out"
+            texts.mkdir(parents=True)
+            catalog.write_text(
+                "Text#,Type,Title,Language,Authors,Subjects,Bookshelves,LoCC\n"
+                "10,Text,A Song,en,Sample Poet,Poetry,Poetry,PS\n",
+                encoding="utf-8",
+            )
+            (texts / "10.txt").write_text(_POEM_TEXT, encoding="utf-8")
+            kwargs = dict(output_dir=output, catalog_csv=catalog, texts_dir=texts, rate_limit_rps=0)
+
+            run_gutenberg_ingestion(**kwargs)
+            plain_poems = (output / "poems.jsonl").read_bytes()
+            report = run_gutenberg_ingestion(**kwargs, artifact_compression="gzip")
+
+            self.assertFalse((output / "poems.jsonl").exists())
+            self.assertEqual(gzip.decompress((output / "poems.jsonl.gz").read_bytes()), plain_poems)
+            self.assertEqual(report["compression"], "gzip")
+            self.assertEqual(report["artifacts"]["poems"], str(output / "poems.jsonl.gz"))
+            poems_bytes = report["artifact_bytes"]["poems"]
+            self.assertEqual(poems_bytes["records"], 1)
+            self.assertEqual(poems_bytes["raw_bytes"], len(plain_poems))
+            self.assertEqual(poems_bytes["written_bytes"], (output / "poems.jsonl.gz").stat().st_size)
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_run_gutenberg_ingestion_process_pool_matches_serial_output(self, mock_enrich_authors) -> None:
+        mock_enrich_authors.return_value = ([], [])
+
+        with TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            catalog = base / "catalog.csv"
+            texts = base / "texts"
+            texts.mkdir(parents=True)
+
+            rows = []
+            for ebook_id in range(10, 17):
+                rows.append(f"{ebook_id},Text,A Song,en,Poet {ebook_id},Poetry,Poetry,PS")
+                if ebook_id != 13:
+                    text = _POEM_TEXT.replace("I sing the dawn", f"I sing dawn {ebook_id}")
+                    (texts / f"{ebook_id}.txt").write_text(text, encoding="utf-8")
+            catalog.write_text(
+                "Text#,Type,Title,Language,Authors,Subjects,Bookshelves,LoCC\n" + "\n".join(rows) + "\n",
+                encoding="utf-8",
+            )
+
+            outputs = {}
+            reports = {}
+            for workers in (1, 3):
+                output = base / f"out-{workers}"
+                reports[workers] = run_gutenberg_ingestion(
+                    output_dir=output,
+                    catalog_csv=catalog,
+                    texts_dir=texts,
+                    rate_limit_rps=0,
+                    normalize_workers=workers,
+                    extract_chunk_size=2,
+                )
+                outputs[workers] = (output / "poems.jsonl").read_text(encoding="utf-8")
+
+        self.assertEqual(outputs[1], outputs[3])
+        self.assertEqual(reports[3]["extract_workers"], 3)
+        self.assertEqual(reports[3]["canonical_poems"], 6)
+        self.assertEqual(reports[1]["errors"], reports[3]["errors"])
+        self.assertEqual([error["ebook_id"] for error in reports[3]["errors"]], [13])
+
+    def test_extract_chunk_turns_one_failing_ebook_into_an_error(self) -> None:
+        candidates = [GutenbergCandidate(ebook_id, "A Song", "Sample Poet", "en") for ebook_id in (10, 11)]
+
+        def flaky(batch, **kwargs):
+            if batch[0].ebook_id == 11:
+                raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+            return ingest_gutenberg_candidates(batch, **kwargs)
+
+        with TemporaryDirectory() as tmp_dir:
+            texts = Path(tmp_dir)
+            for ebook_id in (10, 11):
+                (texts / f"{ebook_id}.txt").write_text(_POEM_TEXT, encoding="utf-8")
+            index = {ebook_id: texts / f"{ebook_id}.txt" for ebook_id in (10, 11)}
+            with patch("daily_poetry_ingest.pipeline.ingest_gutenberg_candidates", side_effect=flaky):
+                outcomes = _extract_gutenberg_chunk(
+                    (candidates, index), texts_dir=texts, max_non_empty_lines=120
+                )
+
+        self.assertEqual(len(outcomes[0][0]), 1)
+        self.assertEqual(outcomes[1][0], [])
+        self.assertEqual(outcomes[1][1][0]["kind"], "extract_error")
+        self.assertEqual(outcomes[1][1][0]["ebook_id"], 11)
+        self.assertIn("UnicodeDecodeError", outcomes[1][1][0]["reason"])
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_run_gutenberg_ingestion_manifest_reextracts_only_changed_ebooks(self, mock_enrich_authors) -> None:
+        mock_enrich_authors.return_value = ([], [])
+
+        with TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            catalog = base / "catalog.csv"
+            texts = base / "texts"
+            manifest = base / "manifest.json"
+            texts.mkdir(parents=True)
+
+            rows = []
+            for ebook_id in range(10, 14):
+                rows.append(f"{ebook_id},Text,A Song,en,Poet {ebook_id},Poetry,Poetry,PS")
+                text = _POEM_TEXT.replace("I sing the dawn", f"I sing dawn {ebook_id}")
+                (texts / f"{ebook_id}.txt").write_text(text, encoding="utf-8")
+            catalog.write_text(
+                "Text#,Type,Title,Language,Authors,Subjects,Bookshelves,LoCC\n" + "\n".join(rows) + "\n",
+                encoding="utf-8",
+            )
+
+            def run(name: str) -> tuple[dict, str]:
+                report = run_gutenberg_ingestion(
+                    output_dir=base / name,
+                    catalog_csv=catalog,
+                    texts_dir=texts,
+                    rate_limit_rps=0,
+                    manifest_path=manifest,
+                )
+                return report, (base / name / "poems.jsonl").read_text(encoding="utf-8")
+
+            first_report, first_poems = run("first")
+            second_report, second_poems = run("second")
+
+            changed = texts / "12.txt"
+            changed.write_text(_POEM_TEXT.replace("I sing the dawn", "I sing a new dawn"), encoding="utf-8")
+            stat = changed.stat()
+            os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third_report, third_poems = run("third")
+
+        self.assertEqual(first_report["candidates_extracted"], 4)
+        self.assertEqual(second_report["candidates_extracted"], 0)
+        self.assertEqual(second_report["candidates_reused"], 4)
+        self.assertEqual(first_poems, second_poems)
+        self.assertEqual(third_report["candidates_extracted"], 1)
+        self.assertEqual(third_report["canonical_poems"], 4)
+        self.assertIn("I sing a new dawn", third_poems)
+        self.assertNotIn("I sing dawn 12", third_poems)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,194 @@
+import json
+import queue
+import threading
+import unittest
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from daily_poetry_ingest.normalize import NORMALIZER_VERSION, normalize_record
+from daily_poetry_ingest.pipeline import (
+    _AuthorEnrichmentStage,
+    _batch_records,
+    _decode_poem,
+    _encode_poem,
+    _normalize_worker,
+    run_poetrydb_ingestion,
+)
+from daily_poetry_ingest.ratelimit import TokenBucket
+
+
+class _PoetryDBHandler(BaseHTTPRequestHandler):
+    payloads: dict[str, list[dict]] = {}
+
+    def log_message(self, *_args) -> None:
+        return
+
+    def do_GET(self) -> None:
+        path = urllib.parse.unquote(self.path)
+        if path == "/author":
+            payload = {"authors": sorted(_PoetryDBHandler.payloads)}
+        else:
+            payload = _PoetryDBHandler.payloads[path.split("/author/", 1)[1]]
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class PoetryDBPipelineTests(unittest.TestCase):
+    def test_batch_records_limits_count_and_bytes(self) -> None:
+        records = [{"title": "T", "author": "A", "lines": ["x" * 10]} for _ in range(5)]
+
+        by_count = _batch_records(records, max_records=2, max_bytes=0)
+        by_bytes = _batch_records(records, max_records=100, max_bytes=30)
+
+        self.assertEqual([len(batch) for batch in by_count], [2, 2, 1])
+        self.assertEqual([len(batch) for batch in by_bytes], [2, 2, 1])
+
+    def test_encode_decode_roundtrip(self) -> None:
+        poem = normalize_record({"title": "T", "author": "A", "lines": ["l1", "", "l3"]})
+        self.assertEqual(_decode_poem(_encode_poem(poem)), poem)
+
+    def test_normalize_worker_replies_once_per_batch(self) -> None:
+        raw_queue: queue.Queue = queue.Queue()
+        normalized_queue: queue.Queue = queue.Queue()
+        error_queue: queue.Queue = queue.Queue()
+        raw_queue.put(
+            (
+                "A",
+                [
+                    {"title": "T1", "author": "A", "lines": ["one"]},
+                    {"author": "A", "lines": ["two"]},
+                    {"title": "T3", "author": "A", "lines": ["three"]},
+                ],
+            )
+        )
+        raw_queue.put(None)
+
+        _normalize_worker(raw_queue, normalized_queue, error_queue)
+
+        batch = normalized_queue.get_nowait()
+        done = normalized_queue.get_nowait()
+        self.assertEqual(batch["kind"], "normalized_batch")
+        self.assertEqual(batch["author"], "A")
+        self.assertEqual([_decode_poem(item).title for item in batch["poems"]], ["T1", "T3"])
+        self.assertEqual([error["reason"] for error in batch["errors"]], ["missing_title"])
+        self.assertEqual(done["kind"], "normalize_worker_done")
+        self.assertTrue(error_queue.empty())
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_enrichment_stage_fills_gaps_and_keeps_only_canonical_authors(self, mock_enrich_authors) -> None:
+        def fake_enrich(authors, **_kwargs):
+            return [{"name": author, "image_url": None} for author in authors], [
+                {"kind": "author_image_error", "author": author, "reason": "x"} for author in authors if author == "B"
+            ]
+
+        mock_enrich_authors.side_effect = fake_enrich
+
+        stage = _AuthorEnrichmentStage(["B", "A ", "Unused"], timeout_seconds=1).start()
+        records, errors = stage.join(["A", "B", "Late"])
+
+        self.assertEqual([call.args[0] for call in mock_enrich_authors.call_args_list], [["A", "B", "Unused"], ["Late"]])
+        self.assertEqual([record["name"] for record in records], ["A", "B", "Late"])
+        self.assertEqual([error["author"] for error in errors], ["B"])
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_incremental_run_renormalizes_only_changed_authors(self, mock_enrich_authors) -> None:
+        mock_enrich_authors.return_value = ([], [])
+        _PoetryDBHandler.payloads = {
+            author: [
+                {"title": f"{author} {idx}", "author": author, "lines": [f"{author} line {idx}", "", "refrain"]}
+                for idx in range(3)
+            ]
+            + [{"title": "Shared", "author": author, "lines": ["the same poem"]}, {"author": author, "lines": ["x"]}]
+            for author in ("Ann", "Bea", "Cal")
+        }
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _PoetryDBHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        def run(output_dir: Path, manifest_path: Path | None) -> tuple[dict, str, str]:
+            report = run_poetrydb_ingestion(
+                output_dir=output_dir,
+                base_url=base_url,
+                fetch_workers=2,
+                normalize_workers=1,
+                rate_limit_rps=0,
+                manifest_path=manifest_path,
+            )
+            return (
+                report,
+                (output_dir / "poems.jsonl").read_text(encoding="utf-8"),
+                (output_dir / "duplicates.jsonl").read_text(encoding="utf-8"),
+            )
+
+        try:
+            with TemporaryDirectory() as tmp_dir:
+                base = Path(tmp_dir)
+                manifest = base / "manifest.json"
+                first = run(base / "out", manifest)
+                second = run(base / "out", manifest)
+
+                _PoetryDBHandler.payloads["Bea"][0]["lines"] = ["a revised first line", "", "refrain"]
+                third = run(base / "out", manifest)
+                with patch("daily_poetry_ingest.pipeline.NORMALIZER_VERSION", NORMALIZER_VERSION + 1):
+                    renormalized = run(base / "out", manifest)
+                full = run(base / "full", None)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(first[0]["authors_changed"], 3)
+        self.assertEqual(second[0]["authors_unchanged"], 3)
+        self.assertEqual(second[0]["authors_changed"], 0)
+        self.assertEqual(second[1:], first[1:])
+        self.assertEqual(len(second[0]["errors"]), 3)
+        self.assertEqual(third[0]["authors_changed"], 1)
+        self.assertIn("a revised first line", third[1])
+        self.assertEqual(third[1:], full[1:])
+        self.assertEqual(third[0]["duplicates"], 2)
+        self.assertEqual(renormalized[0]["authors_changed"], 3)
+        self.assertEqual(renormalized[1:], full[1:])
+
+    @patch("daily_poetry_ingest.pipeline.enrich_authors")
+    def test_enrichment_shares_the_run_wide_rate_limiter(self, mock_enrich_authors) -> None:
+        mock_enrich_authors.return_value = ([], [])
+        _PoetryDBHandler.payloads = {
+            "Ann": [
+                {"title": "One", "author": "Ann", "lines": ["first line"]},
+                {"title": "Two", "author": "Late", "lines": ["a poem credited elsewhere"]},
+            ]
+        }
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _PoetryDBHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        buckets: list[TokenBucket] = []
+
+        def make_bucket(*args, **kwargs) -> TokenBucket:
+            buckets.append(TokenBucket(*args, **kwargs))
+            return buckets[-1]
+
+        try:
+            with TemporaryDirectory() as tmp_dir, patch("daily_poetry_ingest.pipeline.TokenBucket", make_bucket):
+                run_poetrydb_ingestion(
+                    output_dir=Path(tmp_dir),
+                    base_url=f"http://127.0.0.1:{server.server_port}",
+                    fetch_workers=1,
+                    normalize_workers=1,
+                    rate_limit_rps=0,
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(len(buckets), 1)
+        self.assertEqual([call.args[0] for call in mock_enrich_authors.call_args_list], [["Ann"], ["Late"]])
+        for call in mock_enrich_authors.call_args_list:
+            self.assertIs(call.kwargs["limiter"], buckets[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
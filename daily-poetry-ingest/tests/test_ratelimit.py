@@ -0,0 +1,50 @@
+import threading
+import unittest
+
+from daily_poetry_ingest.ratelimit import TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self.lock:
+            self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_free_then_requests_are_spaced_at_rate(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_reservations_from_many_threads_share_one_budget(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(10.0, burst=1, clock=lambda: 0.0, sleep=clock.sleep)
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Clock is frozen, so the eight reservations queue up: 0 + 0.1 + ... + 0.7.
+        self.assertAlmostEqual(clock.now, sum(step / 10 for step in range(8)))
+
+    def test_non_positive_rate_disables_limiting(self) -> None:
+        bucket = TokenBucket(0, clock=lambda: 0.0, sleep=lambda _s: self.fail("should not sleep"))
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()